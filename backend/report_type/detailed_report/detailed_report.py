@@ -66,11 +66,20 @@ class DetailedReport:
 
     async def run(self) -> str:
         await self._initial_research()
-        subtopics = await self._get_all_subtopics()
-        report_introduction = await self.gpt_researcher.write_introduction()
-        _, report_body = await self._generate_subtopic_reports(subtopics)
-        self.gpt_researcher.visited_urls.update(self.global_urls)
-        report = await self._construct_detailed_report(report_introduction, report_body)
+
+        # The introduction only depends on the initial context: write it while
+        # subtopics are planned and researched. Subtopic sections are written
+        # after it, so that streamed output stays in report order, and the
+        # conclusion as soon as the body is complete.
+        introduction = asyncio.create_task(self.gpt_researcher.write_introduction())
+        try:
+            subtopics = await self._get_all_subtopics()
+            _, report_body = await self._generate_subtopic_reports(subtopics, introduction)
+            self.gpt_researcher.visited_urls.update(self.global_urls)
+            report = await self._construct_detailed_report(await introduction, report_body)
+        finally:
+            introduction.cancel()
+            await asyncio.gather(introduction, return_exceptions=True)
         return report
 
     async def _initial_research(self) -> None:
@@ -90,22 +99,73 @@ class DetailedReport:
 
         return all_subtopics
 
-    async def _generate_subtopic_reports(self, subtopics: List[Dict]) -> tuple:
+    async def _generate_subtopic_reports(
+        self, subtopics: List[Dict], introduction: Optional[asyncio.Future] = None
+    ) -> tuple:
         subtopic_reports = []
         subtopics_report_body = ""
 
-        for subtopic in subtopics:
-            result = await self._get_subtopic_report(subtopic)
-            if result["report"]:
-                subtopic_reports.append(result)
-                subtopics_report_body += f"\n\n\n{result['report']}"
+        concurrency = max(1, self.gpt_researcher.cfg.subtopic_concurrency)
+        if concurrency == 1 or len(subtopics) <= 1:
+            for subtopic in subtopics:
+                subtopic_assistant = await self._research_subtopic(subtopic, visited_urls=self.global_urls)
+                if introduction is not None:
+                    await introduction
+                result = await self._write_subtopic_report(subtopic, subtopic_assistant)
+                if result["report"]:
+                    subtopic_reports.append(result)
+                    subtopics_report_body += f"\n\n\n{result['report']}"
+            return subtopic_reports, subtopics_report_body
+
+        # Research subtopics concurrently, but write them one at a time in the
+        # original order, since each report depends on the headers and sections
+        # written before it. All subtopics start from the initial research, not
+        # from whatever has been written by the time they get a slot.
+        semaphore = asyncio.Semaphore(concurrency)
+        initial_context = list(set(self.global_context))
+        initial_urls = set(self.global_urls)
+
+        async def research(subtopic: Dict) -> GPTResearcher:
+            async with semaphore:
+                return await self._research_subtopic(subtopic, visited_urls=set(initial_urls), context=initial_context)
+
+        research_tasks = [asyncio.create_task(research(subtopic)) for subtopic in subtopics]
+
+        async def wait_for(future: asyncio.Future) -> Any:
+            # Fail as soon as any research fails, not once the writer gets to it
+            pending = {future, *research_tasks}
+            while not future.done():
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+            return await future
+
+        try:
+            for subtopic, task in zip(subtopics, research_tasks):
+                subtopic_assistant = await wait_for(task)
+                if introduction is not None:
+                    await wait_for(introduction)
+                result = await self._write_subtopic_report(subtopic, subtopic_assistant)
+                if result["report"]:
+                    subtopic_reports.append(result)
+                    subtopics_report_body += f"\n\n\n{result['report']}"
+        finally:
+            for task in research_tasks:
+                task.cancel()
+            await asyncio.gather(*research_tasks, return_exceptions=True)
 
         return subtopic_reports, subtopics_report_body
 
     async def _get_subtopic_report(self, subtopic: Dict) -> Dict[str, str]:
-        current_subtopic_task = subtopic.get("task")
+        subtopic_assistant = await self._research_subtopic(subtopic, visited_urls=self.global_urls)
+        return await self._write_subtopic_report(subtopic, subtopic_assistant)
+
+    async def _research_subtopic(
+        self, subtopic: Dict, visited_urls: Set[str], context: Optional[List[str]] = None
+    ) -> GPTResearcher:
         subtopic_assistant = GPTResearcher(
-            query=current_subtopic_task,
+            query=subtopic.get("task"),
             query_domains=self.query_domains,
             report_type="subtopic_report",
             report_source=self.report_source,
@@ -113,7 +173,7 @@ class DetailedReport:
             headers=self.headers,
             parent_query=self.query,
             subtopics=self.subtopics,
-            visited_urls=self.global_urls,
+            visited_urls=visited_urls,
             agent=self.gpt_researcher.agent,
             role=self.gpt_researcher.role,
             tone=self.tone,
@@ -121,9 +181,12 @@ class DetailedReport:
             source_urls=self.source_urls
         )
 
-        subtopic_assistant.context = list(set(self.global_context))
+        subtopic_assistant.context = list(set(self.global_context if context is None else context))
         await subtopic_assistant.conduct_research()
+        return subtopic_assistant
 
+    async def _write_subtopic_report(self, subtopic: Dict, subtopic_assistant: GPTResearcher) -> Dict[str, str]:
+        current_subtopic_task = subtopic.get("task")
         draft_section_titles = await subtopic_assistant.get_draft_section_titles(current_subtopic_task)
 
         if not isinstance(draft_section_titles, str):
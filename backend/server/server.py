@@ -21,6 +21,7 @@ from backend.server.websocket_manager import run_agent
 from backend.utils import write_md_to_word, write_md_to_pdf
 from gpt_researcher.utils.logging_config import setup_research_logging
 from gpt_researcher.utils.enum import Tone
+from gpt_researcher.utils.http import close_http_sessions
 from backend.chat.chat import ChatAgentWithMemory
 
 import logging
@@ -105,6 +106,11 @@ def startup_event():
     # os.makedirs(DOC_PATH, exist_ok=True)  # Commented out to avoid creating the folder if not needed
     
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_http_sessions()
+
+
 # Routes
 
 
@@ -18,6 +18,7 @@ from dotenv import load_dotenv
 
 from gpt_researcher import GPTResearcher
 from gpt_researcher.utils.enum import ReportType, Tone
+from gpt_researcher.utils.http import close_http_sessions
 from backend.report_type import DetailedReport
 
 # =============================================================================
@@ -161,7 +162,14 @@ async def main(args):
 
     print(f"Report written to '{artifact_filepath}'")
 
+async def run(args):
+    try:
+        await main(args)
+    finally:
+        # Close the HTTP connections shared by scrapers before the loop closes
+        await close_http_sessions()
+
 if __name__ == "__main__":
     load_dotenv()
     args = cli.parse_args()
-    asyncio.run(main(args))
+    asyncio.run(run(args))
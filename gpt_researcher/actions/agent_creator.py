@@ -2,6 +2,7 @@ import json
 import re
 import json_repair
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
 from ..prompts import PromptFamily
 
 async def choose_agent(
@@ -41,6 +42,7 @@ async def choose_agent(
             llm_provider=cfg.smart_llm_provider,
             llm_kwargs=cfg.llm_kwargs,
             cost_callback=cost_callback,
+            cache=get_llm_cache(cfg, "choose_agent"),
             **kwargs
         )
 
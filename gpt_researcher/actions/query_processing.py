@@ -2,7 +2,9 @@ import json_repair
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
 from ..prompts import PromptFamily
+from ..retrievers.cache import cached_search
 from typing import Any, List, Dict
 from ..config import Config
 import logging
@@ -17,7 +19,7 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
         query: The search query
         retriever: The retriever instance
         query_domains: Optional list of domains to search
-        researcher: The researcher instance (needed for MCP retrievers)
+        researcher: The researcher instance (needed for MCP retrievers and the search cache)
 
     Returns:
         A list of search results
@@ -29,10 +31,10 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
             query_domains=query_domains,
             researcher=researcher  # Pass researcher instance for MCP retrievers
         )
-    else:
-        search_retriever = retriever(query, query_domains=query_domains)
-    
-    return search_retriever.search()
+        return search_retriever.search()
+
+    cache = getattr(researcher, "search_cache", None)
+    return await cached_search(retriever, query, query_domains=query_domains, cache=cache)
 
 async def generate_sub_queries(
     query: str,
@@ -68,6 +70,8 @@ async def generate_sub_queries(
         context=context,
     )
 
+    cache = get_llm_cache(cfg, "sub_queries")
+
     try:
         response = await create_chat_completion(
             model=cfg.strategic_llm_model,
@@ -77,6 +81,7 @@ async def generate_sub_queries(
             llm_kwargs=cfg.llm_kwargs,
             reasoning_effort=ReasoningEfforts.Medium.value,
             cost_callback=cost_callback,
+            cache=cache,
             **kwargs
         )
     except Exception as e:
@@ -90,6 +95,7 @@ async def generate_sub_queries(
                 llm_provider=cfg.strategic_llm_provider,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
+                cache=cache,
                 **kwargs
             )
             logger.warning(f"Retrying with max_tokens={cfg.strategic_token_limit} successful.")
@@ -104,6 +110,7 @@ async def generate_sub_queries(
                 llm_provider=cfg.smart_llm_provider,
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
+                cache=cache,
                 **kwargs
             )
 
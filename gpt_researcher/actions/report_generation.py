@@ -1,7 +1,9 @@
 import asyncio
 from typing import List, Dict, Any
 from ..config.config import Config
+from ..context.budget import context_token_budget, fit_context_to_budget
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
 from ..utils.logger import get_formatted_logger
 from ..prompts import PromptFamily, get_prompt_by_report_type
 from ..utils.enum import Tone
@@ -198,6 +200,7 @@ async def generate_draft_section_titles(
             max_tokens=config.smart_token_limit,
             llm_kwargs=config.llm_kwargs,
             cost_callback=cost_callback,
+            cache=get_llm_cache(config, "draft_section_titles"),
             **kwargs
         )
         return section_titles.split("\n")
@@ -247,12 +250,21 @@ async def generate_report(
     generate_prompt = get_prompt_by_report_type(report_type, prompt_family)
     report = ""
 
-    if report_type == "subtopic_report":
-        content = f"{generate_prompt(query, existing_headers, relevant_written_contents, main_topic, context, report_format=cfg.report_format, tone=tone, total_words=cfg.total_words, language=cfg.language)}"
-    elif custom_prompt:
-        content = f"{custom_prompt}\n\nContext: {context}"
-    else:
-        content = f"{generate_prompt(query, context, report_source, report_format=cfg.report_format, tone=tone, total_words=cfg.total_words, language=cfg.language)}"
+    def build_content(context):
+        if report_type == "subtopic_report":
+            return f"{generate_prompt(query, existing_headers, relevant_written_contents, main_topic, context, report_format=cfg.report_format, tone=tone, total_words=cfg.total_words, language=cfg.language)}"
+        elif custom_prompt:
+            return f"{custom_prompt}\n\nContext: {context}"
+        return f"{generate_prompt(query, context, report_source, report_format=cfg.report_format, tone=tone, total_words=cfg.total_words, language=cfg.language)}"
+
+    def fit_context(context):
+        # Keep the most relevant context that fits next to the prompt and the report itself
+        budget = context_token_budget(cfg, prompt=f"{agent_role_prompt}\n{build_content('')}")
+        return fit_context_to_budget(context, cfg.smart_llm_model, budget)[0]
+
+    # Tokenizing a large context takes a while, keep it off the event loop
+    context = await asyncio.to_thread(fit_context, context)
+    content = build_content(context)
     try:
         report = await create_chat_completion(
             model=cfg.smart_llm_model,
@@ -1,14 +1,42 @@
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 from colorama import Fore, Style
 
 from gpt_researcher.utils.workers import WorkerPool
 from ..scraper import Scraper
+from ..scraper.cache import PageCache, get_page_cache
 from ..config.config import Config
 from ..utils.logger import get_formatted_logger
 
 logger = get_formatted_logger()
 
 
+def _get_scraper(urls, user_agent, cfg: Config, worker_pool: WorkerPool) -> Scraper:
+    return Scraper(
+        urls,
+        user_agent,
+        cfg.scraper,
+        worker_pool=worker_pool,
+        page_cache=_get_page_cache(cfg),
+        deadline=cfg.scrape_deadline,
+        quorum_ratio=cfg.scrape_quorum_ratio,
+        quorum_pages=cfg.scrape_quorum_pages,
+        pdf_max_bytes=cfg.pdf_max_mb * 1024 * 1024,
+        pdf_max_chars=cfg.pdf_max_chars,
+    )
+
+
+def _get_page_cache(cfg: Config) -> PageCache | None:
+    if not cfg:
+        return None
+    return get_page_cache(
+        cfg.scrape_cache_ttl,
+        cfg.scrape_cache_domain_ttls,
+        cfg.scrape_cache_path,
+        cfg.scrape_cache_max_mb,
+    )
+
+
 async def scrape_urls(
     urls, cfg: Config, worker_pool: WorkerPool
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -31,7 +59,7 @@ async def scrape_urls(
     )
 
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        scraper = _get_scraper(urls, user_agent, cfg, worker_pool)
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
@@ -42,6 +70,28 @@ async def scrape_urls(
     return scraped_data, images
 
 
+async def stream_urls(
+    urls, cfg: Config, worker_pool: WorkerPool
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Scrapes the urls, yielding each page as soon as it has been scraped
+    Args:
+        urls: List of urls
+        cfg: Config
+
+    Yields:
+        dict[str, Any]: scraped content of a single page
+
+    """
+    try:
+        scraper = _get_scraper(urls, cfg.user_agent, cfg, worker_pool)
+        async with aclosing(scraper.stream()) as pages:
+            async for page in pages:
+                yield page
+    except Exception as e:
+        print(f"{Fore.RED}Error in stream_urls: {e}{Style.RESET_ALL}")
+
+
 async def filter_urls(urls: list[str], config: Config) -> list[str]:
     """
     Filter URLs based on configuration settings.
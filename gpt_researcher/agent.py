@@ -1,11 +1,13 @@
 from typing import Any, Optional
+import copy
 import json
 import os
 
 from .config import Config
-from .memory import Memory
+from .memory import Memory, get_embedding_cache
 from .utils.enum import ReportSource, ReportType, Tone
 from .llm_provider import GenericLLMProvider
+from .retrievers.cache import get_search_cache
 from .prompts import get_prompt_family
 from .vector_store import VectorStoreWrapper
 
@@ -59,6 +61,7 @@ class GPTResearcher:
         mcp_configs: list[dict] | None = None,
         mcp_max_iterations: int | None = None,
         mcp_strategy: str | None = None,
+        parent: Optional["GPTResearcher"] = None,
         **kwargs
     ):
         """
@@ -113,12 +116,23 @@ class GPTResearcher:
                 - "fast" (default): Run MCP once with original query for best performance
                 - "deep": Run MCP for all sub-queries for maximum thoroughness  
                 - "disabled": Skip MCP entirely, use only web retrievers
+            parent (GPTResearcher, optional): Researcher this one is a sub-task of. Its
+                configuration (as a shallow copy), retrievers, embeddings and scraper workers
+                are reused instead of being created again, so `config_path` cannot be given
+                as well. MCP servers are only used when `mcp_configs` is given. See `create_child`.
         """
         self.kwargs = kwargs
         self.query = query
         self.report_type = report_type
-        self.cfg = Config(config_path)
-        self.cfg.set_verbose(verbose)
+        if parent is not None:
+            if config_path is not None:
+                raise ValueError("config_path cannot be used with parent, whose configuration is shared")
+            # Copied so that settings changed for this researcher, e.g. its MCP retriever,
+            # do not leak into the parent and its other children
+            self.cfg = copy.copy(parent.cfg)
+        else:
+            self.cfg = Config(config_path)
+            self.cfg.set_verbose(verbose)
         self.report_source = report_source if report_source else getattr(self.cfg, 'report_source', None)
         self.report_format = report_format
         self.max_subtopics = max_subtopics
@@ -130,7 +144,7 @@ class GPTResearcher:
         self.research_sources = []  # The list of scraped sources including title, content and images
         self.research_images = []  # The list of selected research images
         self.documents = documents
-        self.vector_store = VectorStoreWrapper(vector_store) if vector_store else None
+        self.vector_store = VectorStoreWrapper(vector_store, index_type=self.cfg.vector_index) if vector_store else None
         self.vector_store_filter = vector_store_filter
         self.websocket = websocket
         self.agent = agent
@@ -142,18 +156,38 @@ class GPTResearcher:
         self.context = context or []
         self.headers = headers or {}
         self.research_costs = 0.0
+        self.llm_cache_hits = 0
+        self.llm_cache_savings = 0.0
         self.log_handler = log_handler
-        self.prompt_family = get_prompt_family(prompt_family or self.cfg.prompt_family, self.cfg)
-        
+        if parent is not None and prompt_family is None:
+            self.prompt_family = parent.prompt_family
+        else:
+            self.prompt_family = get_prompt_family(prompt_family or self.cfg.prompt_family, self.cfg)
+
         # Process MCP configurations if provided
+        if parent is not None and not mcp_configs:
+            # The shared configuration and retrievers may include the parent's MCP retriever
+            mcp_strategy = "disabled"
         self.mcp_configs = mcp_configs
         if mcp_configs:
             self._process_mcp_configs(mcp_configs)
         
-        self.retrievers = get_retrievers(self.headers, self.cfg)
-        self.memory = Memory(
-            self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
-        )
+        if parent is not None and self.headers == parent.headers and (not mcp_configs or parent.mcp_configs):
+            self.retrievers = parent.retrievers
+        else:
+            self.retrievers = get_retrievers(self.headers, self.cfg)
+        self.search_cache = get_search_cache(self.cfg.search_cache_ttl, self.cfg.search_cache_path)
+        if parent is not None:
+            self.memory = parent.memory
+        else:
+            self.memory = Memory(
+                self.cfg.embedding_provider,
+                self.cfg.embedding_model,
+                cache=get_embedding_cache(self.cfg.embedding_cache_size, self.cfg.embedding_cache_path),
+                batch_size=self.cfg.embedding_batch_size,
+                max_concurrency=self.cfg.embedding_concurrency,
+                **self.cfg.embedding_kwargs
+            )
         
         # Set default encoding to utf-8
         self.encoding = kwargs.get('encoding', 'utf-8')
@@ -162,7 +196,9 @@ class GPTResearcher:
         self.research_conductor: ResearchConductor = ResearchConductor(self)
         self.report_generator: ReportGenerator = ReportGenerator(self)
         self.context_manager: ContextManager = ContextManager(self)
-        self.scraper_manager: BrowserManager = BrowserManager(self)
+        self.scraper_manager: BrowserManager = BrowserManager(
+            self, worker_pool=parent.scraper_manager.worker_pool if parent is not None else None
+        )
         self.source_curator: SourceCurator = SourceCurator(self)
         self.deep_researcher: Optional[DeepResearchSkill] = None
         if report_type == ReportType.DeepResearch.value:
@@ -286,6 +322,34 @@ class GPTResearcher:
                 import logging
                 logging.getLogger('research').error(f"Error in _log_event: {e}", exc_info=True)
 
+    def create_child(self, query: str, inherit_mcp: bool = False, **kwargs) -> "GPTResearcher":
+        """
+        Create a researcher for a sub-task of this research, such as a deep
+        research node. It shares this researcher's configuration, retrievers,
+        embeddings, caches and scraper workers, so it only does its own search,
+        scrape and compression work. Agent, role, tone, headers and websocket
+        are inherited unless given.
+
+        Args:
+            query (str): The query of the sub-task.
+            inherit_mcp (bool): Also query this researcher's MCP servers, with its
+                MCP strategy. Off by default, as every child would run its own MCP research.
+            **kwargs: Any other `GPTResearcher` argument, except `config_path`.
+
+        Returns:
+            GPTResearcher: The child researcher.
+        """
+        if inherit_mcp and self.mcp_configs:
+            kwargs.setdefault("mcp_configs", self.mcp_configs)
+            kwargs.setdefault("mcp_strategy", self.mcp_strategy)
+        kwargs.setdefault("agent", self.agent)
+        kwargs.setdefault("role", self.role)
+        kwargs.setdefault("tone", self.tone)
+        kwargs.setdefault("headers", self.headers)
+        kwargs.setdefault("websocket", self.websocket)
+        kwargs.setdefault("verbose", self.verbose)
+        return GPTResearcher(query=query, parent=self, **kwargs)
+
     async def conduct_research(self, on_progress=None):
         await self._log_event("research", step="start", details={
             "query": self.query,
@@ -397,7 +461,7 @@ class GPTResearcher:
         return intro
 
     async def quick_search(self, query: str, query_domains: list[str] = None) -> list[Any]:
-        return await get_search_results(query, self.retrievers[0], query_domains=query_domains)
+        return await get_search_results(query, self.retrievers[0], query_domains=query_domains, researcher=self)
 
     async def get_subtopics(self):
         return await self.report_generator.get_subtopics()
@@ -456,12 +520,23 @@ class GPTResearcher:
     def set_verbose(self, verbose: bool):
         self.verbose = verbose
 
-    def add_costs(self, cost: float) -> None:
+    def add_costs(self, cost: float, cache_hit: bool = False) -> None:
+        """
+        Record the cost of an API call. For LLM responses served from the
+        response cache (`cache_hit=True`), `cost` is the estimated cost that was
+        avoided and is tracked separately from the research costs.
+        """
         if not isinstance(cost, (float, int)):
             raise ValueError("Cost must be an integer or float")
-        self.research_costs += cost
+        if cache_hit:
+            self.llm_cache_hits += 1
+            self.llm_cache_savings += cost
+        else:
+            self.research_costs += cost
         if self.log_handler:
             self._log_event("research", step="cost_update", details={
-                "cost": cost,
-                "total_cost": self.research_costs
+                "cost": 0.0 if cache_hit else cost,
+                "total_cost": self.research_costs,
+                "cache_hit": cache_hit,
+                "cache_savings": self.llm_cache_savings,
             })
@@ -6,17 +6,23 @@ class BaseConfig(TypedDict):
     RETRIEVER: str
     EMBEDDING: str
     SIMILARITY_THRESHOLD: float
+    VECTOR_INDEX: str
     FAST_LLM: str
     SMART_LLM: str
     STRATEGIC_LLM: str
     FAST_TOKEN_LIMIT: int
     SMART_TOKEN_LIMIT: int
+    CONTEXT_WINDOW_TOKENS: int
     STRATEGIC_TOKEN_LIMIT: int
     BROWSE_CHUNK_MAX_LENGTH: int
     SUMMARY_TOKEN_LIMIT: int
     TEMPERATURE: float
     USER_AGENT: str
     MAX_SEARCH_RESULTS_PER_QUERY: int
+    SEARCH_CACHE_TTL: int
+    SEARCH_CACHE_PATH: Union[str, None]
+    RETRIEVER_TIMEOUT: float
+    RETRIEVER_FIRST_K: int
     MEMORY_BACKEND: str
     TOTAL_WORDS: int
     REPORT_FORMAT: str
@@ -26,12 +32,37 @@ class BaseConfig(TypedDict):
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
+    SCRAPER_MAX_PER_HOST: int
+    SCRAPER_HOST_DELAY: float
+    SCRAPER_PARSE_PROCESSES: int
+    PDF_MAX_MB: int
+    PDF_MAX_CHARS: int
+    SCRAPE_STREAMING: bool
+    SCRAPE_DEADLINE: float
+    SCRAPE_QUORUM_RATIO: float
+    SCRAPE_QUORUM_PAGES: int
+    SCRAPE_CACHE_TTL: int
+    SCRAPE_CACHE_DOMAIN_TTLS: dict
+    SCRAPE_CACHE_PATH: Union[str, None]
+    SCRAPE_CACHE_MAX_MB: int
+    STREAMING_TARGET_CHUNKS: int
     MAX_SUBTOPICS: int
+    SUBTOPIC_CONCURRENCY: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
+    DOC_CACHE_PATH: Union[str, None]
+    DOC_PARSE_PROCESSES: int
+    LOCAL_INDEX_PATH: Union[str, None]
     PROMPT_FAMILY: str
     LLM_KWARGS: dict
     EMBEDDING_KWARGS: dict
+    EMBEDDING_CACHE_SIZE: int
+    EMBEDDING_CACHE_PATH: Union[str, None]
+    EMBEDDING_BATCH_SIZE: int
+    EMBEDDING_CONCURRENCY: int
+    LLM_CACHE_TTL: int
+    LLM_CACHE_CALLS: List[str]
+    LLM_CACHE_PATH: Union[str, None]
     DEEP_RESEARCH_CONCURRENCY: int
     DEEP_RESEARCH_DEPTH: int
     DEEP_RESEARCH_BREADTH: int
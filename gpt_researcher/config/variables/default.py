@@ -4,11 +4,13 @@ DEFAULT_CONFIG: BaseConfig = {
     "RETRIEVER": "tavily",
     "EMBEDDING": "openai:text-embedding-3-small",
     "SIMILARITY_THRESHOLD": 0.42,
+    "VECTOR_INDEX": "flat",  # Chunk search: flat (exact), ivf or hnsw (approximate, for large context pools)
     "FAST_LLM": "openai:gpt-5-mini",
     "SMART_LLM": "openai:gpt-5",  # Has support for long responses (2k+ words).
     "STRATEGIC_LLM": "openai:o4-mini",  # Can be used with o1 or o3, please note it will make tasks slower.
     "FAST_TOKEN_LIMIT": 3000,
     "SMART_TOKEN_LIMIT": 6000,
+    "CONTEXT_WINDOW_TOKENS": 0,  # Context window of the smart LLM (0 infers it from the model name)
     "STRATEGIC_TOKEN_LIMIT": 4000,
     "BROWSE_CHUNK_MAX_LENGTH": 8192,
     "CURATE_SOURCES": False,
@@ -16,6 +18,10 @@ DEFAULT_CONFIG: BaseConfig = {
     "TEMPERATURE": 0.4,
     "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0",
     "MAX_SEARCH_RESULTS_PER_QUERY": 5,
+    "SEARCH_CACHE_TTL": 0,  # Seconds to reuse identical search results, e.g. 3600 (0 disables)
+    "SEARCH_CACHE_PATH": None,  # Optional SQLite file to share search results across processes
+    "RETRIEVER_TIMEOUT": 0,  # Seconds to wait for each retriever before skipping it, e.g. 15 (0 waits indefinitely)
+    "RETRIEVER_FIRST_K": 0,  # Stop waiting for slower retrievers once this many unique results arrived (0 waits for all)
     "MEMORY_BACKEND": "local",
     "TOTAL_WORDS": 1200,
     "REPORT_FORMAT": "APA",
@@ -23,13 +29,38 @@ DEFAULT_CONFIG: BaseConfig = {
     "AGENT_ROLE": None,
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
+    "SCRAPER_MAX_PER_HOST": 4,  # Concurrent requests per site, lowered automatically when rate limited
+    "SCRAPER_HOST_DELAY": 0.0,  # Minimum seconds between requests to the same site
+    "SCRAPER_PARSE_PROCESSES": -1,  # Processes parsing scraped HTML, -1 to parse in threads, 0 for one per CPU core
+    "PDF_MAX_MB": 20,  # PDFs larger than this are skipped instead of downloaded (0 for no limit)
+    "PDF_MAX_CHARS": 50000,  # Characters of text extracted from each PDF, later pages are not parsed (0 for no limit)
+    "SCRAPE_STREAMING": False,  # Compress each page as soon as it is scraped
+    "SCRAPE_DEADLINE": 0,  # Seconds after which slow scrapes of a batch are cancelled (0 waits for all)
+    "SCRAPE_QUORUM_RATIO": 0,  # Stop a batch once this fraction of its URLs finished, e.g. 0.8 (0 disables)
+    "SCRAPE_QUORUM_PAGES": 0,  # Stop a batch once this many pages were scraped successfully (0 disables)
+    "SCRAPE_CACHE_TTL": 0,  # Seconds before a cached page is revalidated, e.g. 3600 (0 disables the page cache)
+    "SCRAPE_CACHE_DOMAIN_TTLS": {},  # Per-domain overrides, e.g. {"wikipedia.org": 604800}
+    "SCRAPE_CACHE_PATH": None,  # Optional SQLite file to persist scraped pages across runs
+    "SCRAPE_CACHE_MAX_MB": 512,  # Size limit of the on-disk page cache
+    "STREAMING_TARGET_CHUNKS": 0,  # Stop scraping a sub-query once this many relevant chunks are found (0 disables)
     "MAX_SUBTOPICS": 3,
+    "SUBTOPIC_CONCURRENCY": 3,  # Subtopics researched in parallel in detailed reports (1 runs them in sequence)
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
     "DOC_PATH": "./my-docs",
+    "DOC_CACHE_PATH": None,  # Optional SQLite file keeping parsed local documents across runs
+    "DOC_PARSE_PROCESSES": -1,  # Processes parsing local documents, -1 to parse in threads, 0 for one per CPU core
+    "LOCAL_INDEX_PATH": None,  # Optional directory of a persistent vector index of the local documents
     "PROMPT_FAMILY": "default",
     "LLM_KWARGS": {},
     "EMBEDDING_KWARGS": {},
+    "EMBEDDING_CACHE_SIZE": 10000,  # Max embedding vectors kept in memory (0 disables)
+    "EMBEDDING_CACHE_PATH": None,  # Optional SQLite file to persist embeddings across runs
+    "EMBEDDING_BATCH_SIZE": 0,  # Texts per embedding request (0 uses the provider default)
+    "EMBEDDING_CONCURRENCY": 4,  # Max concurrent embedding requests per process
+    "LLM_CACHE_TTL": 0,  # Seconds to reuse responses of deterministic planning prompts (0 disables)
+    "LLM_CACHE_CALLS": ["choose_agent", "sub_queries", "subtopics", "draft_section_titles", "curate_sources"],
+    "LLM_CACHE_PATH": None,  # Optional SQLite file to share cached LLM responses across processes
     "VERBOSE": False,
     # Deep research specific settings
     "DEEP_RESEARCH_BREADTH": 3,
@@ -1,4 +1,3 @@
 from .compression import ContextCompressor
-from .retriever import SearchAPIRetriever
 
-__all__ = ['ContextCompressor', 'SearchAPIRetriever']
+__all__ = ['ContextCompressor']
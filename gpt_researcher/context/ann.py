@@ -0,0 +1,186 @@
+"""
+Approximate nearest neighbor indexes over normalized embedding matrices.
+
+`ChunkIndex` keeps its chunk vectors in a single float32 matrix; the indexes
+here only hold the structure needed to find good candidates in it quickly:
+
+- `flat`: exact search, one matrix multiply per batch of queries.
+- `ivf`: inverted file in pure NumPy. Vectors are clustered with spherical
+  k-means and a query is only scored against its closest clusters.
+- `hnsw`: hierarchical navigable small world graph from `hnswlib`, when it is
+  installed (falls back to `ivf` otherwise).
+
+Indexes are synced with the matrix through `update(matrix)`, which indexes the
+rows added since the last call, and searched with `search(matrix, queries, k)`,
+which returns candidate row indices per query, best first.
+"""
+import logging
+import math
+from typing import List
+
+import numpy as np
+
+from .similarity import cosine_similarity, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_TYPES = ("flat", "ivf", "hnsw")
+
+# Below this many vectors an exact search is about as fast and always exact
+MIN_ANN_SIZE = 10000
+
+
+class FlatIndex:
+    """Exact search."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def update(self, matrix: np.ndarray) -> None:
+        self.count = len(matrix)
+
+    def search(self, matrix: np.ndarray, query_vectors: np.ndarray, k: int) -> List[np.ndarray]:
+        scores = cosine_similarity(query_vectors, matrix)
+        return [top_k_indices(row, k) for row in scores]
+
+
+class IVFIndex:
+    """
+    Inverted file index. Trained once enough vectors are available and again
+    when the matrix has grown `RETRAIN_GROWTH` times since; until then it
+    searches exhaustively.
+    """
+
+    MIN_TRAIN_SIZE = 1024
+    RETRAIN_GROWTH = 4
+    KMEANS_ITERATIONS = 10
+    SAMPLE_PER_LIST = 64
+
+    def __init__(self, nlist: int | None = None, nprobe: int | None = None, seed: int = 0):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.rng = np.random.default_rng(seed)
+        self.centroids: np.ndarray | None = None
+        self.lists: List[np.ndarray] = []
+        self.count = 0
+        self.trained_size = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _train(self, matrix: np.ndarray) -> None:
+        n = len(matrix)
+        nlist = self.nlist or max(1, int(math.sqrt(n)))
+        sample_size = min(n, nlist * self.SAMPLE_PER_LIST)
+        sample = np.asarray(matrix[np.sort(self.rng.choice(n, sample_size, replace=False))])
+
+        centroids = sample[self.rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(self.KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            clusters, starts = np.unique(labels[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[clusters] = np.add.reduceat(sample[order], starts, axis=0)
+            empty = np.ones(nlist, dtype=bool)
+            empty[clusters] = False
+            # Reseed empty clusters with random vectors of the sample
+            sums[empty] = sample[self.rng.choice(sample_size, int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        self.centroids = centroids
+        self.lists = [np.empty(0, dtype=np.int64) for _ in range(nlist)]
+        self.count = 0
+        self.trained_size = n
+
+    def update(self, matrix: np.ndarray) -> None:
+        n = len(matrix)
+        if n < self.MIN_TRAIN_SIZE:
+            return
+        if self.centroids is None or n >= self.trained_size * self.RETRAIN_GROWTH:
+            self._train(matrix)
+        if n <= self.count:
+            return
+
+        rows = np.arange(self.count, n)
+        for start in range(0, len(rows), 8192):
+            batch = rows[start:start + 8192]
+            labels = np.argmax(np.asarray(matrix[batch]) @ self.centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            clusters, starts = np.unique(labels[order], return_index=True)
+            for cluster, members in zip(clusters, np.split(batch[order], starts[1:])):
+                self.lists[cluster] = np.concatenate([self.lists[cluster], members])
+        self.count = n
+
+    def search(self, matrix: np.ndarray, query_vectors: np.ndarray, k: int) -> List[np.ndarray]:
+        if self.centroids is None:
+            return FlatIndex().search(matrix, query_vectors, k)
+
+        nprobe = min(len(self.centroids), self.nprobe or max(8, len(self.centroids) // 16))
+        centroid_scores = query_vectors @ self.centroids.T
+        results = []
+        for query_vector, scores in zip(query_vectors, centroid_scores):
+            probe = np.argpartition(scores, -nprobe)[-nprobe:]
+            candidates = np.concatenate([self.lists[cluster] for cluster in probe])
+            # Rows added after the last update are not in any list yet
+            candidates = np.concatenate([candidates, np.arange(self.count, len(matrix))])
+            candidate_scores = np.asarray(matrix[candidates]) @ query_vector
+            results.append(candidates[top_k_indices(candidate_scores, k)])
+        return results
+
+
+class HNSWIndex:
+    """Graph index from `hnswlib`, using inner product on normalized vectors."""
+
+    def __init__(self, m: int = 16, ef_construction: int = 100, ef_search: int = 64):
+        import hnswlib
+
+        self.hnswlib = hnswlib
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.index = None
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def update(self, matrix: np.ndarray) -> None:
+        n = len(matrix)
+        if n <= self.count:
+            return
+        if self.index is None:
+            self.index = self.hnswlib.Index(space="ip", dim=matrix.shape[1])
+            self.index.init_index(max_elements=max(1024, 2 * n), ef_construction=self.ef_construction, M=self.m)
+        elif n > self.index.get_max_elements():
+            self.index.resize_index(2 * n)
+        self.index.add_items(np.asarray(matrix[self.count:n]), np.arange(self.count, n))
+        self.count = n
+
+    def search(self, matrix: np.ndarray, query_vectors: np.ndarray, k: int) -> List[np.ndarray]:
+        if self.index is None:
+            return FlatIndex().search(matrix, query_vectors, k)
+        k = min(k, self.count)
+        self.index.set_ef(max(self.ef_search, k))
+        labels, _ = self.index.knn_query(query_vectors, k=k)
+        return [row.astype(np.int64) for row in labels]
+
+
+def create_vector_index(index_type: str = "flat"):
+    """Create an index of the given type (`flat`, `ivf` or `hnsw`)."""
+    index_type = (index_type or "flat").lower()
+    if index_type == "hnsw":
+        try:
+            return HNSWIndex()
+        except ImportError:
+            logger.warning("hnswlib is not installed (`pip install hnswlib`), using the ivf index instead")
+            return IVFIndex()
+    if index_type == "ivf":
+        return IVFIndex()
+    if index_type != "flat":
+        logger.warning(f"Unknown vector index '{index_type}', expected one of {VECTOR_INDEX_TYPES}; using flat")
+    return FlatIndex()
@@ -0,0 +1,141 @@
+"""
+Token budgeting for research context.
+
+The context handed to the report LLM is packed into what is left of the
+model's context window after the prompt and the requested output, keeping the
+most relevant blocks and reporting what had to be dropped.
+"""
+import logging
+import re
+from typing import Any, Dict, List, Sequence
+
+from ..utils.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Context windows by model name prefix, the longest matching prefix wins
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-5": 400000,
+    "gpt-4.1": 1047576,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "o1": 200000,
+    "o3": 200000,
+    "o4-mini": 200000,
+    "claude": 200000,
+    "gemini": 1048576,
+    "deepseek": 64000,
+    "mistral-large": 128000,
+}
+DEFAULT_CONTEXT_WINDOW = 128000
+# Headroom for message framing and tokenizer differences between providers
+SAFETY_MARGIN = 0.05
+
+_SOURCE_BLOCK = re.compile(r"(?m)^(?=Source: )")
+
+
+def get_context_window(model: str | None, override: int = 0) -> int:
+    """Context window of `model` in tokens, or `override` when it is set."""
+    if override:
+        return override
+    name = (model or "").lower().rsplit("/", 1)[-1]
+    matches = [prefix for prefix in MODEL_CONTEXT_WINDOWS if name.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_WINDOW
+    return MODEL_CONTEXT_WINDOWS[max(matches, key=len)]
+
+
+def context_token_budget(cfg, prompt: str = "", output_tokens: int | None = None, model: str | None = None) -> int:
+    """
+    Tokens available for context in a call to `model` (the smart LLM by
+    default), after reserving room for `prompt` and `output_tokens`.
+    """
+    model = model or cfg.smart_llm_model
+    window = get_context_window(model, cfg.context_window_tokens)
+    reserved = count_tokens(prompt, model) + (output_tokens if output_tokens is not None else cfg.smart_token_limit)
+    return max(0, int(window * (1 - SAFETY_MARGIN)) - reserved)
+
+
+def pack_blocks(
+    blocks: Sequence[str],
+    model: str | None,
+    budget: int,
+    priority: Sequence[int] | None = None,
+) -> tuple[List[int], Dict[str, int]]:
+    """
+    Greedily pick blocks in `priority` order (indices, most relevant first)
+    until `budget` tokens are used. Blocks that do not fit are skipped so
+    smaller, less relevant ones can still be packed.
+
+    Returns:
+        The indices of the kept blocks in their original order, and a report
+        with total, used and dropped token counts and the number of dropped blocks.
+    """
+    tokens = [count_tokens(block, model) for block in blocks]
+    order = priority if priority is not None else range(len(blocks))
+    kept, used = [], 0
+    for index in order:
+        if used + tokens[index] <= budget:
+            kept.append(index)
+            used += tokens[index]
+    kept.sort()
+    total = sum(tokens)
+    return kept, {
+        "total_tokens": total,
+        "used_tokens": used,
+        "dropped_tokens": total - used,
+        "dropped_blocks": len(blocks) - len(kept),
+    }
+
+
+def _split_blocks(text: str) -> List[str]:
+    # Compressed context is a series of "Source: ...\nTitle: ...\nContent: ..." blocks
+    blocks = [block for block in _SOURCE_BLOCK.split(text) if block]
+    if len(blocks) <= 1:
+        blocks = [block + "\n\n" for block in text.split("\n\n")]
+        blocks[-1] = blocks[-1][:-2]
+    return blocks
+
+
+def fit_context_to_budget(context: Any, model: str | None, budget: int) -> tuple[Any, Dict[str, int]]:
+    """
+    Pack research context (a string or a list of strings, one per sub-query)
+    into `budget` tokens.
+
+    Each string is split into source blocks, which are ranked by their position
+    (compressed context is sorted by similarity) and interleaved across
+    sub-queries so that each keeps its best sources. The result has the same
+    shape as the input, with the kept blocks in their original order.
+    """
+    if isinstance(context, str):
+        groups = [_split_blocks(context)]
+    elif isinstance(context, list) and all(isinstance(item, str) for item in context):
+        groups = [_split_blocks(item) for item in context]
+    else:
+        # Curated sources and other structured context are left untouched
+        return context, {"total_tokens": 0, "used_tokens": 0, "dropped_tokens": 0, "dropped_blocks": 0}
+
+    blocks, positions = [], []
+    for group_index, group in enumerate(groups):
+        for rank, block in enumerate(group):
+            blocks.append(block)
+            positions.append((rank, group_index))
+    priority = sorted(range(len(blocks)), key=lambda i: positions[i])
+    kept, report = pack_blocks(blocks, model, budget, priority)
+
+    packed: List[List[str]] = [[] for _ in groups]
+    for index in kept:
+        packed[positions[index][1]].append(blocks[index])
+    packed_groups = ["".join(group) for group in packed]
+
+    if report["dropped_blocks"]:
+        logger.warning(
+            f"Context exceeds the {budget} token budget: dropped {report['dropped_blocks']} blocks "
+            f"({report['dropped_tokens']} of {report['total_tokens']} tokens)"
+        )
+
+    if isinstance(context, str):
+        return packed_groups[0], report
+    return [group for group in packed_groups if group], report
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from typing import Dict, List
+
+import numpy as np
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from .ann import MIN_ANN_SIZE, create_vector_index
+from .similarity import cosine_similarity, normalize, top_k_indices
+
+
+class ChunkIndex:
+    """
+    Chunk index over a set of documents.
+
+    Documents are split and embedded once into a contiguous float32 matrix of
+    normalized vectors. Any number of queries can then be scored against it
+    with a single matrix multiply. Chunk text and per-document metadata are
+    stored separately, and `Document` objects are only built for results.
+
+    With an `index_type` other than "flat", top-k searches over large indexes
+    go through an approximate nearest neighbor index (see `context.ann`) that
+    is built lazily from the matrix; the candidates are still scored exactly.
+    Searches run in a worker thread, so building it does not block the event loop.
+    """
+
+    def __init__(self, embeddings, chunk_size: int = 1000, chunk_overlap: int = 100, index_type: str = "flat"):
+        self.embeddings = embeddings
+        self.index_type = index_type
+        self.ann = None
+        self._ann_lock = threading.Lock()
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        self.texts: List[str] = []
+        self.metadatas: List[Dict] = []
+        self.chunk_metadata_ids: List[int] = []
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _split(self, contents: List[str], metadatas: List[Dict]) -> tuple[List[str], List[Dict], List[int]]:
+        texts, kept_metadatas, metadata_ids = [], [], []
+        for content, metadata in zip(contents, metadatas):
+            if not content:
+                continue
+            kept_metadatas.append(metadata)
+            for chunk in self.splitter.split_text(content):
+                texts.append(chunk)
+                metadata_ids.append(len(kept_metadatas) - 1)
+        return texts, kept_metadatas, metadata_ids
+
+    async def aadd_texts(self, contents: List[str], metadatas: List[Dict]) -> int:
+        """Split and embed texts, appending them to the index. Returns the number of new chunks."""
+        texts, kept_metadatas, metadata_ids = await asyncio.to_thread(self._split, contents, metadatas)
+        if not texts:
+            return 0
+        vectors = normalize(await self.embeddings.aembed_documents(texts))
+        # No awaits below, so concurrent additions cannot interleave
+        matrix = vectors if not self.texts else np.concatenate([self.matrix, vectors])
+        offset = len(self.metadatas)
+        self.metadatas.extend(kept_metadatas)
+        self.texts.extend(texts)
+        self.chunk_metadata_ids.extend(offset + i for i in metadata_ids)
+        # Assigned last: searches in other threads only use the rows of the matrix they read
+        self.matrix = matrix
+        return len(texts)
+
+    async def aadd_pages(self, pages: List[Dict]) -> int:
+        """Add scraped pages with 'raw_content', 'title' and 'url' keys."""
+        return await self.aadd_texts(
+            [page.get("raw_content", "") for page in pages],
+            [{"title": page.get("title", ""), "source": page.get("url", "")} for page in pages],
+        )
+
+    async def aembed_queries(self, queries: List[str]) -> np.ndarray:
+        vectors = await asyncio.gather(*[self.embeddings.aembed_query(query) for query in queries])
+        return normalize(vectors)
+
+    def _document(self, index: int) -> Document:
+        return Document(
+            page_content=self.texts[index],
+            metadata=dict(self.metadatas[self.chunk_metadata_ids[index]]),
+        )
+
+    def _ann_candidates(self, matrix: np.ndarray, query_vectors: np.ndarray, k: int | None) -> List[np.ndarray] | None:
+        """Candidate rows for each query from the ANN index, None to search exhaustively."""
+        if self.index_type == "flat" or k is None or len(matrix) < MIN_ANN_SIZE:
+            return None
+        with self._ann_lock:
+            if self.ann is None:
+                self.ann = create_vector_index(self.index_type)
+            self.ann.update(matrix)
+            return self.ann.search(matrix, query_vectors, k)
+
+    def search_by_vectors(self, query_vectors: np.ndarray, k: int | None, threshold: float | None) -> List[List[Document]]:
+        """Return the top-k chunks above `threshold` for each (normalized) query vector."""
+        matrix = self.matrix
+        if not len(matrix):
+            return [[] for _ in range(len(query_vectors))]
+        candidates = self._ann_candidates(matrix, query_vectors, k)
+        if candidates is not None:
+            results = []
+            for query_vector, rows in zip(query_vectors, candidates):
+                scores = np.asarray(matrix[rows]) @ query_vector
+                results.append([self._document(int(rows[i])) for i in top_k_indices(scores, k, threshold)])
+            return results
+        scores = cosine_similarity(query_vectors, matrix)
+        return [[self._document(i) for i in top_k_indices(row, k, threshold)] for row in scores]
+
+    async def asearch_by_vectors(
+        self, query_vectors: np.ndarray, k: int | None, threshold: float | None
+    ) -> List[List[Document]]:
+        """`search_by_vectors` in a worker thread, as scoring and (re)building the ANN index are CPU-bound."""
+        return await asyncio.to_thread(self.search_by_vectors, query_vectors, k, threshold)
+
+    def count_above(self, query_vector: np.ndarray, threshold: float) -> int:
+        """Number of indexed chunks whose similarity to the (normalized) query exceeds `threshold`."""
+        if not self.texts:
+            return 0
+        return int((cosine_similarity(query_vector, self.matrix) > threshold).sum())
+
+    async def asearch_many(self, queries: List[str], k: int | None, threshold: float | None) -> List[List[Document]]:
+        """Score all queries against the index in one batch."""
+        if not queries:
+            return []
+        query_vectors = await self.aembed_queries(queries)
+        return await self.asearch_by_vectors(query_vectors, k, threshold)
+
+    async def asearch(self, query: str, k: int | None, threshold: float | None) -> List[Document]:
+        return (await self.asearch_many([query], k, threshold))[0]
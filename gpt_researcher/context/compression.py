@@ -1,25 +1,19 @@
 import os
-import asyncio
-from typing import Optional
-from .retriever import SearchAPIRetriever, SectionRetriever
-from langchain.retrievers import (
-    ContextualCompressionRetriever,
-)
-from langchain.retrievers.document_compressors import (
-    DocumentCompressorPipeline,
-    EmbeddingsFilter,
-)
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from ..vector_store import VectorStoreWrapper
-from ..utils.costs import estimate_embedding_cost
+from typing import TYPE_CHECKING, Optional
+from .chunk_index import ChunkIndex
+from ..utils.costs import aestimate_embedding_cost
 from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
 from ..prompts import PromptFamily
 
+if TYPE_CHECKING:
+    # `vector_store` imports this package, import it for annotations only
+    from ..vector_store import VectorStoreWrapper
+
 
 class VectorstoreCompressor:
     def __init__(
         self,
-        vector_store: VectorStoreWrapper,
+        vector_store: "VectorStoreWrapper",
         max_results:int = 7,
         filter: Optional[dict] = None,
         prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
@@ -45,66 +39,41 @@ class ContextCompressor:
         embeddings,
         max_results=5,
         prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
-        **kwargs,
+        vector_index: str = "flat",
     ):
         self.max_results = max_results
+        self.vector_index = vector_index
         self.documents = documents
-        self.kwargs = kwargs
         self.embeddings = embeddings
-        self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
+        self.similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
         self.prompt_family = prompt_family
 
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SearchAPIRetriever(
-            pages=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
-
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        chunk_index = ChunkIndex(self.embeddings, index_type=self.vector_index)
         if cost_callback:
-            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+            cost_callback(await aestimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
+        await chunk_index.aadd_pages(self.documents)
+        relevant_docs = await chunk_index.asearch(query, k=max_results, threshold=self.similarity_threshold)
         return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
 
 
 class WrittenContentCompressor:
-    def __init__(self, documents, embeddings, similarity_threshold, **kwargs):
+    def __init__(self, documents, embeddings, similarity_threshold, vector_index: str = "flat"):
         self.documents = documents
-        self.kwargs = kwargs
+        self.vector_index = vector_index
         self.embeddings = embeddings
         self.similarity_threshold = similarity_threshold
 
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SectionRetriever(
-            sections=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
-
     def __pretty_docs_list(self, docs, top_n):
         return [f"Title: {d.metadata.get('section_title')}\nContent: {d.page_content}\n" for i, d in enumerate(docs) if i < top_n]
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        chunk_index = ChunkIndex(self.embeddings, index_type=self.vector_index)
         if cost_callback:
-            cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+            cost_callback(await aestimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
+        await chunk_index.aadd_texts(
+            [section.get("written_content", "") for section in self.documents],
+            [{"section_title": section.get("section_title", "")} for section in self.documents],
+        )
+        relevant_docs = await chunk_index.asearch(query, k=max_results, threshold=self.similarity_threshold)
         return self.__pretty_docs_list(relevant_docs, max_results)
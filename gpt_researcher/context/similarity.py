@@ -0,0 +1,37 @@
+"""
+Vectorized similarity helpers used by the context compressors.
+
+Embeddings are held as contiguous, L2-normalized float32 matrices so cosine
+similarity reduces to a single matrix multiply.
+"""
+import numpy as np
+
+
+def normalize(vectors) -> np.ndarray:
+    """Convert vectors to a contiguous float32 matrix with unit-length rows."""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_similarity(query_matrix: np.ndarray, doc_matrix: np.ndarray) -> np.ndarray:
+    """Similarity of every (normalized) query row against every (normalized) document row."""
+    if doc_matrix.size == 0:
+        return np.empty((len(query_matrix), 0), dtype=np.float32)
+    return query_matrix @ doc_matrix.T
+
+
+def top_k_indices(scores: np.ndarray, k: int | None, threshold: float | None = None) -> np.ndarray:
+    """
+    Indices of the `k` highest scores above `threshold`, best first.
+
+    Uses `argpartition` so only the selected candidates are fully sorted.
+    """
+    candidates = np.flatnonzero(scores > threshold) if threshold is not None else np.arange(len(scores))
+    if k is not None and len(candidates) > k:
+        partition = np.argpartition(scores[candidates], -k)[-k:]
+        candidates = candidates[partition]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
@@ -0,0 +1,103 @@
+"""
+Cache of text extracted from local documents.
+
+Each file has a manifest entry (modification time, size and SHA-256 of its
+content) stored with the pages extracted from it. A file whose modification
+time and size are unchanged is not read again; one that was touched but has
+the same content is recognized by its hash. Only new or changed files need to
+be parsed.
+
+Entries are zlib-compressed JSON, keyed by absolute path. They are kept in
+memory for the process and, when a path is configured, in a SQLite file so
+that they survive restarts.
+"""
+import hashlib
+import json
+import os
+import threading
+import zlib
+from typing import Any, Dict, List
+
+from ..utils.cache import LRUCache, SQLiteCache
+
+
+def file_fingerprint(file_path: str) -> Dict[str, Any]:
+    """Modification time, size and SHA-256 of a file."""
+    stat = os.stat(file_path)
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest.hexdigest()}
+
+
+class DocumentCache:
+    """Manifest of parsed local documents with their extracted pages."""
+
+    def __init__(self, max_size: int = 10000, path: str | None = None):
+        self.memory = LRUCache(max_size)
+        self.store = SQLiteCache(path, table="parsed_documents") if path else None
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    def _put(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        values = {key: zlib.compress(json.dumps(entry).encode("utf-8")) for key, entry in entries.items()}
+        for key, value in values.items():
+            self.memory.set(key, value)
+        if self.store is not None:
+            self.store.set_many(values)
+
+    def get_many(self, file_paths: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return the cached pages of every file in `file_paths` that has not
+        changed since it was parsed. Blocking, call it from a worker thread.
+        """
+        keys = {file_path: self._key(file_path) for file_path in file_paths}
+        values = {key: self.memory.get(key) for key in keys.values()}
+        missing = [key for key, value in values.items() if value is None]
+        if missing and self.store is not None:
+            for key, value in self.store.get_many(missing).items():
+                self.memory.set(key, value)
+                values[key] = value
+
+        found, touched = {}, {}
+        for file_path, key in keys.items():
+            if values.get(key) is None:
+                continue
+            entry = json.loads(zlib.decompress(values[key]))
+            try:
+                stat = os.stat(file_path)
+                if stat.st_size != entry["size"]:
+                    continue
+                if stat.st_mtime_ns != entry["mtime"]:
+                    # Touched, copied or checked out again: reuse it if the content is the same
+                    fingerprint = file_fingerprint(file_path)
+                    if fingerprint["sha256"] != entry["sha256"]:
+                        continue
+                    entry.update(fingerprint)
+                    touched[key] = entry
+            except OSError:
+                continue
+            found[file_path] = entry["pages"]
+
+        if touched:
+            self._put(touched)
+        return found
+
+    def set(self, file_path: str, fingerprint: Dict[str, Any], pages: List[Dict[str, Any]]) -> None:
+        """Record the pages parsed from `file_path` when it had `fingerprint`."""
+        self._put({self._key(file_path): {**fingerprint, "pages": pages}})
+
+
+_CACHES: dict[str | None, DocumentCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_document_cache(path: str | None = None) -> DocumentCache:
+    """Return the process-wide document cache for `path`, so that all researchers share it."""
+    with _CACHES_LOCK:
+        if path not in _CACHES:
+            _CACHES[path] = DocumentCache(path=path)
+        return _CACHES[path]
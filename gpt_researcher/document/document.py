@@ -1,6 +1,7 @@
 import asyncio
 import os
-from typing import List, Union
+from functools import partial
+from typing import Any, Dict, List, Union
 from langchain_community.document_loaders import (
     PyMuPDFLoader,
     TextLoader,
@@ -12,81 +13,98 @@ from langchain_community.document_loaders import (
 )
 from langchain_community.document_loaders import BSHTMLLoader
 
+from ..utils.workers import run_cpu_bound
+from .cache import file_fingerprint, get_document_cache
+
+LOADERS = {
+    "pdf": PyMuPDFLoader,
+    "txt": TextLoader,
+    "doc": UnstructuredWordDocumentLoader,
+    "docx": UnstructuredWordDocumentLoader,
+    "pptx": UnstructuredPowerPointLoader,
+    "csv": partial(UnstructuredCSVLoader, mode="elements"),
+    "xls": partial(UnstructuredExcelLoader, mode="elements"),
+    "xlsx": partial(UnstructuredExcelLoader, mode="elements"),
+    "md": UnstructuredMarkdownLoader,
+    "html": BSHTMLLoader,
+    "htm": BSHTMLLoader,
+}
+
+
+def parse_document(file_path: str, file_extension: str) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Load a local file and return its fingerprint and non-empty pages.
+
+    Kept at module level and returning plain values so that it can run in a
+    worker process. The fingerprint is taken before parsing, so a file changed
+    meanwhile is parsed again next time.
+    """
+    fingerprint = file_fingerprint(file_path)
+    pages = [
+        {"raw_content": page.page_content, "url": os.path.basename(page.metadata['source'])}
+        for page in LOADERS[file_extension](file_path).load()
+        if page.page_content
+    ]
+    return fingerprint, pages
+
 
 class DocumentLoader:
 
-    def __init__(self, path: Union[str, List[str]]):
+    def __init__(self, path: Union[str, List[str]], cache_path: str | None = None, processes: int = -1):
+        """
+        Args:
+            path: Directory to load recursively, or list of files.
+            cache_path: Optional SQLite file persisting parsed documents across runs.
+            processes: Processes parsing documents, -1 to parse in threads, 0 for one per CPU core.
+        """
         self.path = path
+        self.cache_path = cache_path
+        self.processes = processes
 
     async def load(self) -> list:
-        tasks = []
+        files = []
         if isinstance(self.path, list):
             for file_path in self.path:
                 if os.path.isfile(file_path):  # Ensure it's a valid file
-                    filename = os.path.basename(file_path)
-                    file_name, file_extension_with_dot = os.path.splitext(filename)
-                    file_extension = file_extension_with_dot.strip(".").lower()
-                    tasks.append(self._load_document(file_path, file_extension))
-                    
+                    files.append(file_path)
+
         elif isinstance(self.path, (str, bytes, os.PathLike)):
-            for root, dirs, files in os.walk(self.path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_name, file_extension_with_dot = os.path.splitext(file)
-                    file_extension = file_extension_with_dot.strip(".").lower()
-                    tasks.append(self._load_document(file_path, file_extension))
-                    
+            for root, dirs, filenames in os.walk(self.path):
+                for file in filenames:
+                    files.append(os.path.join(root, file))
+
         else:
             raise ValueError("Invalid type for path. Expected str, bytes, os.PathLike, or list thereof.")
 
-        # for root, dirs, files in os.walk(self.path):
-        #     for file in files:
-        #         file_path = os.path.join(root, file)
-        #         file_name, file_extension_with_dot = os.path.splitext(file_path)
-        #         file_extension = file_extension_with_dot.strip(".")
-        #         tasks.append(self._load_document(file_path, file_extension))
-
-        docs = []
-        for pages in await asyncio.gather(*tasks):
-            for page in pages:
-                if page.page_content:
-                    docs.append({
-                        "raw_content": page.page_content,
-                        "url": os.path.basename(page.metadata['source'])
-                    })
-                    
+        files = [file_path for file_path in files if self._extension(file_path) in LOADERS]
+
+        # Unchanged files come from the cache, the others are parsed in parallel
+        cache = get_document_cache(self.cache_path)
+        cached = await asyncio.to_thread(cache.get_many, files)
+        to_parse = [file_path for file_path in files if file_path not in cached]
+        parsed = await asyncio.gather(*(self._load_document(file_path) for file_path in to_parse))
+        pages_by_file = {**cached, **dict(zip(to_parse, parsed))}
+
+        docs = [page for file_path in files for page in pages_by_file[file_path]]
+
         if not docs:
             raise ValueError("🤷 Failed to load any documents!")
 
         return docs
 
-    async def _load_document(self, file_path: str, file_extension: str) -> list:
-        ret_data = []
-        try:
-            loader_dict = {
-                "pdf": PyMuPDFLoader(file_path),
-                "txt": TextLoader(file_path),
-                "doc": UnstructuredWordDocumentLoader(file_path),
-                "docx": UnstructuredWordDocumentLoader(file_path),
-                "pptx": UnstructuredPowerPointLoader(file_path),
-                "csv": UnstructuredCSVLoader(file_path, mode="elements"),
-                "xls": UnstructuredExcelLoader(file_path, mode="elements"),
-                "xlsx": UnstructuredExcelLoader(file_path, mode="elements"),
-                "md": UnstructuredMarkdownLoader(file_path),
-                "html": BSHTMLLoader(file_path),
-                "htm": BSHTMLLoader(file_path)
-            }
-
-            loader = loader_dict.get(file_extension, None)
-            if loader:
-                try:
-                    ret_data = loader.load()
-                except Exception as e:
-                    print(f"Failed to load HTML document : {file_path}")
-                    print(e)
+    @staticmethod
+    def _extension(file_path: str) -> str:
+        return os.path.splitext(file_path)[1].strip(".").lower()
 
+    async def _load_document(self, file_path: str) -> list:
+        try:
+            fingerprint, pages = await run_cpu_bound(
+                parse_document, file_path, self._extension(file_path), processes=self.processes
+            )
         except Exception as e:
             print(f"Failed to load document : {file_path}")
             print(e)
+            return []
 
-        return ret_data
+        await asyncio.to_thread(get_document_cache(self.cache_path).set, file_path, fingerprint, pages)
+        return pages
@@ -11,6 +11,8 @@ from langchain_community.document_loaders import (
     UnstructuredWordDocumentLoader
 )
 
+from ..utils.http import get_aiohttp_session
+
 
 class OnlineDocumentLoader:
 
@@ -38,18 +40,18 @@ class OnlineDocumentLoader:
             headers = {
                 "User-Agent": "Mozilla/5.0"
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=6) as response:
-                    if response.status != 200:
-                        print(f"Failed to download {url}: HTTP {response.status}")
-                        return []
+            session = get_aiohttp_session()
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=6)) as response:
+                if response.status != 200:
+                    print(f"Failed to download {url}: HTTP {response.status}")
+                    return []
 
-                    content = await response.read()
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=self._get_extension(url)) as tmp_file:
-                        tmp_file.write(content)
-                        tmp_file_path = tmp_file.name
+                content = await response.read()
+                with tempfile.NamedTemporaryFile(delete=False, suffix=self._get_extension(url)) as tmp_file:
+                    tmp_file.write(content)
+                    tmp_file_path = tmp_file.name
 
-                    return await self._load_document(tmp_file_path, self._get_extension(url).strip('.'))
+            return await self._load_document(tmp_file_path, self._get_extension(url).strip('.'))
         except aiohttp.ClientError as e:
             print(f"Failed to process {url}")
             print(e)
@@ -4,10 +4,13 @@ import importlib
 import json
 import subprocess
 import sys
+import threading
 import traceback
+import weakref
 from typing import Any
 from colorama import Fore, Style, init
 import os
+from collections import OrderedDict
 from enum import Enum
 
 _SUPPORTED_PROVIDERS = {
@@ -82,12 +85,103 @@ class ChatLogger:
                     "stacktrace": traceback.format_exc()
                 }) + "\n")
 
+# Per-call settings applied to a shared client instead of being part of its cache key
+_OVERRIDABLE_KWARGS = ("temperature", "max_tokens")
+_MAX_CACHED_CLIENTS = 32
+
+
+class _ClientRegistry:
+    """
+    Memoizes constructed LangChain chat models by (provider, kwargs).
+
+    Async HTTP clients must not be shared across event loops, so clients are
+    kept per running loop. Clients created outside a running loop may later be
+    used from any loop (e.g. one `asyncio.run` per call) and are not cached.
+    """
+
+    def __init__(self):
+        self._per_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _clients(self) -> OrderedDict | None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        return self._per_loop.setdefault(loop, OrderedDict())
+
+    @staticmethod
+    def make_key(provider: str, kwargs: dict[str, Any]) -> str:
+        # Objects such as rate limiters only match themselves, via their repr
+        return provider + ":" + json.dumps(kwargs, sort_keys=True, default=repr)
+
+    def get(self, key: str):
+        with self._lock:
+            clients = self._clients()
+            llm = clients.get(key) if clients is not None else None
+            if llm is not None:
+                clients.move_to_end(key)
+            return llm
+
+    def set(self, key: str, llm) -> None:
+        with self._lock:
+            clients = self._clients()
+            if clients is None:
+                return
+            clients[key] = llm
+            while len(clients) > _MAX_CACHED_CLIENTS:
+                clients.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._per_loop.clear()
+
+
+_registry = _ClientRegistry()
+
+
 class GenericLLMProvider:
 
     def __init__(self, llm, chat_log: str | None = None,  verbose: bool = True):
         self.llm = llm
         self.chat_logger = ChatLogger(chat_log) if chat_log else None
         self.verbose = verbose
+        # Token usage reported by the provider for the last response, if any
+        self.last_usage: dict | None = None
+
+    @classmethod
+    def get_or_create(cls, provider: str, chat_log: str | None = None, verbose: bool = True, **kwargs: Any):
+        """
+        Like `from_provider`, but reuses a previously constructed client (and its
+        HTTP connection pool) for the same provider and kwargs.
+
+        `temperature` and `max_tokens` are applied to a shallow copy of the shared
+        client, so calls that only differ in those settings still share it.
+        Providers that do not expose them as model fields get a client per value.
+        """
+        overrides = {name: kwargs.pop(name) for name in _OVERRIDABLE_KWARGS if name in kwargs}
+        key = _registry.make_key(provider, kwargs)
+        llm = _registry.get(key)
+        if llm is None:
+            llm = cls.from_provider(provider, verbose=verbose, **kwargs, **overrides).llm
+            _registry.set(key, llm)
+
+        fields = getattr(type(llm), "model_fields", {})
+        changed = {name: value for name, value in overrides.items() if getattr(llm, name, None) != value}
+        if changed:
+            if all(name in fields for name in changed):
+                llm = llm.model_copy(update=changed)
+            else:
+                exact_key = _registry.make_key(provider, {**kwargs, **overrides})
+                llm = _registry.get(exact_key)
+                if llm is None:
+                    llm = cls.from_provider(provider, verbose=verbose, **kwargs, **overrides).llm
+                    _registry.set(exact_key, llm)
+
+        return cls(llm, chat_log, verbose=verbose)
+
     @classmethod
     def from_provider(cls, provider: str, chat_log: str | None = None, verbose: bool=True, **kwargs: Any):
         if provider == "openai":
@@ -246,6 +340,7 @@ class GenericLLMProvider:
             output = await self.llm.ainvoke(messages, **kwargs)
 
             res = output.content
+            self.last_usage = getattr(output, "usage_metadata", None)
 
         else:
             res = await self.stream_response(messages, websocket, **kwargs)
@@ -258,9 +353,17 @@ class GenericLLMProvider:
     async def stream_response(self, messages, websocket=None, **kwargs):
         paragraph = ""
         response = ""
+        self.last_usage = None
 
         # Streaming the response using the chain astream method from langchain
         async for chunk in self.llm.astream(messages, **kwargs):
+            # Providers that report usage while streaming attach it to (usually the last) chunk
+            usage = getattr(chunk, "usage_metadata", None)
+            if usage:
+                self.last_usage = {
+                    key: (self.last_usage or {}).get(key, 0) + (usage.get(key) or 0)
+                    for key in ("input_tokens", "output_tokens", "total_tokens")
+                }
             content = chunk.content
             if content is not None:
                 response += content
@@ -57,7 +57,7 @@ class MCPResearchSkill:
                 **self.cfg.llm_kwargs
             }
             
-            llm_provider = GenericLLMProvider.from_provider(
+            llm_provider = GenericLLMProvider.get_or_create(
                 self.cfg.strategic_llm_provider, 
                 **provider_kwargs
             )
@@ -1 +1,3 @@
 from .embeddings import Memory
+from .cache import CachedEmbeddings, EmbeddingCache, get_embedding_cache
+from .batching import BatchedEmbeddings, RateLimits, batch_embeddings
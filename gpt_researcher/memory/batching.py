@@ -0,0 +1,336 @@
+"""
+Batched, rate-limit aware embedding requests.
+
+`BatchedEmbeddings` wraps a LangChain `Embeddings` object. Texts passed to
+`aembed_documents` by concurrent callers (sub-queries, subtopics, deep
+research branches) are queued for a few milliseconds, deduplicated and sent
+in batches sized for the provider, with at most `max_concurrency` requests in
+flight. Rate-limited requests (429) are retried with exponential backoff,
+honouring Retry-After, and requests rejected as too large are split in half.
+
+Each `Memory` wraps its own client, so researchers configured with other
+credentials or endpoints use them. Wrappers of identically configured clients
+(same provider, model, endpoint and credentials) share their queue on each
+event loop, so concurrent researchers in a process, such as the subtopics of a
+detailed report, share batches. The request budget (the concurrency limit and
+rate limit backoff) is shared per embedding provider and model in the process,
+so all researchers draw from it.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, List
+
+from langchain_core.embeddings import Embeddings
+
+from ..utils.workers import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Inputs per request that stay within each provider's documented limits
+PROVIDER_BATCH_SIZES = {
+    "openai": 512,
+    "azure_openai": 512,
+    "custom": 256,
+    "aimlapi": 256,
+    "cohere": 96,
+    "voyageai": 128,
+    "mistralai": 64,
+    "google_genai": 100,
+    "google_vertexai": 250,
+    "together": 128,
+    "fireworks": 128,
+    "nomic": 256,
+    "dashscope": 25,
+    "gigachat": 64,
+    "ollama": 32,
+    "huggingface": 32,
+    "bedrock": 32,
+}
+DEFAULT_BATCH_SIZE = 64
+# Characters per request, to stay under token limits with long chunks (~100k tokens)
+MAX_BATCH_CHARS = 400_000
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or "ratelimit" in type(error).__name__.lower() or "429" in str(error)
+
+
+def is_too_large_error(error: Exception) -> bool:
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    message = str(error).lower()
+    return status == 413 or any(hint in message for hint in ("too many inputs", "too large", "maximum context", "max tokens"))
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    return parse_retry_after(headers.get("retry-after") or headers.get("Retry-After"))
+
+
+class RateLimits:
+    """Concurrency limit and rate limit backoff shared by the clients of a provider and model."""
+
+    def __init__(self, max_concurrency: int = 4):
+        self.max_concurrency = max(1, max_concurrency)
+        self.blocked_until = 0.0
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def block(self, delay: float) -> None:
+        """Hold back all requests for `delay` seconds, e.g. after a 429."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+
+    def wait_time(self) -> float:
+        return max(0.0, self.blocked_until - time.monotonic())
+
+
+class _LoopState:
+    def __init__(self):
+        self.pending: Dict[str, List[asyncio.Future]] = {}
+        self.flush_handle: asyncio.TimerHandle | None = None
+        self.tasks: set = set()
+
+
+# Queues of the wrappers sharing a client configuration, per event loop
+_SHARED_STATES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _LoopState]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _config_value(value: Any) -> Any:
+    if hasattr(value, "get_secret_value"):
+        return value.get_secret_value()
+    raise TypeError(f"{type(value).__name__} values are not comparable")
+
+
+def client_key(embeddings: Embeddings) -> str | None:
+    """
+    Hash of the configuration of `embeddings`, credentials and endpoint
+    included, or None if it cannot be determined (e.g. not a pydantic model).
+    """
+    dump = getattr(embeddings, "model_dump", None)
+    if dump is None:
+        return None
+    try:
+        payload = json.dumps(
+            [type(embeddings).__module__, type(embeddings).__qualname__, dump()],
+            sort_keys=True,
+            default=_config_value,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BatchedEmbeddings(Embeddings):
+    """Embeddings wrapper coalescing concurrent requests into bounded, retried batches."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        linger: float = 0.01,
+        limits: RateLimits | None = None,
+        key: str | None = None,
+    ):
+        self.embeddings = embeddings
+        self.batch_size = max(1, batch_size)
+        self.limits = limits or RateLimits(max_concurrency)
+        self.max_retries = max_retries
+        self.linger = linger
+        # Wrappers with the same key share pending texts; their clients must be interchangeable
+        self.key = key
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose attributes of the wrapped embeddings (e.g. `model`)
+        try:
+            embeddings = self.__dict__["embeddings"]
+        except KeyError:
+            # Not initialized yet, e.g. while unpickling or copying
+            raise AttributeError(name) from None
+        return getattr(embeddings, name)
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        batches, batch, size = [], [], 0
+        for text in texts:
+            if batch and (len(batch) >= self.batch_size or size + len(text) > MAX_BATCH_CHARS):
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(text)
+            size += len(text)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        delay = retry_after_seconds(error)
+        if delay is None:
+            delay = min(60.0, 2 ** attempt) * (0.5 + random.random())
+        return delay
+
+    # Synchronous path: batched and retried, one request at a time
+
+    def _embed_batch_sync(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(self.max_retries + 1):
+            time.sleep(self.limits.wait_time())
+            try:
+                return self.embeddings.embed_documents(texts)
+            except Exception as e:
+                if len(texts) > 1 and is_too_large_error(e):
+                    middle = len(texts) // 2
+                    return self._embed_batch_sync(texts[:middle]) + self._embed_batch_sync(texts[middle:])
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                logger.warning(f"Embedding rate limited, retrying in {delay:.1f}s")
+                self.limits.block(delay)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [vector for batch in self._batches(texts) for vector in self._embed_batch_sync(batch)]
+
+    def embed_query(self, text: str) -> List[float]:
+        for attempt in range(self.max_retries + 1):
+            time.sleep(self.limits.wait_time())
+            try:
+                return self.embeddings.embed_query(text)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                self.limits.block(self._backoff(attempt, e))
+
+    # Asynchronous path: coalesced across callers and run concurrently
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        if self.key is None:
+            states, key = self._states, loop
+        else:
+            states, key = _SHARED_STATES.setdefault(loop, {}), self.key
+        state = states.get(key)
+        if state is None:
+            state = states[key] = _LoopState()
+        return state
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self.limits.wait_time())
+            try:
+                async with self.limits.semaphore():
+                    return await self.embeddings.aembed_documents(texts)
+            except Exception as e:
+                if len(texts) > 1 and is_too_large_error(e):
+                    middle = len(texts) // 2
+                    halves = await asyncio.gather(self._embed_batch(texts[:middle]), self._embed_batch(texts[middle:]))
+                    return halves[0] + halves[1]
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                logger.warning(f"Embedding rate limited, retrying {len(texts)} texts in {delay:.1f}s")
+                self.limits.block(delay)
+
+    async def _run_batch(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        texts = list(batch)
+        try:
+            vectors = await self._embed_batch(texts)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for text, vector in zip(texts, vectors):
+            for future in batch[text]:
+                if not future.done():
+                    future.set_result(vector)
+
+    def _flush(self, state: _LoopState) -> None:
+        state.flush_handle = None
+        pending, state.pending = state.pending, {}
+        for texts in self._batches(list(pending)):
+            task = asyncio.get_running_loop().create_task(self._run_batch({text: pending[text] for text in texts}))
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        state = self._state()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            state.pending.setdefault(text, []).append(future)
+            futures.append(future)
+
+        if len(state.pending) >= self.batch_size:
+            if state.flush_handle is not None:
+                state.flush_handle.cancel()
+            self._flush(state)
+        elif state.flush_handle is None:
+            # Wait briefly so that concurrent callers share batches
+            state.flush_handle = loop.call_later(self.linger, self._flush, state)
+        return list(await asyncio.gather(*futures))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self.limits.wait_time())
+            try:
+                async with self.limits.semaphore():
+                    return await self.embeddings.aembed_query(text)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                self.limits.block(self._backoff(attempt, e))
+
+
+_LIMITS: dict[tuple, RateLimits] = {}
+_LIMITS_LOCK = threading.Lock()
+
+
+def get_rate_limits(provider: str, model: str, max_concurrency: int = 4) -> RateLimits:
+    """Return the process-wide request budget for the given provider, model and concurrency."""
+    key = (provider, model, max_concurrency)
+    with _LIMITS_LOCK:
+        if key not in _LIMITS:
+            _LIMITS[key] = RateLimits(max_concurrency)
+        return _LIMITS[key]
+
+
+def batch_embeddings(
+    embeddings: Embeddings,
+    provider: str,
+    model: str,
+    batch_size: int = 0,
+    max_concurrency: int = 4,
+) -> BatchedEmbeddings:
+    """
+    Wrap `embeddings` so that its requests are batched with those of
+    identically configured clients and draw from the budget shared by all
+    clients of the provider and model. `batch_size=0` uses the provider's
+    default batch size.
+    """
+    batch_size = batch_size or PROVIDER_BATCH_SIZES.get(provider, DEFAULT_BATCH_SIZE)
+    key = client_key(embeddings)
+    return BatchedEmbeddings(
+        embeddings,
+        batch_size=batch_size,
+        limits=get_rate_limits(provider, model, max_concurrency),
+        key=f"{provider}:{model}:{batch_size}:{key}" if key else None,
+    )
@@ -0,0 +1,153 @@
+"""
+Content-addressed embedding cache.
+
+Chunks are keyed by (provider, model, sha256(text)) so the same text is only
+sent to the embedding provider once per process, or once across processes when
+an on-disk store is configured.
+"""
+import hashlib
+import threading
+from array import array
+from typing import Any, List
+
+from langchain_core.embeddings import Embeddings
+
+from ..utils.cache import LRUCache, SQLiteCache
+
+
+class EmbeddingCache:
+    """In-memory LRU cache of embedding vectors with an optional SQLite store."""
+
+    def __init__(self, max_size: int = 10000, path: str | None = None):
+        self.memory = LRUCache(max_size)
+        self.store = SQLiteCache(path, table="embeddings") if path else None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(namespace: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
+        return f"{namespace}:{digest}"
+
+    @staticmethod
+    def _encode(vector: List[float]) -> bytes:
+        return array("f", vector).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[float]:
+        vector = array("f")
+        vector.frombytes(blob)
+        return vector.tolist()
+
+    def get_many(self, keys: List[str]) -> dict[str, List[float]]:
+        found: dict[str, bytes] = {}
+        missing = []
+        for key in keys:
+            blob = self.memory.get(key)
+            if blob is None:
+                missing.append(key)
+            else:
+                found[key] = blob
+        if missing and self.store is not None:
+            stored = self.store.get_many(missing)
+            for key, blob in stored.items():
+                self.memory.set(key, blob)
+            found.update(stored)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return {key: self._decode(blob) for key, blob in found.items()}
+
+    def set_many(self, vectors: dict[str, List[float]]) -> None:
+        encoded = {key: self._encode(vector) for key, vector in vectors.items()}
+        for key, blob in encoded.items():
+            self.memory.set(key, blob)
+        if self.store is not None:
+            self.store.set_many(encoded)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Wraps a LangChain `Embeddings` object and serves repeated texts from an
+    `EmbeddingCache` instead of re-embedding them.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, namespace: str):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.namespace = namespace
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose attributes of the wrapped embeddings (e.g. `model`)
+        try:
+            embeddings = self.__dict__["embeddings"]
+        except KeyError:
+            # Not initialized yet, e.g. while unpickling or copying
+            raise AttributeError(name) from None
+        return getattr(embeddings, name)
+
+    def _lookup(self, texts: List[str], kind: str) -> tuple[List[str], dict[str, List[float]], List[str]]:
+        keys = [self.cache.make_key(f"{self.namespace}:{kind}", text) for text in texts]
+        cached = self.cache.get_many(list(dict.fromkeys(keys)))
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        return keys, cached, list(missing.items())
+
+    @staticmethod
+    def _merge(keys, cached, missing, vectors) -> List[List[float]]:
+        cached.update({key: vector for (key, _), vector in zip(missing, vectors)})
+        return [cached[key] for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, cached, missing = self._lookup(texts, "doc")
+        vectors = []
+        if missing:
+            vectors = self.embeddings.embed_documents([text for _, text in missing])
+            self.cache.set_many({key: vector for (key, _), vector in zip(missing, vectors)})
+        return self._merge(keys, cached, missing, vectors)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, cached, missing = self._lookup(texts, "doc")
+        vectors = []
+        if missing:
+            vectors = await self.embeddings.aembed_documents([text for _, text in missing])
+            self.cache.set_many({key: vector for (key, _), vector in zip(missing, vectors)})
+        return self._merge(keys, cached, missing, vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        # Some providers embed queries differently from documents, so keep them apart
+        keys, cached, missing = self._lookup([text], "query")
+        vectors = []
+        if missing:
+            vectors = [self.embeddings.embed_query(text)]
+            self.cache.set_many({keys[0]: vectors[0]})
+        return self._merge(keys, cached, missing, vectors)[0]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        keys, cached, missing = self._lookup([text], "query")
+        vectors = []
+        if missing:
+            vectors = [await self.embeddings.aembed_query(text)]
+            self.cache.set_many({keys[0]: vectors[0]})
+        return self._merge(keys, cached, missing, vectors)[0]
+
+
+_CACHES: dict[tuple[int, str | None], EmbeddingCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_embedding_cache(max_size: int, path: str | None = None) -> EmbeddingCache | None:
+    """
+    Return the process-wide embedding cache for the given settings so that all
+    researchers (sub-queries, subtopics, deep research branches) share it.
+
+    Returns None when caching is disabled (no memory entries and no store).
+    """
+    if max_size <= 0 and not path:
+        return None
+    with _CACHES_LOCK:
+        key = (max_size, path)
+        if key not in _CACHES:
+            _CACHES[key] = EmbeddingCache(max_size=max_size, path=path)
+        return _CACHES[key]
@@ -1,6 +1,9 @@
 import os
 from typing import Any
 
+from .batching import batch_embeddings
+from .cache import CachedEmbeddings, EmbeddingCache
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -27,7 +30,15 @@ _SUPPORTED_PROVIDERS = {
 
 
 class Memory:
-    def __init__(self, embedding_provider: str, model: str, **embdding_kwargs: Any):
+    def __init__(
+        self,
+        embedding_provider: str,
+        model: str,
+        cache: EmbeddingCache | None = None,
+        batch_size: int = 0,
+        max_concurrency: int = 4,
+        **embdding_kwargs: Any,
+    ):
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -130,6 +141,21 @@ class Memory:
             case _:
                 raise Exception("Embedding not found.")
 
+        # Batched under the request budget shared per provider and model;
+        # wrapped by the cache so that only cache misses are sent
+        _embeddings = batch_embeddings(
+            _embeddings,
+            embedding_provider,
+            model,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
+
+        if cache is not None:
+            _embeddings = CachedEmbeddings(
+                _embeddings, cache, namespace=f"{embedding_provider}:{model}"
+            )
+
         self._embeddings = _embeddings
 
     def get_embeddings(self):
@@ -1,7 +1,8 @@
 import arxiv
+from ..base import AsyncSearchMixin
 
 
-class ArxivSearch:
+class ArxivSearch(AsyncSearchMixin):
     """
     Arxiv API Retriever
     """
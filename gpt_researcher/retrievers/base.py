@@ -0,0 +1,25 @@
+"""
+Async retriever interface.
+
+Every built-in retriever implements `asearch`, so searches can be awaited and
+fanned out across retrievers without blocking the event loop. Retrievers
+whose client library is synchronous get it from `AsyncSearchMixin`, which runs
+their `search` in a worker thread.
+"""
+import asyncio
+from typing import Any, Dict, List, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class AsyncRetriever(Protocol):
+    async def asearch(self, max_results: int | None = None) -> List[Dict[str, Any]]:
+        ...
+
+
+class AsyncSearchMixin:
+    """Provides `asearch` for retrievers that implement a blocking `search`."""
+
+    async def asearch(self, max_results: int | None = None) -> List[Dict[str, Any]]:
+        if max_results is None:
+            return await asyncio.to_thread(self.search)
+        return await asyncio.to_thread(self.search, max_results=max_results)
@@ -2,12 +2,13 @@
 
 # libraries
 import os
-import requests
+from ...utils.http import get_requests_session
 import json
 import logging
+from ..base import AsyncSearchMixin
 
 
-class BingSearch():
+class BingSearch(AsyncSearchMixin):
     """
     Bing Search Retriever
     """
@@ -63,7 +64,7 @@ class BingSearch():
             "safeSearch": "Strict"
         }
 
-        resp = requests.get(url, headers=headers, params=params)
+        resp = get_requests_session().get(url, headers=headers, params=params)
 
         # Preprocess the results
         if resp is None:
@@ -0,0 +1,140 @@
+"""
+Retriever-agnostic search result cache.
+
+Results are keyed by (retriever name, normalized query, query domains,
+max results) and expire after a TTL. An optional SQLite store shares results
+across processes, and concurrent identical searches on the same event loop
+await a single call to the search API.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List
+
+from ..utils.cache import LRUCache, SQLiteCache
+from .base import AsyncRetriever
+
+
+class SearchCache:
+    """In-memory LRU cache of search results with an optional SQLite store."""
+
+    def __init__(self, ttl: int = 3600, max_size: int = 1000, path: str | None = None):
+        self.ttl = ttl
+        self.memory = LRUCache(max_size)
+        self.store = SQLiteCache(path, table="search_results") if path else None
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(retriever_name: str, query: str, query_domains: List[str] | None, max_results: int | None) -> str:
+        normalized = {
+            "retriever": retriever_name.lower(),
+            "query": " ".join(query.lower().split()),
+            "domains": sorted({domain.lower().strip() for domain in query_domains or []}),
+            "max_results": max_results,
+        }
+        payload = json.dumps(normalized, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> List[Dict[str, Any]] | None:
+        # Values are kept serialized so every caller gets its own copy of the results
+        value = self.memory.get(key)
+        if value is None and self.store is not None:
+            value = self.store.get(key)
+            if value is not None:
+                self.memory.set(key, value, ttl=self.ttl)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, results: List[Dict[str, Any]]) -> None:
+        value = json.dumps(results).encode("utf-8")
+        self.memory.set(key, value, ttl=self.ttl)
+        if self.store is not None:
+            self.store.set(key, value, ttl=self.ttl)
+
+    async def _search(self, key: str, search: Callable[[], Awaitable[List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        results = await search() or []
+        # Failed searches usually come back empty, don't keep them around
+        if results:
+            self.set(key, results)
+        return results
+
+    async def aget_or_search(
+        self,
+        retriever_name: str,
+        query: str,
+        query_domains: List[str] | None,
+        max_results: int | None,
+        search: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Return cached results, or await `search` and cache its results.
+        Identical searches already in flight are awaited instead of being issued again.
+        """
+        key = self.make_key(retriever_name, query, query_domains, max_results)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        task = inflight.get(key)
+        if task is None:
+            task = loop.create_task(self._search(key, search))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so that a cancelled caller does not cancel the search for the others
+        results = await asyncio.shield(task)
+        return json.loads(json.dumps(results))
+
+
+async def cached_search(
+    retriever_class: Any,
+    query: str,
+    query_domains: List[str] | None = None,
+    max_results: int | None = None,
+    cache: SearchCache | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run a search with `retriever_class`, going through `cache` when given.
+
+    Retrievers implementing `AsyncRetriever` are awaited directly, others are run
+    in a worker thread. `max_results=None` uses the retriever's own default.
+    """
+    async def search():
+        retriever = retriever_class(query, query_domains=query_domains)
+        if isinstance(retriever, AsyncRetriever):
+            return await retriever.asearch(max_results)
+        if max_results is None:
+            return await asyncio.to_thread(retriever.search)
+        return await asyncio.to_thread(retriever.search, max_results=max_results)
+
+    if cache is None:
+        return await search()
+    return await cache.aget_or_search(retriever_class.__name__, query, query_domains, max_results, search)
+
+
+_CACHES: dict[tuple[int, str | None], SearchCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_search_cache(ttl: int, path: str | None = None) -> SearchCache | None:
+    """
+    Return the process-wide search cache for the given settings so that all
+    researchers share it. Returns None when caching is disabled (`ttl <= 0`).
+    """
+    if ttl <= 0:
+        return None
+    with _CACHES_LOCK:
+        key = (ttl, path)
+        if key not in _CACHES:
+            _CACHES[key] = SearchCache(ttl=ttl, path=path)
+        return _CACHES[key]
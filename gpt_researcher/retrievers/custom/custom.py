@@ -2,8 +2,11 @@ from typing import Any, Dict, List, Optional
 import requests
 import os
 
+from ...utils.http import get_requests_session
+from ..base import AsyncSearchMixin
 
-class CustomRetriever:
+
+class CustomRetriever(AsyncSearchMixin):
     """
     Custom API Retriever
     """
@@ -44,7 +47,7 @@ class CustomRetriever:
             ]
         """
         try:
-            response = requests.get(self.endpoint, params={**self.params, 'query': self.query})
+            response = get_requests_session().get(self.endpoint, params={**self.params, 'query': self.query})
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
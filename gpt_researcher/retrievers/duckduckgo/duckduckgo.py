@@ -1,8 +1,9 @@
 from itertools import islice
 from ..utils import check_pkg
+from ..base import AsyncSearchMixin
 
 
-class Duckduckgo:
+class Duckduckgo(AsyncSearchMixin):
     """
     Duckduckgo API Retriever
     """
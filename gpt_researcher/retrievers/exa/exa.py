@@ -1,8 +1,9 @@
 import os
 from ..utils import check_pkg
+from ..base import AsyncSearchMixin
 
 
-class ExaSearch:
+class ExaSearch(AsyncSearchMixin):
     """
     Exa API Retriever
     """
@@ -0,0 +1,120 @@
+"""
+Concurrent search across several retrievers.
+
+All retrievers are queried at once, each under its own timeout, so a
+multi-retriever setup costs about as much as its slowest retriever rather than
+the sum of all of them. Results are merged round-robin and deduplicated by
+normalized URL.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .cache import SearchCache, cached_search
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of `url` for deduplication: lowercase scheme and host, no
+    default port, fragment, tracking parameters or trailing slash, and sorted
+    query parameters.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{parts.port}"
+        query = urlencode(sorted(
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAMS)
+        ))
+        path = parts.path.rstrip("/")
+        return urlunsplit((scheme, host, path, query, ""))
+    except ValueError:
+        return url
+
+
+def merge_results(result_lists: Sequence[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Interleave results from several retrievers, keeping the first result for
+    each normalized URL. Results without an `href` are kept as they are.
+    """
+    merged, seen = [], set()
+    for rank in range(max((len(results) for results in result_lists), default=0)):
+        for results in result_lists:
+            if rank >= len(results):
+                continue
+            result = results[rank]
+            href = result.get("href")
+            if href:
+                key = normalize_url(href)
+                if key in seen:
+                    continue
+                seen.add(key)
+            merged.append(result)
+    return merged
+
+
+async def search_all(
+    retriever_classes: Sequence[Any],
+    query: str,
+    query_domains: List[str] | None = None,
+    max_results: int | None = None,
+    cache: SearchCache | None = None,
+    timeout: float | None = None,
+    first_k: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Query all retrievers concurrently and merge their results.
+
+    Args:
+        retriever_classes: Retriever classes to query.
+        query: The search query.
+        query_domains: Optional list of domains to restrict the search to.
+        max_results: Maximum results per retriever, None for each retriever's default.
+        cache: Optional search result cache.
+        timeout: Seconds to wait for each retriever. Slower retrievers are skipped.
+        first_k: Return as soon as this many unique results have arrived,
+            without waiting for the remaining retrievers. 0 waits for all.
+
+    Returns:
+        The merged, deduplicated results, in retriever order.
+    """
+    async def search(retriever_class):
+        try:
+            return await asyncio.wait_for(
+                cached_search(retriever_class, query, query_domains, max_results, cache),
+                timeout=timeout,
+            ) or []
+        except asyncio.TimeoutError:
+            logger.warning(f"{retriever_class.__name__} timed out after {timeout}s for '{query}'")
+        except Exception as e:
+            logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+        return []
+
+    tasks = [asyncio.create_task(search(retriever_class)) for retriever_class in retriever_classes]
+    try:
+        if first_k <= 0:
+            return merge_results(await asyncio.gather(*tasks))
+
+        pending = set(tasks)
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            done = [task.result() if task.done() else [] for task in tasks]
+            merged = merge_results(done)
+            if len(merged) >= first_k:
+                return merged
+        return merge_results([task.result() for task in tasks])
+    finally:
+        # With a cache, cancelled searches still complete in the background and fill it
+        for task in tasks:
+            task.cancel()
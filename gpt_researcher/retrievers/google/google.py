@@ -2,11 +2,12 @@
 
 # libraries
 import os
-import requests
+from ...utils.http import get_requests_session
 import json
+from ..base import AsyncSearchMixin
 
 
-class GoogleSearch:
+class GoogleSearch(AsyncSearchMixin):
     """
     Google API Retriever
     """
@@ -65,7 +66,7 @@ class GoogleSearch:
         print("Searching with query {0}...".format(search_query))
 
         url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
-        resp = requests.get(url)
+        resp = get_requests_session().get(url)
 
         if resp.status_code < 200 or resp.status_code >= 300:
             print("Google search: unexpected response status: ", resp.status_code)
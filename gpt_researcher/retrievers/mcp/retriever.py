@@ -198,6 +198,10 @@ class MCPRetriever:
             except Exception as e:
                 logger.error(f"Error during client cleanup: {e}")
 
+    async def asearch(self, max_results: int | None = None) -> List[Dict[str, str]]:
+        """Async search interface shared by all retrievers, see `search_async`."""
+        return await self.search_async(max_results if max_results is not None else 10)
+
     def search(self, max_results: int = 10) -> List[Dict[str, str]]:
         """
         Perform a search using MCP tools with intelligent two-stage approach.
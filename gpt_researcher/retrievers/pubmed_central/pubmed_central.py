@@ -1,10 +1,11 @@
 import os
 import xml.etree.ElementTree as ET
 
-import requests
+from ...utils.http import get_requests_session
+from ..base import AsyncSearchMixin
 
 
-class PubMedCentralSearch:
+class PubMedCentralSearch(AsyncSearchMixin):
     """
     PubMed Central API Retriever
     """
@@ -53,7 +54,7 @@ class PubMedCentralSearch:
             "retmode": "json",
             "sort": "relevance"
         }
-        response = requests.get(base_url, params=params)
+        response = get_requests_session().get(base_url, params=params)
 
         if response.status_code != 200:
             raise Exception(
@@ -96,7 +97,7 @@ class PubMedCentralSearch:
             "retmode": "xml",
             "api_key": self.api_key,
         }
-        response = requests.get(base_url, params=params)
+        response = get_requests_session().get(base_url, params=params)
 
         if response.status_code != 200:
             raise Exception(
@@ -2,11 +2,12 @@
 
 # libraries
 import os
-import requests
+from ...utils.http import get_requests_session
 import urllib.parse
+from ..base import AsyncSearchMixin
 
 
-class SearchApiSearch():
+class SearchApiSearch(AsyncSearchMixin):
     """
     SearchApi Retriever
     """
@@ -58,7 +59,7 @@ class SearchApiSearch():
         search_response = []
 
         try:
-            response = requests.get(encoded_url, headers=headers, timeout=20)
+            response = get_requests_session().get(encoded_url, headers=headers, timeout=20)
             if response.status_code == 200:
                 search_results = response.json()
                 if search_results:
@@ -4,8 +4,11 @@ import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 
+from ...utils.http import get_requests_session
+from ..base import AsyncSearchMixin
 
-class SearxSearch():
+
+class SearxSearch(AsyncSearchMixin):
     """
     SearxNG API Retriever
     """
@@ -54,7 +57,7 @@ class SearxSearch():
         }
 
         try:
-            response = requests.get(
+            response = get_requests_session().get(
                 search_url,
                 params=params,
                 headers={'Accept': 'application/json'}
@@ -2,8 +2,11 @@ from typing import Dict, List
 
 import requests
 
+from ...utils.http import get_requests_session
+from ..base import AsyncSearchMixin
 
-class SemanticScholarSearch:
+
+class SemanticScholarSearch(AsyncSearchMixin):
     """
     Semantic Scholar API Retriever
     """
@@ -37,7 +40,7 @@ class SemanticScholarSearch:
         }
 
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = get_requests_session().get(self.BASE_URL, params=params)
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"An error occurred while accessing Semantic Scholar API: {e}")
@@ -2,11 +2,12 @@
 
 # libraries
 import os
-import requests
+from ...utils.http import get_requests_session
 import urllib.parse
+from ..base import AsyncSearchMixin
 
 
-class SerpApiSearch():
+class SerpApiSearch(AsyncSearchMixin):
     """
     SerpApi Retriever
     """
@@ -56,7 +57,7 @@ class SerpApiSearch():
         encoded_url = url + "?" + urllib.parse.urlencode(params)
         search_response = []
         try:
-            response = requests.get(encoded_url, timeout=10)
+            response = get_requests_session().get(encoded_url, timeout=10)
             if response.status_code == 200:
                 search_results = response.json()
                 if search_results:
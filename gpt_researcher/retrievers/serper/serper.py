@@ -2,11 +2,12 @@
 
 # libraries
 import os
-import requests
+from ...utils.http import get_requests_session
 import json
+from ..base import AsyncSearchMixin
 
 
-class SerperSearch():
+class SerperSearch(AsyncSearchMixin):
     """
     Google Serper Retriever with support for country, language, and date filtering
     """
@@ -102,7 +103,7 @@ class SerperSearch():
 
         data = json.dumps(search_params)
 
-        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+        resp = get_requests_session().request("POST", url, timeout=10, headers=headers, data=data)
 
         # Preprocess the results
         if resp is None:
@@ -3,11 +3,12 @@
 # libraries
 import os
 from typing import Literal, Sequence, Optional
-import requests
+from ...utils.http import get_requests_session
 import json
+from ..base import AsyncSearchMixin
 
 
-class TavilySearch:
+class TavilySearch(AsyncSearchMixin):
     """
     Tavily API Retriever
     """
@@ -83,7 +84,7 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
-        response = requests.post(
+        response = get_requests_session().post(
             self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
         )
 
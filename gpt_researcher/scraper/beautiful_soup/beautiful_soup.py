@@ -1,13 +1,20 @@
-from bs4 import BeautifulSoup
+import asyncio
+
+import aiohttp
 from urllib.parse import urljoin
 
-from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from ..utils import extract_html
+from ...utils.http import get_aiohttp_session
 
 class BeautifulSoupScraper:
 
     def __init__(self, link, session=None):
         self.link = link
         self.session = session
+        # Extra request headers, such as the cache's conditional request headers
+        self.request_headers = {}
+        self.response_headers = {}
+        self.status = None
 
     def scrape(self):
         """
@@ -22,21 +29,40 @@ class BeautifulSoupScraper:
         """
         try:
             response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
+            self.response_headers = dict(response.headers)
+            self.status = response.status_code
+            return extract_html(response.content, response.encoding, self.link)
 
-            soup = clean_soup(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
 
-            content = get_text_from_soup(soup)
+    async def scrape_async(self, worker_pool=None):
+        """
+        Fetches the webpage with the shared aiohttp session and parses it off the event loop,
+        so no scraper worker thread is held while waiting on the network. With a `worker_pool`,
+        the raw bytes are parsed in its process pool, if enabled (`SCRAPER_PARSE_PROCESSES`).
 
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+        Returns:
+          tuple[str, list, str]: The cleaned content, relevant images and title of the page.
+        """
+        try:
+            headers = dict(self.session.headers) if self.session is not None else {}
+            headers.update(self.request_headers)
+            async with get_aiohttp_session().get(
+                self.link, headers=headers, timeout=aiohttp.ClientTimeout(total=4)
+            ) as response:
+                content = await response.read()
+                encoding = response.charset
+                self.response_headers = dict(response.headers)
+                self.status = response.status
+            if self.status == 304:
+                return "", [], ""
 
-            return content, image_urls, title
+            if worker_pool is not None:
+                return await worker_pool.run_cpu_bound(extract_html, content, encoding, self.link)
+            return await asyncio.to_thread(extract_html, content, encoding, self.link)
 
         except Exception as e:
             print("Error! : " + str(e))
-            return "", [], ""
\ No newline at end of file
+            return "", [], ""
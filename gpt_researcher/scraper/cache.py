@@ -0,0 +1,177 @@
+"""
+Cache of extracted page content.
+
+Entries hold what a scraper returned for a URL (`raw_content`, `image_urls`,
+`title`) together with the response's ETag / Last-Modified validators, keyed
+by URL and scraper type. Fresh entries skip both the fetch and the parse.
+For stale entries with validators, `lookup` returns the conditional request
+headers so that the scraper's own request (with its User-Agent, through the
+host scheduler) revalidates the page: on `304 Not Modified` the entry is
+refreshed and reused, on `200` the new response is scraped as usual.
+
+Entries are zlib-compressed JSON. They live in an in-memory LRU and, when a
+path is configured, in a SQLite file that is kept under a size limit by
+evicting the least recently used pages. SQLite access runs in a worker thread.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import zlib
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+from ..utils.cache import LRUCache, SQLiteCache
+
+
+class PageCache:
+    """Compressed cache of scraped pages with per-domain TTLs and HTTP revalidation."""
+
+    def __init__(
+        self,
+        ttl: int = 3600,
+        domain_ttls: Dict[str, int] | None = None,
+        max_size: int = 500,
+        path: str | None = None,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.ttl = ttl
+        # Longest suffix first so "docs.python.org" wins over "python.org"
+        self.domain_ttls = dict(
+            sorted((domain_ttls or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        )
+        self.memory = LRUCache(max_size)
+        self.store = SQLiteCache(path, table="pages") if path else None
+        self.max_bytes = max_bytes
+        self._writes = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(url: str, scraper_name: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8", errors="ignore")).hexdigest()
+        return f"{scraper_name}:{digest}"
+
+    def ttl_for(self, url: str) -> int:
+        host = (urlparse(url).hostname or "").lower()
+        for domain, ttl in self.domain_ttls.items():
+            if host == domain or host.endswith("." + domain):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(entry).encode("utf-8"))
+
+    @staticmethod
+    def _decode(blob: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(blob))
+
+    async def _run(self, func, *args):
+        # Only the SQLite store blocks, the in-memory LRU is cheap enough for the loop
+        if self.store is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _get_entry(self, key: str) -> Dict[str, Any] | None:
+        blob = self.memory.get(key)
+        if blob is None and self.store is not None:
+            blob = self.store.get(key)
+            if blob is not None:
+                self.memory.set(key, blob)
+                self.store.touch([key])
+        return self._decode(blob) if blob is not None else None
+
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        blob = self._encode(entry)
+        self.memory.set(key, blob)
+        if self.store is not None:
+            self.store.set(key, blob)
+            self._writes += 1
+            # Checking the size is a full table scan, so only do it every so often
+            if self._writes % 50 == 0:
+                self.store.evict(self.max_bytes)
+
+    @staticmethod
+    def _page(url: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "url": url,
+            "raw_content": entry["raw_content"],
+            "image_urls": entry["image_urls"],
+            "title": entry["title"],
+        }
+
+    async def set(self, url: str, scraper_name: str, page: Dict[str, Any], headers: Dict[str, str] | None = None) -> None:
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        await self._run(self._put_entry, self.make_key(url, scraper_name), {
+            "raw_content": page["raw_content"],
+            "image_urls": page.get("image_urls", []),
+            "title": page.get("title", ""),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "stored_at": time.time(),
+        })
+
+    async def lookup(self, url: str, scraper_name: str) -> tuple[Dict[str, Any] | None, Dict[str, str]]:
+        """
+        Look up `url` in the cache.
+
+        Returns:
+            The cached page when it is within its TTL, else None, along with
+            the conditional request headers (`If-None-Match`,
+            `If-Modified-Since`) to revalidate a stale page, if it has validators.
+        """
+        entry = await self._run(self._get_entry, self.make_key(url, scraper_name))
+        if entry is None:
+            self.misses += 1
+            return None, {}
+        if time.time() - entry["stored_at"] <= self.ttl_for(url):
+            self.hits += 1
+            return self._page(url, entry), {}
+
+        self.misses += 1
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return None, headers
+
+    async def refresh(self, url: str, scraper_name: str) -> Dict[str, Any] | None:
+        """Mark the page as revalidated (the origin answered 304) and return it."""
+        key = self.make_key(url, scraper_name)
+        entry = await self._run(self._get_entry, key)
+        if entry is None:
+            return None
+        entry["stored_at"] = time.time()
+        await self._run(self._put_entry, key, entry)
+        self.misses -= 1
+        self.revalidated += 1
+        return self._page(url, entry)
+
+
+_CACHES: dict[tuple, PageCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_page_cache(
+    ttl: int,
+    domain_ttls: Dict[str, int] | None = None,
+    path: str | None = None,
+    max_mb: int = 512,
+) -> PageCache | None:
+    """
+    Return the process-wide page cache for the given settings so that all
+    researchers share it. Returns None when caching is disabled (`ttl <= 0`).
+    """
+    if ttl <= 0:
+        return None
+    with _CACHES_LOCK:
+        key = (ttl, json.dumps(domain_ttls or {}, sort_keys=True), path, max_mb)
+        if key not in _CACHES:
+            _CACHES[key] = PageCache(
+                ttl=ttl, domain_ttls=domain_ttls, path=path, max_bytes=max_mb * 1024 * 1024
+            )
+        return _CACHES[key]
@@ -1,22 +1,75 @@
-import os
+import asyncio
 import requests
-import tempfile
+import aiohttp
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
+
+try:
+    import pymupdf
+except ImportError:  # PyMuPDF < 1.24.3
+    import fitz as pymupdf
+
+from ...utils.http import get_aiohttp_session
+
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_CHARS = 50000
+# Seconds to connect, and between two reads of the response
+SOCKET_TIMEOUT = 5
+# Slowest download, in bytes per second, that can still use the whole size cap
+MIN_DOWNLOAD_RATE = 256 * 1024
+
+
+class PDFTooLargeError(Exception):
+    """The PDF exceeds the download size cap."""
+
+
+def extract_pdf(content: bytes, max_chars: int = DEFAULT_MAX_CHARS) -> tuple[str, list[str], str]:
+    """
+    Extract the text of an in-memory PDF page by page, stopping once `max_chars`
+    characters have been collected (0 for no limit). Pages past the budget are
+    never parsed.
+
+    Kept at module level and returning plain values so that it can run in a
+    worker process (see `WorkerPool.run_cpu_bound`).
+
+    Returns:
+      tuple[str, list[str], str]: The text of the pages, images (none) and title.
+    """
+    with pymupdf.open(stream=content, filetype="pdf") as doc:
+        title = (doc.metadata or {}).get("title") or ""
+        pages, total = [], 0
+        for page in doc:
+            text = page.get_text().strip()
+            if not text:
+                continue
+            if max_chars and total + len(text) > max_chars:
+                if max_chars > total:
+                    pages.append(text[:max_chars - total])
+                break
+            pages.append(text)
+            total += len(text) + 2
+    return "\n\n".join(pages), [], title
 
 
 class PyMuPDFScraper:
 
-    def __init__(self, link, session=None):
+    def __init__(self, link, session=None, max_bytes: int = DEFAULT_MAX_BYTES, max_chars: int = DEFAULT_MAX_CHARS):
         """
         Initialize the scraper with a link and an optional session.
 
         Args:
           link (str): The URL or local file path of the PDF document.
           session (requests.Session, optional): An optional session for making HTTP requests.
+          max_bytes (int): PDFs larger than this are skipped without being downloaded in full (0 for no limit).
+          max_chars (int): Characters of text to extract, pages past it are not parsed (0 for no limit).
         """
         self.link = link
         self.session = session
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        # Extra request headers, such as the cache's conditional request headers
+        self.request_headers = {}
+        self.response_headers = {}
+        self.status = None
 
     def is_url(self) -> bool:
         """
@@ -31,36 +84,41 @@ class PyMuPDFScraper:
         except Exception:
             return False
 
+    def _timeout(self) -> aiohttp.ClientTimeout:
+        # Large PDFs need more than a few seconds in total, but a stalled connection should not
+        total = SOCKET_TIMEOUT + self.max_bytes / MIN_DOWNLOAD_RATE if self.max_bytes else None
+        return aiohttp.ClientTimeout(total=total, sock_connect=SOCKET_TIMEOUT, sock_read=SOCKET_TIMEOUT)
+
+    def _check_size(self, size: int) -> None:
+        if self.max_bytes and size > self.max_bytes:
+            raise PDFTooLargeError(f"PDF larger than {self.max_bytes} bytes")
+
     def scrape(self) -> tuple[str, list[str], str]:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        The `scrape` function downloads the PDF from the provided link (either URL or local file) into
+        memory, up to `max_bytes`, and extracts the text of its pages up to `max_chars` characters.
 
         Returns:
-          str: A string representation of the loaded document.
+          tuple[str, list[str], str]: The text of the document, images (none) and title.
         """
         try:
             if self.is_url():
-                response = requests.get(self.link, timeout=5, stream=True)
+                response = (self.session or requests).get(self.link, timeout=SOCKET_TIMEOUT, stream=True)
+                self.status = response.status_code
+                self.response_headers = dict(response.headers)
                 response.raise_for_status()
+                self._check_size(int(response.headers.get("Content-Length") or 0))
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
-
-                loader = PyMuPDFLoader(temp_filename)
-                doc = loader.load()
-
-                os.remove(temp_filename)
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    content.extend(chunk)
+                    self._check_size(len(content))
+                response.close()
             else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
+                with open(self.link, "rb") as f:
+                    content = f.read()
 
-            # Extract the content, image (if any), and title from the document.
-            image = []
-            # Retrieve the content of the first page to minimize embedding costs.
-            return doc[0].page_content, image, doc[0].metadata["title"]
+            return extract_pdf(bytes(content), self.max_chars)
 
         except requests.exceptions.Timeout:
             print(f"Download timed out. Please check the link : {self.link}")
@@ -68,3 +126,44 @@ class PyMuPDFScraper:
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
             return "", [], ""
+
+    async def scrape_async(self, worker_pool=None) -> tuple[str, list[str], str]:
+        """
+        Streams the PDF into memory with the shared aiohttp session, up to `max_bytes`, and
+        extracts its text off the event loop, in the `worker_pool` process pool when given.
+
+        Returns:
+          tuple[str, list[str], str]: The text of the document, images (none) and title.
+        """
+        if not self.is_url():
+            executor = worker_pool.executor if worker_pool is not None else None
+            return await asyncio.get_running_loop().run_in_executor(executor, self.scrape)
+
+        try:
+            headers = dict(self.session.headers) if self.session is not None else {}
+            headers.update(self.request_headers)
+            async with get_aiohttp_session().get(
+                self.link, headers=headers, timeout=self._timeout()
+            ) as response:
+                self.status = response.status
+                self.response_headers = dict(response.headers)
+                if response.status == 304:
+                    return "", [], ""
+                response.raise_for_status()
+                self._check_size(response.content_length or 0)
+
+                content = bytearray()
+                async for chunk in response.content.iter_chunked(65536):
+                    content.extend(chunk)
+                    self._check_size(len(content))
+
+            if worker_pool is not None:
+                return await worker_pool.run_cpu_bound(extract_pdf, bytes(content), self.max_chars)
+            return await asyncio.to_thread(extract_pdf, bytes(content), self.max_chars)
+
+        except asyncio.TimeoutError:
+            print(f"Download timed out. Please check the link : {self.link}")
+            return "", [], ""
+        except Exception as e:
+            print(f"Error loading PDF : {self.link} {e}")
+            return "", [], ""
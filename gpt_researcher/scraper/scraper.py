@@ -1,14 +1,18 @@
 import asyncio
+from contextlib import aclosing
 from colorama import Fore, init
 
-import requests
 import subprocess
 import sys
+import time
 import importlib
 import logging
 
+from gpt_researcher.utils.http import get_requests_session
 from gpt_researcher.utils.workers import WorkerPool
 
+from .cache import PageCache
+
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
@@ -26,15 +30,32 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(
+        self,
+        urls,
+        user_agent,
+        scraper,
+        worker_pool: WorkerPool,
+        page_cache: PageCache | None = None,
+        deadline: float = 0,
+        quorum_ratio: float = 0,
+        quorum_pages: int = 0,
+        pdf_max_bytes: int = 20 * 1024 * 1024,
+        pdf_max_chars: int = 50000,
+    ):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            page_cache: Optional cache of previously extracted pages
+            deadline: Seconds after which unfinished scrapes are cancelled (0 waits for all)
+            quorum_ratio: Stop once this fraction of the URLs has finished (0 disables)
+            quorum_pages: Stop once this many pages have been scraped successfully (0 disables)
+            pdf_max_bytes: PDFs larger than this are skipped (0 for no limit)
+            pdf_max_chars: Characters of text extracted from each PDF (0 for no limit)
         """
         self.urls = urls
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.session = get_requests_session(user_agent)
         self.scraper = scraper
         if self.scraper == "tavily_extract":
             self._check_pkg(self.scraper)
@@ -42,17 +63,75 @@ class Scraper:
             self._check_pkg(self.scraper)
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
+        self.page_cache = page_cache
+        self.deadline = deadline
+        self.quorum_ratio = quorum_ratio
+        self.quorum_pages = quorum_pages
+        self.pdf_max_bytes = pdf_max_bytes
+        self.pdf_max_chars = pdf_max_chars
+
+    def _create_tasks(self) -> list[asyncio.Task]:
+        return [
+            asyncio.create_task(self.extract_data_from_url(url, self.session, priority=rank))
+            for rank, url in enumerate(self.urls)
+        ]
+
+    def _quorum_reached(self, finished: int, scraped: int) -> bool:
+        if self.quorum_ratio and finished >= self.quorum_ratio * len(self.urls):
+            return True
+        return bool(self.quorum_pages) and scraped >= self.quorum_pages
 
     async def run(self):
         """
         Extracts the content from the links
+
+        Returns early with the pages scraped so far once the quorum is reached
+        or the deadline expires, cancelling the remaining scrapes.
         """
-        contents = await asyncio.gather(
-            *(self.extract_data_from_url(url, self.session) for url in self.urls)
-        )
+        if not (self.deadline or self.quorum_ratio or self.quorum_pages):
+            contents = await asyncio.gather(
+                *(self.extract_data_from_url(url, self.session, priority=rank) for rank, url in enumerate(self.urls))
+            )
+            return [content for content in contents if content["raw_content"] is not None]
+
+        scraped = []
+        async with aclosing(self.stream()) as pages:
+            async for page in pages:
+                scraped.append(page)
 
-        res = [content for content in contents if content["raw_content"] is not None]
-        return res
+        # Keep the search rank order, as without a deadline
+        rank = {url: i for i, url in enumerate(self.urls)}
+        return sorted(scraped, key=lambda page: rank.get(page["url"], len(rank)))
+
+    async def stream(self):
+        """
+        Yields the extracted content of each link as soon as it is scraped,
+        in completion order. Iteration ends when all links are done, the
+        quorum is reached or the deadline expires. Scrapes still pending then,
+        or when the consumer stops iterating, are cancelled.
+        """
+        tasks = self._create_tasks()
+        finished = scraped = 0
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=self.deadline or None):
+                try:
+                    content = await next_done
+                except asyncio.TimeoutError:
+                    pending = sum(not task.done() for task in tasks)
+                    self.logger.warning(f"Scrape deadline of {self.deadline}s reached, cancelling {pending} slow URLs")
+                    return
+                finished += 1
+                if content["raw_content"] is not None:
+                    scraped += 1
+                    yield content
+                if self._quorum_reached(finished, scraped):
+                    pending = sum(not task.done() for task in tasks)
+                    if pending:
+                        self.logger.info(f"Scrape quorum reached, cancelling {pending} remaining URLs")
+                    return
+        finally:
+            for task in tasks:
+                task.cancel()
 
     def _check_pkg(self, scrapper_name: str) -> None:
         """
@@ -87,14 +166,35 @@ class Scraper:
                     f"`pip install -U {pkg_inst_name}`"
                 )
 
-    async def extract_data_from_url(self, link, session):
+    async def extract_data_from_url(self, link, session, priority: int = 0):
         """
         Extracts the data from the link with logging
+
+        Links are scheduled per host by the worker pool; a lower `priority`
+        (the link's rank in the search results) is scraped first.
         """
-        async with self.worker_pool.throttle():
+        # Validators of a stale cached page, sent with the scraper's own request
+        conditional_headers = {}
+        if self.page_cache is not None:
+            try:
+                cached, conditional_headers = await self.page_cache.lookup(link, self.get_scraper(link).__name__)
+                if cached is not None:
+                    self.logger.info(f"Using cached content for {link}")
+                    return cached
+            except Exception as e:
+                self.logger.warning(f"Page cache lookup failed for {link}: {e}")
+
+        async with self.worker_pool.throttle(link, priority=priority):
             try:
                 Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
+                if Scraper is PyMuPDFScraper:
+                    scraper = Scraper(link, session, max_bytes=self.pdf_max_bytes, max_chars=self.pdf_max_chars)
+                else:
+                    scraper = Scraper(link, session)
+                if conditional_headers:
+                    # Scrapers that support it return early on 304 Not Modified
+                    scraper.request_headers = conditional_headers
+                started = time.monotonic()
 
                 # Get scraper name
                 scraper_name = scraper.__class__.__name__
@@ -102,7 +202,7 @@ class Scraper:
 
                 # Get content
                 if hasattr(scraper, "scrape_async"):
-                    content, image_urls, title = await scraper.scrape_async()
+                    content, image_urls, title = await scraper.scrape_async(self.worker_pool)
                 else:
                     (
                         content,
@@ -112,6 +212,21 @@ class Scraper:
                         self.worker_pool.executor, scraper.scrape
                     )
 
+                # Let the scheduler back off from hosts that rate limit or slow down
+                headers = getattr(scraper, "response_headers", None) or {}
+                self.worker_pool.report(
+                    link,
+                    status=getattr(scraper, "status", None),
+                    retry_after=headers.get("Retry-After") or headers.get("retry-after"),
+                    elapsed=time.monotonic() - started,
+                )
+
+                if conditional_headers and getattr(scraper, "status", None) == 304:
+                    cached = await self.page_cache.refresh(link, Scraper.__name__)
+                    if cached is not None:
+                        self.logger.info(f"Using revalidated cached content for {link}")
+                        return cached
+
                 if len(content) < 100:
                     self.logger.warning(f"Content too short or empty for {link}")
                     return {
@@ -139,12 +254,19 @@ class Scraper:
                         "title": title,
                     }
 
-                return {
+                result = {
                     "url": link,
                     "raw_content": content,
                     "image_urls": image_urls,
                     "title": title,
                 }
+                # Error pages, such as rate limit notices, are not kept
+                status = getattr(scraper, "status", None)
+                if self.page_cache is not None and (status is None or 200 <= status < 300):
+                    await self.page_cache.set(
+                        link, Scraper.__name__, result, getattr(scraper, "response_headers", None)
+                    )
+                return result
 
             except Exception as e:
                 self.logger.error(f"Error processing {link}: {str(e)}")
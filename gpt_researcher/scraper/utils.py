@@ -4,6 +4,7 @@ import logging
 import hashlib
 import re
 import bs4
+from lxml import etree
 
 def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
     """Extract relevant images from the page"""
@@ -16,26 +17,10 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         for img in all_images:
             img_src = urljoin(url, img['src'])
             if img_src.startswith(('http://', 'https://')):
-                score = 0
-                # Check for relevant classes
-                if any(cls in img.get('class', []) for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
-                    score = 4  # Higher score
-                # Check for size attributes
-                elif img.get('width') and img.get('height'):
-                    width = parse_dimension(img['width'])
-                    height = parse_dimension(img['height'])
-                    if width and height:
-                        if width >= 2000 and height >= 1000:
-                            score = 3  # Medium score (very large images)
-                        elif width >= 1600 or height >= 800:
-                            score = 2  # Lower score
-                        elif width >= 800 or height >= 500:
-                            score = 1  # Lowest score
-                        elif width >= 500 or height >= 300:
-                            score = 0  # Lowest score
-                        else:
-                            continue  # Skip small images
-                
+                score = score_image(img.get('class', []), img.get('width'), img.get('height'))
+                if score is None:
+                    continue  # Skip small images
+
                 image_urls.append({'url': img_src, 'score': score})
         
         # Sort images by score (highest first)
@@ -47,6 +32,28 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         logging.error(f"Error in get_relevant_images: {e}")
         return []
 
+def score_image(classes: list, width: str | None, height: str | None) -> int | None:
+    """Score an image by its classes and declared size, None for images too small to be relevant"""
+    # Check for relevant classes
+    if any(cls in classes for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
+        return 4  # Higher score
+    # Check for size attributes
+    if width and height:
+        width = parse_dimension(width)
+        height = parse_dimension(height)
+        if width and height:
+            if width >= 2000 and height >= 1000:
+                return 3  # Medium score (very large images)
+            elif width >= 1600 or height >= 800:
+                return 2  # Lower score
+            elif width >= 800 or height >= 500:
+                return 1  # Lowest score
+            elif width >= 500 or height >= 300:
+                return 0  # Lowest score
+            else:
+                return None
+    return 0
+
 def parse_dimension(value: str) -> int:
     """Parse dimension value, handling px units"""
     if value.lower().endswith('px'):
@@ -121,4 +128,75 @@ def get_text_from_soup(soup: BeautifulSoup) -> str:
     text = soup.get_text(strip=True, separator="\n")
     # Remove excess whitespace
     text = re.sub(r"\s{2,}", " ", text)
-    return text
\ No newline at end of file
+    return text
+
+
+_BOILERPLATE_TAGS = frozenset(["script", "style", "footer", "header", "nav", "menu", "sidebar", "svg"])
+_BOILERPLATE_CLASSES = frozenset(["nav", "menu", "sidebar", "footer"])
+
+
+def extract_html(content: bytes, encoding: str | None, url: str) -> tuple[str, list, str]:
+    """
+    Parse raw HTML and return its cleaned text, relevant images and title.
+
+    Equivalent to `clean_soup`, `get_text_from_soup`, `get_relevant_images` and
+    `extract_title` on a BeautifulSoup tree, but done in a single walk over an
+    lxml tree: boilerplate subtrees are skipped rather than removed, and text,
+    images and the title are collected on the way.
+
+    Kept at module level and returning plain values so that it can run in a
+    worker process (see `WorkerPool.run_cpu_bound`).
+    """
+    if not content or not content.strip():
+        return "", [], ""
+    try:
+        parser = etree.HTMLParser(encoding=encoding)
+    except LookupError:
+        # Unknown charset announced by the server, let lxml detect it
+        parser = etree.HTMLParser()
+    root = etree.fromstring(content, parser)
+    if root is None:
+        return "", [], ""
+
+    texts, images, title = [], [], None
+
+    def add_text(value):
+        value = value.strip()
+        if value:
+            texts.append(value)
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            add_text(node)
+            continue
+
+        # Tails belong to the parent, they are kept even when the node is dropped
+        if node.tail and node is not root:
+            stack.append(node.tail)
+        tag = node.tag
+        if not isinstance(tag, str):
+            continue  # Comments and processing instructions
+        classes = (node.get("class") or "").split()
+        if tag in _BOILERPLATE_TAGS or _BOILERPLATE_CLASSES.intersection(classes):
+            continue
+
+        if tag == "title" and title is None:
+            title = node.text or ""
+        elif tag == "img":
+            src = node.get("src")
+            if src is not None:
+                img_src = urljoin(url, src)
+                if img_src.startswith(("http://", "https://")):
+                    score = score_image(classes, node.get("width"), node.get("height"))
+                    if score is not None:
+                        images.append({"url": img_src, "score": score})
+
+        if node.text:
+            add_text(node.text)
+        stack.extend(reversed(node))
+
+    text = re.sub(r"\s{2,}", " ", "\n".join(texts))
+    images.sort(key=lambda x: x["score"], reverse=True)
+    return text, images[:10], title or ""
@@ -1,13 +1,21 @@
+import asyncio
+
+import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import requests
 from ..utils import get_relevant_images, extract_title
+from ...utils.http import get_aiohttp_session
 
 class WebBaseLoaderScraper:
 
     def __init__(self, link, session=None):
         self.link = link
         self.session = session or requests.Session()
+        # Extra request headers, such as the cache's conditional request headers
+        self.request_headers = {}
+        self.response_headers = {}
+        self.status = None
 
     def scrape(self) -> tuple:
         """
@@ -41,3 +49,38 @@ class WebBaseLoaderScraper:
         except Exception as e:
             print("Error! : " + str(e))
             return "", [], ""
+
+    async def scrape_async(self, worker_pool=None) -> tuple:
+        """
+        Fetches the page once with the shared aiohttp session and extracts the same text
+        WebBaseLoader would (BeautifulSoup `get_text` with the html.parser), along with
+        images and title, without holding a scraper worker thread while waiting on the network.
+        Parsing runs in the `worker_pool` executor when given.
+
+        Returns:
+          tuple[str, list, str]: The page content, relevant images and title.
+        """
+        try:
+            headers = dict(self.session.headers) if self.session is not None else {}
+            headers.update(self.request_headers)
+            async with get_aiohttp_session().get(
+                self.link, headers=headers, ssl=False, timeout=aiohttp.ClientTimeout(total=4)
+            ) as response:
+                html = await response.read()
+                self.response_headers = dict(response.headers)
+                self.status = response.status
+            if self.status == 304:
+                return "", [], ""
+
+            executor = worker_pool.executor if worker_pool is not None else None
+            return await asyncio.get_running_loop().run_in_executor(executor, self._parse, html)
+
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
+
+    def _parse(self, html: bytes) -> tuple:
+        soup = BeautifulSoup(html, 'html.parser')
+        image_urls = get_relevant_images(soup, self.link)
+        title = extract_title(soup)
+        return soup.get_text(), image_urls, title
@@ -1,16 +1,25 @@
+from contextlib import aclosing
+from typing import AsyncIterator
+
 from gpt_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
-from ..actions.web_scraping import scrape_urls
+from ..actions.web_scraping import scrape_urls, stream_urls
 from ..scraper.utils import get_image_hash
 
 
 class BrowserManager:
     """Manages context for the researcher agent."""
 
-    def __init__(self, researcher):
+    def __init__(self, researcher, worker_pool: WorkerPool | None = None):
         self.researcher = researcher
-        self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        # Child researchers share their parent's pool, and its per-host limits
+        self.worker_pool = worker_pool or WorkerPool(
+            researcher.cfg.max_scraper_workers,
+            max_per_host=researcher.cfg.scraper_max_per_host,
+            host_delay=researcher.cfg.scraper_host_delay,
+            parse_processes=researcher.cfg.scraper_parse_processes,
+        )
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -33,6 +42,40 @@ class BrowserManager:
         scraped_content, images = await scrape_urls(
             urls, self.researcher.cfg, self.worker_pool
         )
+        await self._add_scraped_results(scraped_content, images)
+        return scraped_content
+
+    async def browse_urls_stream(self, urls: list[str]) -> AsyncIterator[dict]:
+        """
+        Scrape content from a list of URLs, yielding each page as soon as it is scraped.
+
+        Sources and images are recorded once iteration finishes or is stopped early.
+
+        Args:
+            urls (list[str]): list of URLs to scrape.
+
+        Yields:
+            dict: scraped content of a single page.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "scraping_urls",
+                f"🌐 Scraping content from {len(urls)} URLs...",
+                self.researcher.websocket,
+            )
+
+        scraped_content, images = [], []
+        try:
+            async with aclosing(stream_urls(urls, self.researcher.cfg, self.worker_pool)) as pages:
+                async for page in pages:
+                    scraped_content.append(page)
+                    images.extend(page.get("image_urls", []))
+                    yield page
+        finally:
+            await self._add_scraped_results(scraped_content, images)
+
+    async def _add_scraped_results(self, scraped_content: list[dict], images: list[dict]) -> None:
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
@@ -59,8 +102,6 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        return scraped_content
-
     def select_top_images(self, images: list[dict], k: int = 2) -> list[str]:
         """
         Select most relevant images and remove duplicates based on image content.
@@ -1,8 +1,16 @@
 import asyncio
-from typing import List, Dict, Optional, Set
+import os
+from contextlib import aclosing
+from typing import AsyncIterator, List, Dict, Optional, Set
 
+from ..context.chunk_index import ChunkIndex
 from ..context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
 from ..actions.utils import stream_output
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import aestimate_embedding_cost
+
+# Most pages embedded in one request while streaming
+STREAMING_BATCH_PAGES = 4
 
 
 class ContextManager:
@@ -24,12 +32,133 @@ class ContextManager:
             documents=pages,
             embeddings=self.researcher.memory.get_embeddings(),
             prompt_family=self.researcher.prompt_family,
-            **self.researcher.kwargs
+            vector_index=self.researcher.cfg.vector_index,
         )
         return await context_compressor.async_get_context(
             query=query, max_results=10, cost_callback=self.researcher.add_costs
         )
 
+    async def get_similar_content_by_queries(
+        self, queries: List[str], pages: List[Dict], max_results: int = 10, chunk_index: ChunkIndex | None = None
+    ) -> List[str]:
+        """
+        Get relevant content for several queries over the same set of pages.
+
+        The pages are split and embedded once into a chunk index, and all queries
+        are scored against it in a single batch.
+
+        Args:
+            queries (List[str]): Queries to retrieve content for.
+            pages (List[Dict]): Shared documents with 'raw_content', 'url' and 'title'.
+            max_results (int): Maximum number of chunks per query.
+            chunk_index (ChunkIndex, optional): An index already holding `pages`, such as
+                the persistent local document index, queried as is.
+
+        Returns:
+            List[str]: The formatted context for each query, in order.
+        """
+        if chunk_index is None:
+            if self.researcher.verbose:
+                await stream_output(
+                    "logs",
+                    "indexing_documents",
+                    f"📚 Indexing {len(pages)} documents for {len(queries)} queries...",
+                    self.researcher.websocket,
+                )
+
+            chunk_index = ChunkIndex(self.researcher.memory.get_embeddings(), index_type=self.researcher.cfg.vector_index)
+            self.researcher.add_costs(await aestimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=pages))
+            await chunk_index.aadd_pages(pages)
+
+        similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
+        results = await chunk_index.asearch_many(queries, k=max_results, threshold=similarity_threshold)
+        return [self.researcher.prompt_family.pretty_print_docs(docs) for docs in results]
+
+    async def get_similar_content_by_query_streaming(
+        self,
+        query: str,
+        pages: AsyncIterator[Dict],
+        target_chunks: int = 0,
+        max_results: int = 10,
+    ) -> tuple[str, List[Dict]]:
+        """
+        Get relevant content while pages are still being scraped.
+
+        Pages are split and embedded as they arrive. Pages that arrive while
+        the previous ones are being embedded are embedded together, up to
+        `STREAMING_BATCH_PAGES` at a time. When `target_chunks` is positive,
+        consumption stops (and pending scrapes are cancelled) once that many
+        chunks score above the similarity threshold.
+
+        Args:
+            query (str): The query to retrieve content for.
+            pages (AsyncIterator[Dict]): Scraped pages, in completion order.
+            target_chunks (int): Relevant chunks after which to stop early. 0 disables.
+            max_results (int): Maximum number of chunks to return.
+
+        Returns:
+            tuple[str, List[Dict]]: The formatted context and the pages consumed.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "fetching_query_content",
+                f"📚 Getting relevant content based on query: {query}...",
+                self.researcher.websocket,
+            )
+
+        chunk_index = ChunkIndex(self.researcher.memory.get_embeddings(), index_type=self.researcher.cfg.vector_index)
+        similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
+        query_vector = await chunk_index.aembed_queries([query])
+
+        # Pages are read by a separate task so that the ones scraped meanwhile can be batched
+        arrived: asyncio.Queue = asyncio.Queue()
+        end_of_pages = object()
+
+        async def read_pages() -> None:
+            try:
+                async with aclosing(pages) as page_stream:
+                    async for page in page_stream:
+                        arrived.put_nowait(page)
+            finally:
+                arrived.put_nowait(end_of_pages)
+
+        reader = asyncio.create_task(read_pages())
+        scraped_pages = []
+        try:
+            finished = False
+            while not finished:
+                batch = [await arrived.get()]
+                while len(batch) < STREAMING_BATCH_PAGES and not arrived.empty():
+                    batch.append(arrived.get_nowait())
+                if batch[-1] is end_of_pages:
+                    batch.pop()
+                    finished = True
+                if not batch:
+                    continue
+
+                scraped_pages.extend(batch)
+                self.researcher.add_costs(await aestimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=batch))
+                await chunk_index.aadd_pages(batch)
+                if target_chunks and chunk_index.count_above(query_vector, similarity_threshold) >= target_chunks:
+                    if self.researcher.verbose:
+                        await stream_output(
+                            "logs",
+                            "enough_context",
+                            f"✅ Found enough relevant content for '{query}' after {len(scraped_pages)} pages",
+                            self.researcher.websocket,
+                        )
+                    break
+        finally:
+            reader.cancel()
+            # Surfaces errors of the page stream, once it is closed
+            reader_result = (await asyncio.gather(reader, return_exceptions=True))[0]
+        if isinstance(reader_result, Exception):
+            raise reader_result
+
+        relevant_docs = (await chunk_index.asearch_by_vectors(query_vector, max_results, similarity_threshold))[0]
+        return self.researcher.prompt_family.pretty_print_docs(relevant_docs), scraped_pages
+
     async def get_similar_content_by_query_with_vectorstore(self, query, filter):
         if self.researcher.verbose:
             await stream_output(
@@ -80,7 +209,7 @@ class ContextManager:
             documents=written_contents,
             embeddings=self.researcher.memory.get_embeddings(),
             similarity_threshold=similarity_threshold,
-            **self.researcher.kwargs
+            vector_index=self.researcher.cfg.vector_index,
         )
         return await written_content_compressor.async_get_context(
             query=query, max_results=max_results, cost_callback=self.researcher.add_costs
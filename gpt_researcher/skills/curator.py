@@ -2,6 +2,7 @@ from typing import Dict, Optional, List
 import json
 from ..config.config import Config
 from ..utils.llm import create_chat_completion
+from ..utils.llm_cache import get_llm_cache
 from ..actions import stream_output
 
 
@@ -50,6 +51,7 @@ class SourceCurator:
                 llm_provider=self.researcher.cfg.smart_llm_provider,
                 llm_kwargs=self.researcher.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs,
+                cache=get_llm_cache(self.researcher.cfg, "curate_sources"),
             )
 
             curated_sources = json.loads(response)
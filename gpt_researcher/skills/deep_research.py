@@ -8,31 +8,25 @@ from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
 from ..utils.enum import ReportType, ReportSource, Tone
 from ..actions.query_processing import get_search_results
+from ..actions.agent_creator import choose_agent
+from ..context.budget import context_token_budget, pack_blocks
 
 logger = logging.getLogger(__name__)
 
-# Maximum words allowed in context (25k words for safety margin)
-MAX_CONTEXT_WORDS = 25000
-
-def count_words(text: str) -> int:
-    """Count words in a text string"""
-    return len(text.split())
-
-def trim_context_to_word_limit(context_list: List[str], max_words: int = MAX_CONTEXT_WORDS) -> List[str]:
-    """Trim context list to stay within word limit while preserving most recent/relevant items"""
-    total_words = 0
-    trimmed_context = []
-
-    # Process in reverse to keep most recent items
-    for item in reversed(context_list):
-        words = count_words(item)
-        if total_words + words <= max_words:
-            trimmed_context.insert(0, item)  # Insert at start to maintain original order
-            total_words += words
-        else:
-            break
-
-    return trimmed_context
+# Maximum tokens of context kept across all research branches
+MAX_CONTEXT_TOKENS = 32000
+
+def trim_context_to_token_budget(context_list: List[str], cfg) -> List[str]:
+    """Trim context list to the smart LLM's token budget, preferring the most recent items"""
+    budget = min(MAX_CONTEXT_TOKENS, context_token_budget(cfg))
+    priority = range(len(context_list) - 1, -1, -1)
+    kept, report = pack_blocks(context_list, cfg.smart_llm_model, budget, priority)
+    if report["dropped_blocks"]:
+        logger.info(
+            f"Dropped {report['dropped_blocks']} context items "
+            f"({report['dropped_tokens']} of {report['total_tokens']} tokens) to fit {budget} tokens"
+        )
+    return [context_list[i] for i in kept]
 
 class ResearchProgress:
     def __init__(self, total_depth: int, total_breadth: int):
@@ -60,6 +54,19 @@ class DeepResearchSkill:
         self.research_sources = []  # Track all research sources
         self.context = []  # Track all context
 
+    async def _choose_agent(self) -> None:
+        if self.researcher.agent and self.researcher.role:
+            return
+        self.researcher.agent, self.researcher.role = await choose_agent(
+            query=self.researcher.query,
+            cfg=self.researcher.cfg,
+            parent_query=self.researcher.parent_query,
+            cost_callback=self.researcher.add_costs,
+            headers=self.researcher.headers,
+            prompt_family=self.researcher.prompt_family,
+            **self.researcher.kwargs
+        )
+
     async def generate_search_queries(self, query: str, num_queries: int = 3) -> List[Dict[str, str]]:
         """Generate SERP queries for research"""
         messages = [
@@ -97,7 +104,7 @@ class DeepResearchSkill:
     async def generate_research_plan(self, query: str, num_questions: int = 3) -> List[str]:
         """Generate follow-up questions to clarify research direction"""
         # Get initial search results to inform query generation
-        search_results = await get_search_results(query, self.researcher.retrievers[0])
+        search_results = await get_search_results(query, self.researcher.retrievers[0], researcher=self.researcher)
         logger.info(f"Initial web knowledge obtained: {len(search_results)} results")
 
         # Get current time for context
@@ -183,6 +190,65 @@ Format each question on a new line starting with 'Question: '"""}
             'citations': citations
         }
 
+    async def _research_query(
+            self,
+            serp_query: Dict[str, str],
+            semaphore: asyncio.Semaphore,
+            progress: ResearchProgress,
+            on_progress=None
+    ) -> Optional[Dict[str, Any]]:
+        """Research a single search query and extract its learnings and follow-up questions"""
+        async with semaphore:
+            try:
+                progress.current_query = serp_query['query']
+                if on_progress:
+                    on_progress(progress)
+
+                # Shares the configuration, embeddings, caches, scraper workers and role of the main
+                # researcher. Nodes do not query its MCP servers (see `create_child`).
+                researcher = self.researcher.create_child(
+                    query=serp_query['query'],
+                    report_type=ReportType.ResearchReport.value,
+                    report_source=ReportSource.Web.value,
+                    tone=self.tone,
+                    websocket=self.websocket,
+                    headers=self.headers,
+                    visited_urls=self.visited_urls
+                )
+
+                # Conduct research
+                context = await researcher.conduct_research()
+
+                # Get results and visited URLs
+                visited = researcher.visited_urls
+                sources = researcher.research_sources
+
+                # Process results to extract learnings and citations
+                results = await self.process_research_results(
+                    query=serp_query['query'],
+                    context=context
+                )
+
+                # Update progress
+                progress.completed_queries += 1
+                progress.current_breadth += 1
+                if on_progress:
+                    on_progress(progress)
+
+                return {
+                    'learnings': results['learnings'],
+                    'visited_urls': list(visited),
+                    'followUpQuestions': results['followUpQuestions'],
+                    'researchGoal': serp_query.get('researchGoal', ''),
+                    'citations': results['citations'],
+                    'context': context if context else "",
+                    'sources': sources if sources else []
+                }
+
+            except Exception as e:
+                logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
+                return None
+
     async def deep_research(
             self,
             query: str,
@@ -193,7 +259,14 @@ Format each question on a new line starting with 'Question: '"""}
             visited_urls: Set[str] = None,
             on_progress=None
     ) -> Dict[str, Any]:
-        """Conduct deep iterative research"""
+        """
+        Conduct deep iterative research.
+
+        The research tree is explored breadth-first under a single concurrency
+        limit: all queries of a level are dispatched together, and the follow-up
+        queries of a node are generated and started as soon as that node is done,
+        without waiting for its siblings. Results are combined in tree order.
+        """
         if learnings is None:
             learnings = []
         if citations is None:
@@ -202,13 +275,47 @@ Format each question on a new line starting with 'Question: '"""}
             visited_urls = set()
 
         progress = ResearchProgress(depth, breadth)
-
         if on_progress:
             on_progress(progress)
 
-        # Generate search queries
-        serp_queries = await self.generate_search_queries(query, num_queries=breadth)
-        progress.total_queries = len(serp_queries)
+        # Shared by every node of the tree
+        semaphore = asyncio.Semaphore(self.concurrency_limit)
+
+        async def explore(node_query: str, node_breadth: int, node_depth: int) -> List[Dict[str, Any]]:
+            serp_queries = await self.generate_search_queries(node_query, num_queries=node_breadth)
+            progress.total_queries += len(serp_queries)
+            if on_progress:
+                on_progress(progress)
+            branches = await asyncio.gather(*[
+                visit(serp_query, node_breadth, node_depth) for serp_query in serp_queries
+            ])
+            return [result for branch in branches for result in branch]
+
+        async def visit(serp_query: Dict[str, str], node_breadth: int, node_depth: int) -> List[Dict[str, Any]]:
+            result = await self._research_query(serp_query, semaphore, progress, on_progress)
+            if result is None:
+                return []
+            if node_depth <= 1:
+                return [result]
+
+            # Continue deeper from this node right away
+            progress.current_depth = max(progress.current_depth, depth - node_depth + 2)
+            if on_progress:
+                on_progress(progress)
+
+            # Create next query from research goal and follow-up questions
+            next_query = f"""
+                Previous research goal: {result['researchGoal']}
+                Follow-up questions: {' '.join(result['followUpQuestions'])}
+                """
+            try:
+                deeper_results = await explore(next_query, max(2, node_breadth // 2), node_depth - 1)
+            except Exception as e:
+                logger.error(f"Error researching follow-up questions of '{serp_query['query']}': {str(e)}")
+                deeper_results = []
+            return [result] + deeper_results
+
+        results = await explore(query, breadth, depth)
 
         all_learnings = learnings.copy()
         all_citations = citations.copy()
@@ -216,71 +323,6 @@ Format each question on a new line starting with 'Question: '"""}
         all_context = []
         all_sources = []
 
-        # Process queries with concurrency limit
-        semaphore = asyncio.Semaphore(self.concurrency_limit)
-
-        async def process_query(serp_query: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            async with semaphore:
-                try:
-                    progress.current_query = serp_query['query']
-                    if on_progress:
-                        on_progress(progress)
-
-                    from .. import GPTResearcher
-                    researcher = GPTResearcher(
-                        query=serp_query['query'],
-                        report_type=ReportType.ResearchReport.value,
-                        report_source=ReportSource.Web.value,
-                        tone=self.tone,
-                        websocket=self.websocket,
-                        config_path=self.config_path,
-                        headers=self.headers,
-                        visited_urls=self.visited_urls
-                    )
-
-                    # Conduct research
-                    context = await researcher.conduct_research()
-
-                    # Get results and visited URLs
-                    visited = researcher.visited_urls
-                    sources = researcher.research_sources
-
-                    # Process results to extract learnings and citations
-                    results = await self.process_research_results(
-                        query=serp_query['query'],
-                        context=context
-                    )
-
-                    # Update progress
-                    progress.completed_queries += 1
-                    progress.current_breadth += 1
-                    if on_progress:
-                        on_progress(progress)
-
-                    return {
-                        'learnings': results['learnings'],
-                        'visited_urls': list(visited),
-                        'followUpQuestions': results['followUpQuestions'],
-                        'researchGoal': serp_query['researchGoal'],
-                        'citations': results['citations'],
-                        'context': context if context else "",
-                        'sources': sources if sources else []
-                    }
-
-                except Exception as e:
-                    logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
-                    return None
-
-        # Process queries concurrently with limit
-        tasks = [process_query(query) for query in serp_queries]
-        results = await asyncio.gather(*tasks)
-        results = [r for r in results if r is not None]
-
-        # Update breadth progress based on successful queries
-        progress.current_breadth = len(results)
-        if on_progress:
-            on_progress(progress)
-
         # Collect all results
         for result in results:
             all_learnings.extend(result['learnings'])
@@ -291,44 +333,13 @@ Format each question on a new line starting with 'Question: '"""}
             if result['sources']:
                 all_sources.extend(result['sources'])
 
-            # Continue deeper if needed
-            if depth > 1:
-                new_breadth = max(2, breadth // 2)
-                new_depth = depth - 1
-                progress.current_depth += 1
-
-                # Create next query from research goal and follow-up questions
-                next_query = f"""
-                Previous research goal: {result['researchGoal']}
-                Follow-up questions: {' '.join(result['followUpQuestions'])}
-                """
-
-                # Recursive research
-                deeper_results = await self.deep_research(
-                    query=next_query,
-                    breadth=new_breadth,
-                    depth=new_depth,
-                    learnings=all_learnings,
-                    citations=all_citations,
-                    visited_urls=all_visited_urls,
-                    on_progress=on_progress
-                )
-
-                all_learnings = deeper_results['learnings']
-                all_visited_urls.update(deeper_results['visited_urls'])
-                all_citations.update(deeper_results['citations'])
-                if deeper_results.get('context'):
-                    all_context.extend(deeper_results['context'])
-                if deeper_results.get('sources'):
-                    all_sources.extend(deeper_results['sources'])
-
         # Update class tracking
         self.context.extend(all_context)
         self.research_sources.extend(all_sources)
 
-        # Trim context to stay within word limits
-        trimmed_context = trim_context_to_word_limit(all_context)
-        logger.info(f"Trimmed context from {len(all_context)} items to {len(trimmed_context)} items to stay within word limit")
+        # Trim context to stay within the token budget, tokenizing off the event loop
+        trimmed_context = await asyncio.to_thread(trim_context_to_token_budget, all_context, self.researcher.cfg)
+        logger.info(f"Trimmed context from {len(all_context)} items to {len(trimmed_context)} items to stay within token budget")
 
         return {
             'learnings': list(set(all_learnings)),
@@ -345,7 +356,11 @@ Format each question on a new line starting with 'Question: '"""}
         # Log initial costs
         initial_costs = self.researcher.get_costs()
 
-        follow_up_questions = await self.generate_research_plan(self.researcher.query)
+        # Choose the agent once, for every node of the research tree
+        follow_up_questions, _ = await asyncio.gather(
+            self.generate_research_plan(self.researcher.query),
+            self._choose_agent(),
+        )
         answers = ["Automatically proceeding with research"] * len(follow_up_questions)
 
         qa_pairs = [f"Q: {q}\nA: {a}" for q, a in zip(follow_up_questions, answers)]
@@ -383,8 +398,10 @@ Format each question on a new line starting with 'Question: '"""}
         if results.get('context'):
             context_with_citations.extend(results['context'])
 
-        # Trim final context to word limit
-        final_context = trim_context_to_word_limit(context_with_citations)
+        # Trim final context to the token budget
+        final_context = await asyncio.to_thread(
+            trim_context_to_token_budget, context_with_citations, self.researcher.cfg
+        )
         
         # Set enhanced context and visited URLs
         self.researcher.context = "\n".join(final_context)
@@ -1,13 +1,16 @@
 import asyncio
-import random
 import logging
 import os
 from ..actions.utils import stream_output
 from ..actions.query_processing import plan_research_outline, get_search_results
+from ..retrievers.fanout import search_all
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
 from ..utils.enum import ReportSource, ReportType
 from ..utils.logging_config import get_json_handler
 from ..actions.agent_creator import choose_agent
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import aestimate_embedding_cost
+from ..vector_store.local_index import LocalVectorIndex, open_local_index
 
 
 class ResearchConductor:
@@ -128,21 +131,28 @@ class ResearchConductor:
             research_data = await self._get_context_by_web_search(self.researcher.query, [], self.researcher.query_domains)
         elif self.researcher.report_source == ReportSource.Local.value:
             self.logger.info("Using local search")
-            document_data = await DocumentLoader(self.researcher.cfg.doc_path).load()
+            document_data = await self._load_documents(self.researcher.cfg.doc_path)
             self.logger.info(f"Loaded {len(document_data)} documents")
             if self.researcher.vector_store:
                 self.researcher.vector_store.load(document_data)
+            local_index = await self._get_local_index(document_data)
 
-            research_data = await self._get_context_by_web_search(self.researcher.query, document_data, self.researcher.query_domains)
+            research_data = await self._get_context_by_web_search(
+                self.researcher.query, document_data, self.researcher.query_domains, chunk_index=local_index
+            )
         # Hybrid search including both local documents and web sources
         elif self.researcher.report_source == ReportSource.Hybrid.value:
+            local_index = None
             if self.researcher.document_urls:
                 document_data = await OnlineDocumentLoader(self.researcher.document_urls).load()
             else:
-                document_data = await DocumentLoader(self.researcher.cfg.doc_path).load()
+                document_data = await self._load_documents(self.researcher.cfg.doc_path)
+                local_index = await self._get_local_index(document_data)
             if self.researcher.vector_store:
                 self.researcher.vector_store.load(document_data)
-            docs_context = await self._get_context_by_web_search(self.researcher.query, document_data, self.researcher.query_domains)
+            docs_context = await self._get_context_by_web_search(
+                self.researcher.query, document_data, self.researcher.query_domains, chunk_index=local_index
+            )
             web_context = await self._get_context_by_web_search(self.researcher.query, [], self.researcher.query_domains)
             research_data = self.researcher.prompt_family.join_local_web_documents(docs_context, web_context)
         elif self.researcher.report_source == ReportSource.Azure.value:
@@ -152,7 +162,7 @@ class ResearchConductor:
                 connection_string=os.getenv("AZURE_CONNECTION_STRING")
             )
             azure_files = await azure_loader.load()
-            document_data = await DocumentLoader(azure_files).load()  # Reuse existing loader
+            document_data = await self._load_documents(azure_files)  # Reuse existing loader
             research_data = await self._get_context_by_web_search(self.researcher.query, document_data)
             
         elif self.researcher.report_source == ReportSource.LangChainDocuments.value:
@@ -187,6 +197,34 @@ class ResearchConductor:
         self.logger.info(f"Research completed. Context size: {len(str(self.researcher.context))}")
         return self.researcher.context
 
+    async def _load_documents(self, path) -> list:
+        """Loads local documents, reusing those parsed before if unchanged"""
+        cfg = self.researcher.cfg
+        return await DocumentLoader(
+            path, cache_path=cfg.doc_cache_path, processes=cfg.doc_parse_processes
+        ).load()
+
+    async def _get_local_index(self, document_data: list) -> LocalVectorIndex | None:
+        """
+        Opens the persistent index of local documents, when configured, and brings it
+        up to date with `document_data`. Only new or changed documents are embedded.
+        """
+        cfg = self.researcher.cfg
+        if not cfg.local_index_path:
+            return None
+        local_index = await asyncio.to_thread(
+            open_local_index,
+            cfg.local_index_path,
+            self.researcher.memory.get_embeddings(),
+            f"{cfg.embedding_provider}:{cfg.embedding_model}",
+            cfg.vector_index,
+        )
+        added = await local_index.aupdate_pages(document_data)
+        if added:
+            self.researcher.add_costs(await aestimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=added))
+        self.logger.info(f"Local index has {len(local_index)} chunks, {len(added)} documents newly embedded")
+        return local_index
+
     async def _get_context_by_urls(self, urls):
         """Scrapes and compresses the context from the given urls"""
         self.logger.info(f"Getting context from URLs: {urls}")
@@ -240,9 +278,12 @@ class ResearchConductor:
         )
         return context
 
-    async def _get_context_by_web_search(self, query, scraped_data: list | None = None, query_domains: list | None = None):
+    async def _get_context_by_web_search(
+        self, query, scraped_data: list | None = None, query_domains: list | None = None, chunk_index=None
+    ):
         """
-        Generates the context for the research task by searching the query and scraping the results
+        Generates the context for the research task by searching the query and scraping the results.
+        When `chunk_index` already holds `scraped_data`, it is queried instead of indexing them again.
         Returns:
             context: List of context
         """
@@ -323,10 +364,17 @@ class ResearchConductor:
 
         # Using asyncio.gather to process the sub_queries asynchronously
         try:
+            # Shared documents are indexed once and scored against all sub-queries together
+            precomputed_contexts = [None] * len(sub_queries)
+            if scraped_data:
+                precomputed_contexts = await self.researcher.context_manager.get_similar_content_by_queries(
+                    sub_queries, scraped_data, chunk_index=chunk_index
+                )
+
             context = await asyncio.gather(
                 *[
-                    self._process_sub_query(sub_query, scraped_data, query_domains)
-                    for sub_query in sub_queries
+                    self._process_sub_query(sub_query, scraped_data, query_domains, precomputed_context)
+                    for sub_query, precomputed_context in zip(sub_queries, precomputed_contexts)
                 ]
             )
             self.logger.info(f"Gathered context from {len(context)} sub-queries")
@@ -423,8 +471,18 @@ class ResearchConductor:
         
         return all_mcp_context
 
-    async def _process_sub_query(self, sub_query: str, scraped_data: list = [], query_domains: list = []):
-        """Takes in a sub query and scrapes urls based on it and gathers context."""
+    async def _process_sub_query(
+        self,
+        sub_query: str,
+        scraped_data: list = [],
+        query_domains: list = [],
+        precomputed_context: str | None = None,
+    ):
+        """Takes in a sub query and scrapes urls based on it and gathers context.
+
+        If `precomputed_context` is given (content already retrieved from a shared
+        chunk index), it is used instead of compressing `scraped_data` again.
+        """
         if self.json_handler:
             self.json_handler.log_event("sub_query", {
                 "query": sub_query,
@@ -495,12 +553,18 @@ class ResearchConductor:
                     mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
             
             # Get web search context using non-MCP retrievers (if no scraped data provided)
-            if not scraped_data:
+            if not scraped_data and precomputed_context is None and self.researcher.cfg.scrape_streaming:
+                # Compress pages as they arrive instead of waiting for the slowest one
+                precomputed_context, scraped_data = await self._scrape_and_compress_streaming(sub_query, query_domains)
+                self.logger.info(f"Scraped data size: {len(scraped_data)}")
+            elif not scraped_data:
                 scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
                 self.logger.info(f"Scraped data size: {len(scraped_data)}")
 
             # Get similar content based on scraped data
-            if scraped_data:
+            if precomputed_context is not None:
+                web_context = precomputed_context
+            elif scraped_data:
                 web_context = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
                 self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
 
@@ -730,31 +794,29 @@ class ResearchConductor:
         if query_domains is None:
             query_domains = []
 
-        # Iterate through the currently set retrievers
+        # Query the currently set retrievers concurrently
         # This allows the method to work when retrievers are temporarily modified
-        for retriever_class in self.researcher.retrievers:
-            # Skip MCP retrievers as they don't provide URLs for scraping
-            if "mcpretriever" in retriever_class.__name__.lower():
-                continue
-                
-            try:
-                # Instantiate the retriever with the sub-query
-                retriever = retriever_class(query, query_domains=query_domains)
-
-                # Perform the search using the current retriever
-                search_results = await asyncio.to_thread(
-                    retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
-                )
+        # MCP retrievers are skipped as they don't provide URLs for scraping
+        retriever_classes = [
+            retriever_class for retriever_class in self.researcher.retrievers
+            if "mcpretriever" not in retriever_class.__name__.lower()
+        ]
+        search_results = await search_all(
+            retriever_classes,
+            query,
+            query_domains=query_domains,
+            max_results=self.researcher.cfg.max_search_results_per_query,
+            cache=self.researcher.search_cache,
+            timeout=self.researcher.cfg.retriever_timeout or None,
+            first_k=self.researcher.cfg.retriever_first_k,
+        )
 
-                # Collect new URLs from search results
-                search_urls = [url.get("href") for url in search_results if url.get("href")]
-                new_search_urls.extend(search_urls)
-            except Exception as e:
-                self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+        # Collect new URLs from search results
+        new_search_urls.extend(result.get("href") for result in search_results if result.get("href"))
 
         # Get unique URLs
+        # Keep the search rank order, the worker pool scrapes better ranked URLs first
         new_search_urls = await self._get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
 
         return new_search_urls
 
@@ -790,6 +852,43 @@ class ResearchConductor:
 
         return scraped_content
 
+    async def _scrape_and_compress_streaming(self, sub_query, query_domains: list | None = None) -> tuple[str, list]:
+        """
+        Searches for a sub-query and compresses each scraped page as soon as it arrives.
+
+        Scraping stops early once the context manager has found
+        `STREAMING_TARGET_CHUNKS` relevant chunks (when configured).
+
+        Args:
+            sub_query (str): The sub-query to search for.
+
+        Returns:
+            tuple[str, list]: The relevant context and the pages scraped before stopping.
+        """
+        if query_domains is None:
+            query_domains = []
+
+        new_search_urls = await self._search_relevant_source_urls(sub_query, query_domains)
+
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "researching",
+                f"🤔 Researching for relevant information across multiple sources...\n",
+                self.researcher.websocket,
+            )
+
+        web_context, scraped_content = await self.researcher.context_manager.get_similar_content_by_query_streaming(
+            sub_query,
+            self.researcher.scraper_manager.browse_urls_stream(new_search_urls),
+            target_chunks=self.researcher.cfg.streaming_target_chunks,
+        )
+
+        if self.researcher.vector_store:
+            self.researcher.vector_store.load(scraped_content)
+
+        return web_context, scraped_content
+
     async def _search(self, retriever, query):
         """
         Perform a search using the specified retriever.
@@ -0,0 +1,175 @@
+"""
+Small, dependency-free cache primitives shared by the research pipeline.
+
+`LRUCache` is a thread-safe in-memory cache and `SQLiteCache` is an on-disk
+key/value store that can be shared across processes. Both store raw values
+and support an optional time-to-live per entry.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with optional per-entry TTL."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: OrderedDict[Any, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        if self.max_size <= 0:
+            return
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Key/value store backed by a single SQLite table.
+
+    The database runs in WAL mode so several researcher processes can read and
+    write the same file concurrently. Values are stored as BLOBs; callers are
+    responsible for serialization.
+    """
+
+    def __init__(self, path: str, table: str = "cache"):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        keys = list(keys)
+        found: dict[str, bytes] = {}
+        now = time.time()
+        with self._lock:
+            # SQLite limits the number of bound parameters per statement
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value, expires_at FROM {self.table} WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, value, expires_at in rows:
+                    if expires_at is None or expires_at >= now:
+                        found[key] = value
+        return found
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(self, items: dict[str, bytes], ttl: float | None = None) -> None:
+        if not items:
+            return
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, sqlite3.Binary(value), expires_at, now) for key, value in items.items()],
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def touch(self, keys: Iterable[str]) -> None:
+        """Mark entries as recently used so `evict` keeps them."""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                [(now, key) for key in keys],
+            )
+            self._conn.commit()
+
+    def evict(self, max_bytes: int) -> int:
+        """
+        Delete least recently used rows until the stored values fit in
+        `max_bytes`. Returns how many rows were deleted.
+        """
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {self.table}"
+            ).fetchone()[0]
+            if total <= max_bytes:
+                return 0
+            evicted = []
+            rows = self._conn.execute(
+                f"SELECT key, LENGTH(value) FROM {self.table} ORDER BY accessed_at"
+            ).fetchall()
+            for key, size in rows:
+                if total <= max_bytes:
+                    break
+                evicted.append((key,))
+                total -= size
+            self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", evicted)
+            self._conn.commit()
+            return len(evicted)
+
+    def purge_expired(self) -> int:
+        """Remove expired rows and return how many were deleted."""
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,25 +1,66 @@
-import tiktoken
+import asyncio
+from typing import Any, Iterable, Mapping
+
+from .tokens import get_encoding
 
 # Per OpenAI Pricing Page: https://openai.com/api/pricing/
-ENCODING_MODEL = "o200k_base"
 INPUT_COST_PER_TOKEN = 0.000005
 OUTPUT_COST_PER_TOKEN = 0.000015
 IMAGE_INFERENCE_COST = 0.003825
 EMBEDDING_COST = 0.02 / 1000000 # Assumes new ada-3-small
 
+# Above this many characters, token counts are estimated from length instead of tokenizing
+MAX_TOKENIZED_CHARS = 2_000_000
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Fast length-based token estimate (~4 characters per token for English text)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def count_tokens_batch(texts: list[str], model: str | None = None) -> int:
+    """Total tokens of `texts`, tokenized in one batch, or estimated from length when very large."""
+    if sum(len(text) for text in texts) > MAX_TOKENIZED_CHARS:
+        return sum(estimate_tokens(text) for text in texts)
+    return sum(len(tokens) for tokens in get_encoding(model).encode_ordinary_batch(texts))
+
 
 # Cost estimation is via OpenAI libraries and models. May vary for other models
-def estimate_llm_cost(input_content: str, output_content: str) -> float:
-    encoding = tiktoken.get_encoding(ENCODING_MODEL)
-    input_tokens = encoding.encode(input_content)
-    output_tokens = encoding.encode(output_content)
-    input_costs = len(input_tokens) * INPUT_COST_PER_TOKEN
-    output_costs = len(output_tokens) * OUTPUT_COST_PER_TOKEN
+def estimate_llm_cost(input_content: str, output_content: str, usage: Mapping[str, Any] | None = None) -> float:
+    """
+    Estimate the cost of an LLM call. Token counts reported by the provider
+    (LangChain `usage_metadata`) are used when given, otherwise the input and
+    output are tokenized.
+    """
+    if usage and usage.get("input_tokens") is not None:
+        input_tokens = usage["input_tokens"]
+        output_tokens = usage.get("output_tokens") or 0
+    else:
+        encoding = get_encoding()
+        if len(input_content) + len(output_content) > MAX_TOKENIZED_CHARS:
+            input_tokens, output_tokens = estimate_tokens(input_content), estimate_tokens(output_content)
+        else:
+            input_tokens, output_tokens = (
+                len(tokens) for tokens in encoding.encode_ordinary_batch([input_content, output_content])
+            )
+    input_costs = input_tokens * INPUT_COST_PER_TOKEN
+    output_costs = output_tokens * OUTPUT_COST_PER_TOKEN
     return input_costs + output_costs
 
 
-def estimate_embedding_cost(model, docs):
-    encoding = tiktoken.encoding_for_model(model)
-    total_tokens = sum(len(encoding.encode(str(doc))) for doc in docs)
+async def aestimate_llm_cost(input_content: str, output_content: str, usage: Mapping[str, Any] | None = None) -> float:
+    """`estimate_llm_cost` that tokenizes in a worker thread when there is no usage metadata."""
+    if usage and usage.get("input_tokens") is not None:
+        return estimate_llm_cost(input_content, output_content, usage)
+    return await asyncio.to_thread(estimate_llm_cost, input_content, output_content)
+
+
+def estimate_embedding_cost(model, docs: Iterable[Any]) -> float:
+    total_tokens = count_tokens_batch([str(doc) for doc in docs], model)
     return total_tokens * EMBEDDING_COST
 
+
+async def aestimate_embedding_cost(model, docs: Iterable[Any]) -> float:
+    """`estimate_embedding_cost` that tokenizes in a worker thread."""
+    return await asyncio.to_thread(estimate_embedding_cost, model, list(docs))
@@ -0,0 +1,83 @@
+"""
+Process-wide HTTP clients shared by scrapers, retrievers and document loaders.
+
+Reusing connections avoids a TCP/TLS handshake per request and keeps the
+number of open sockets bounded under concurrent research runs.
+
+- `get_aiohttp_session()` returns one `aiohttp.ClientSession` per event loop,
+  with keep-alive, a global and per-host connection limit and a DNS cache.
+- `get_requests_session()` returns a pooled `requests.Session` for code that
+  still has to make blocking calls (e.g. retrievers run in a worker thread).
+
+Limits can be tuned with the HTTP_MAX_CONNECTIONS, HTTP_MAX_CONNECTIONS_PER_HOST
+and HTTP_DNS_CACHE_TTL environment variables.
+"""
+import asyncio
+import os
+import threading
+import weakref
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", 8))
+HTTP_DNS_CACHE_TTL = int(os.environ.get("HTTP_DNS_CACHE_TTL", 300))
+HTTP_KEEPALIVE_TIMEOUT = 30
+
+_aiohttp_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+_requests_sessions: dict[str | None, requests.Session] = {}
+_requests_lock = threading.Lock()
+
+
+def get_aiohttp_session() -> aiohttp.ClientSession:
+    """
+    Return the shared `aiohttp.ClientSession` for the running event loop.
+
+    Sessions are bound to the loop they were created on, so each loop gets its
+    own. Callers must not close the returned session; use `close_http_sessions`.
+    """
+    loop = asyncio.get_running_loop()
+    session = _aiohttp_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_MAX_CONNECTIONS,
+            limit_per_host=HTTP_MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _aiohttp_sessions[loop] = session
+    return session
+
+
+def get_requests_session(user_agent: str | None = None) -> requests.Session:
+    """Return a process-wide pooled `requests.Session`, one per User-Agent."""
+    with _requests_lock:
+        session = _requests_sessions.get(user_agent)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_MAX_CONNECTIONS,
+                pool_maxsize=HTTP_MAX_CONNECTIONS_PER_HOST,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if user_agent:
+                session.headers.update({"User-Agent": user_agent})
+            _requests_sessions[user_agent] = session
+        return session
+
+
+async def close_http_sessions() -> None:
+    """Close the shared session of the running event loop and all pooled `requests` sessions."""
+    session = _aiohttp_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+    with _requests_lock:
+        for requests_session in _requests_sessions.values():
+            requests_session.close()
+        _requests_sessions.clear()
@@ -1,6 +1,7 @@
 # libraries
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Any
 
@@ -10,14 +11,24 @@ from langchain.prompts import PromptTemplate
 from gpt_researcher.llm_provider.generic.base import NO_SUPPORT_TEMPERATURE_MODELS, SUPPORT_REASONING_EFFORT_MODELS, ReasoningEfforts
 
 from ..prompts import PromptFamily
-from .costs import estimate_llm_cost
+from .costs import aestimate_llm_cost
+from .llm_cache import LLMResponseCache, get_llm_cache
 from .validators import Subtopics
 import os
 
 
 def get_llm(llm_provider, **kwargs):
     from gpt_researcher.llm_provider import GenericLLMProvider
-    return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+    return GenericLLMProvider.get_or_create(llm_provider, **kwargs)
+
+
+def _accepts_cache_hit(callback: callable) -> bool:
+    """Whether `callback` can be called with `cache_hit=True`."""
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "cache_hit" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters)
 
 
 async def create_chat_completion(
@@ -31,6 +42,7 @@ async def create_chat_completion(
         llm_kwargs: dict[str, Any] | None = None,
         cost_callback: callable = None,
         reasoning_effort: str | None = ReasoningEfforts.Medium.value,
+        cache: LLMResponseCache | None = None,
         **kwargs
 ) -> str:
     """Create a chat completion using the OpenAI API
@@ -45,6 +57,10 @@ async def create_chat_completion(
         llm_kwargs (dict[str, Any], optional): Additional LLM keyword arguments. Defaults to None.
         cost_callback: Callback function for updating cost.
         reasoning_effort (str, optional): Reasoning effort for OpenAI's reasoning models. Defaults to 'low'.
+        cache (LLMResponseCache, optional): Response cache to reuse identical requests. Responses
+            streamed to a websocket are never served from the cache. On a hit, nothing is spent:
+            `cost_callback` is only called, with the estimated cost that was avoided and
+            `cache_hit=True`, if it accepts a `cache_hit` argument.
         **kwargs: Additional keyword arguments.
     Returns:
         str: The response from the chat completion.
@@ -77,6 +93,15 @@ async def create_chat_completion(
         if base_url:
             provider_kwargs['openai_api_base'] = base_url
 
+    cache_key = None
+    if cache is not None and not (stream and websocket is not None):
+        cache_key = cache.make_key(llm_provider, provider_kwargs, messages)
+        response = cache.get(cache_key)
+        if response is not None:
+            if cost_callback and _accepts_cache_hit(cost_callback):
+                cost_callback(await aestimate_llm_cost(str(messages), response), cache_hit=True)
+            return response
+
     provider = get_llm(llm_provider, **provider_kwargs)
     response = ""
     # create response
@@ -86,9 +111,12 @@ async def create_chat_completion(
         )
 
         if cost_callback:
-            llm_costs = estimate_llm_cost(str(messages), response)
+            llm_costs = await aestimate_llm_cost(str(messages), response, usage=provider.last_usage)
             cost_callback(llm_costs)
 
+        if cache_key is not None and response:
+            cache.set(cache_key, response)
+
         return response
 
     logging.error(f"Failed to get response from {llm_provider} API")
@@ -138,18 +166,31 @@ async def construct_subtopics(
             provider_kwargs['temperature'] = config.temperature
             provider_kwargs['max_tokens'] = config.smart_token_limit
 
+        inputs = {
+            "task": task,
+            "data": data,
+            "subtopics": subtopics,
+            "max_subtopics": config.max_subtopics
+        }
+
+        cache = get_llm_cache(config, "subtopics")
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.make_key(config.smart_llm_provider, provider_kwargs, prompt.format(**inputs))
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return Subtopics.model_validate_json(cached)
+
         provider = get_llm(config.smart_llm_provider, **provider_kwargs)
 
         model = provider.llm
 
         chain = prompt | model | parser
 
-        output = await chain.ainvoke({
-            "task": task,
-            "data": data,
-            "subtopics": subtopics,
-            "max_subtopics": config.max_subtopics
-        }, **kwargs)
+        output = await chain.ainvoke(inputs, **kwargs)
+
+        if cache_key is not None:
+            cache.set(cache_key, output.model_dump_json())
 
         return output
 
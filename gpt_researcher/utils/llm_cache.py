@@ -0,0 +1,72 @@
+"""
+Opt-in cache of LLM responses for prompts that are deterministic functions of
+their input (agent selection, sub-query planning, subtopics, section titles,
+source curation).
+
+Responses are keyed by provider, the final provider kwargs (model,
+temperature, max_tokens, reasoning_effort, LLM_KWARGS) and a hash of the
+messages. Any object with the same `make_key` / `get` / `set` methods can be
+passed to `create_chat_completion` in place of `LLMResponseCache`.
+"""
+import hashlib
+import json
+import threading
+from typing import Any
+
+from .cache import LRUCache, SQLiteCache
+
+
+class LLMResponseCache:
+    """In-memory LRU cache of LLM responses with an optional SQLite store."""
+
+    def __init__(self, ttl: int = 86400, max_size: int = 1000, path: str | None = None):
+        self.ttl = ttl
+        self.memory = LRUCache(max_size)
+        self.store = SQLiteCache(path, table="llm_responses") if path else None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(llm_provider: str | None, provider_kwargs: dict[str, Any], messages: Any) -> str:
+        payload = json.dumps(
+            {"provider": llm_provider, "kwargs": provider_kwargs, "messages": messages},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        value = self.memory.get(key)
+        if value is None and self.store is not None:
+            stored = self.store.get(key)
+            if stored is not None:
+                value = stored.decode("utf-8")
+                self.memory.set(key, value, ttl=self.ttl)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, response: str) -> None:
+        self.memory.set(key, response, ttl=self.ttl)
+        if self.store is not None:
+            self.store.set(key, response.encode("utf-8"), ttl=self.ttl)
+
+
+_CACHES: dict[tuple[int, str | None], LLMResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_llm_cache(cfg: Any, call_site: str) -> LLMResponseCache | None:
+    """
+    Return the process-wide LLM response cache if caching is enabled in `cfg`
+    (`LLM_CACHE_TTL > 0`) for `call_site`, otherwise None.
+    """
+    if cfg is None or cfg.llm_cache_ttl <= 0 or call_site not in cfg.llm_cache_calls:
+        return None
+    with _CACHES_LOCK:
+        key = (cfg.llm_cache_ttl, cfg.llm_cache_path)
+        if key not in _CACHES:
+            _CACHES[key] = LLMResponseCache(ttl=cfg.llm_cache_ttl, path=cfg.llm_cache_path)
+        return _CACHES[key]
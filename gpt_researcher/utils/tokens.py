@@ -0,0 +1,30 @@
+"""
+Token counting helpers.
+
+Encodings are loaded once per model and reused; tiktoken encodings are
+thread-safe. Models unknown to tiktoken (Anthropic, Gemini, local models, ...)
+are counted with `o200k_base`, which is close enough for budgeting.
+"""
+from functools import lru_cache
+
+import tiktoken
+
+DEFAULT_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str | None = None) -> tiktoken.Encoding:
+    """Return the (cached) tiktoken encoding for `model`."""
+    if model:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            pass
+    return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Number of tokens in `text` for `model`. Special tokens are counted as plain text."""
+    if not text:
+        return 0
+    return len(get_encoding(model).encode_ordinary(text))
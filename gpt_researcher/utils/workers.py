@@ -1,15 +1,264 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Second-level labels under which sites register their own domains (e.g. example.co.uk)
+_SECOND_LEVEL_LABELS = {"co", "com", "net", "org", "ac", "gov", "edu"}
+
+
+def get_host_key(url: str) -> str:
+    """Registrable domain of `url`, so that all subdomains of a site share a limit."""
+    host = (urlparse(url).hostname or "").lower()
+    parts = host.split(".")
+    if len(parts) > 2 and parts[-2] in _SECOND_LEVEL_LABELS and len(parts[-1]) == 2:
+        return ".".join(parts[-3:])
+    return ".".join(parts[-2:])
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _PrioritySemaphore:
+    """Semaphore that wakes waiters in priority order (lowest first), FIFO within a priority."""
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: list = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: int = 0) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._counter), future]
+        heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Woken up and cancelled at the same time, pass the slot on
+                self.release()
+            else:
+                entry[2] = None
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future is not None and not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+class _HostState:
+    def __init__(self, max_concurrency: int, delay: float):
+        self.limit = max_concurrency
+        self.active = 0
+        self.delay = delay
+        self.next_allowed = 0.0
+        self.condition = asyncio.Condition()
+
+
+class HostScheduler:
+    """
+    Per-host concurrency and politeness shared by every scrape in an event loop.
+
+    Each host gets at most `max_per_host` concurrent requests, spaced by at
+    least `delay` seconds. Rate limiting (429/503) halves the host's
+    concurrency and doubles its delay, honouring Retry-After; slow responses
+    increase the delay. Successful responses gradually restore both.
+    """
+
+    MAX_DELAY = 60.0
+    SLOW_RESPONSE_SECONDS = 10.0
+
+    def __init__(self, max_per_host: int = 4, delay: float = 0.0):
+        self.max_per_host = max(1, max_per_host)
+        self.base_delay = delay
+        self.hosts: dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = _HostState(self.max_per_host, self.base_delay)
+        return state
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        state = self._state(get_host_key(url))
+        async with state.condition:
+            await state.condition.wait_for(lambda: state.active < state.limit)
+            state.active += 1
+            wait = state.next_allowed - time.monotonic()
+            state.next_allowed = max(state.next_allowed, time.monotonic()) + state.delay
+        try:
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            async with state.condition:
+                state.active -= 1
+                state.condition.notify_all()
+
+    def report(self, url: str, status: int | None = None, retry_after: float | None = None,
+               elapsed: float | None = None) -> None:
+        """
+        Adapt the host's limits to the outcome of a request. `retry_after` is
+        only honoured with a 429 or 503, as other responses (e.g. redirects)
+        may carry the header with another meaning.
+        """
+        state = self._state(get_host_key(url))
+        if status in (429, 503):
+            state.limit = max(1, state.limit // 2)
+            state.delay = min(self.MAX_DELAY, max(1.0, state.delay * 2))
+            backoff = retry_after if retry_after is not None else state.delay
+            state.next_allowed = max(state.next_allowed, time.monotonic() + min(backoff, self.MAX_DELAY * 5))
+            logger.warning(f"Backing off {get_host_key(url)} for {backoff:.1f}s (status {status})")
+        elif elapsed is not None and elapsed > self.SLOW_RESPONSE_SECONDS:
+            state.delay = min(self.MAX_DELAY, max(0.5, state.delay * 1.5))
+        elif status is None or status < 400:
+            state.delay = max(self.base_delay, state.delay / 2)
+            if state.limit < self.max_per_host:
+                state.limit += 1
+
+
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def get_host_scheduler(max_per_host: int = 4, delay: float = 0.0) -> HostScheduler:
+    """Return the scheduler shared by all worker pools of the running event loop."""
+    schedulers = _schedulers.setdefault(asyncio.get_running_loop(), {})
+    key = (max_per_host, delay)
+    if key not in schedulers:
+        schedulers[key] = HostScheduler(max_per_host, delay)
+    return schedulers[key]
+
+
+# Process pools by size, None once a pool of that size turned out to be unusable
+_PROCESS_POOLS: dict[int, ProcessPoolExecutor | None] = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+MAX_AUTO_PROCESSES = 8
+
+
+def get_process_pool(processes: int = 0) -> ProcessPoolExecutor | None:
+    """
+    Return the process-wide pool for CPU-bound work such as HTML parsing.
+    `processes=0` uses one process per CPU core (up to 8), a negative value
+    disables the pool and None is returned.
+    """
+    if processes < 0:
+        return None
+    if processes == 0:
+        processes = min(os.cpu_count() or 1, MAX_AUTO_PROCESSES)
+    with _PROCESS_POOLS_LOCK:
+        if processes not in _PROCESS_POOLS:
+            try:
+                _PROCESS_POOLS[processes] = ProcessPoolExecutor(max_workers=processes)
+            except (NotImplementedError, OSError) as e:
+                logger.warning(f"Process pool unavailable, running in threads: {e}")
+                _PROCESS_POOLS[processes] = None
+        return _PROCESS_POOLS[processes]
+
+
+def _disable_process_pool(pool: ProcessPoolExecutor) -> None:
+    with _PROCESS_POOLS_LOCK:
+        for processes, existing in _PROCESS_POOLS.items():
+            if existing is pool:
+                _PROCESS_POOLS[processes] = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_cpu_bound(func, *args, processes: int = 0, executor: ThreadPoolExecutor | None = None):
+    """
+    Run the CPU-bound `func(*args)` in the process pool of `processes` workers
+    (see `get_process_pool`). `func`, its arguments and its result must be
+    picklable. Runs in `executor` (or the loop's default executor) when
+    processes are disabled or unusable.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool(processes)
+    if pool is not None:
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool as e:
+            # e.g. workers that cannot start without a `__main__` guard
+            logger.warning(f"Process pool broken, running in threads from now on: {e}")
+            _disable_process_pool(pool)
+    return await loop.run_in_executor(executor, func, *args)
 
 
 class WorkerPool:
-    def __init__(self, max_workers: int):
+    def __init__(self, max_workers: int, max_per_host: int = 4, host_delay: float = 0.0,
+                 parse_processes: int = -1):
         self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.host_delay = host_delay
+        self.parse_processes = parse_processes
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.semaphore = asyncio.Semaphore(max_workers)
+        self.semaphore = _PrioritySemaphore(max_workers)
 
     @asynccontextmanager
-    async def throttle(self):
-        async with self.semaphore:
-            yield
+    async def throttle(self, url: str | None = None, priority: int = 0):
+        """
+        Wait for a worker slot. With a `url`, also wait for the host's
+        concurrency and politeness limits first, so that slow hosts do not hold
+        global slots. Lower `priority` values (e.g. better search rank) go first.
+        """
+        if url is None:
+            await self.semaphore.acquire(priority)
+            try:
+                yield
+            finally:
+                self.semaphore.release()
+            return
+
+        async with self.host_scheduler.slot(url):
+            await self.semaphore.acquire(priority)
+            try:
+                yield
+            finally:
+                self.semaphore.release()
+
+    @property
+    def host_scheduler(self) -> HostScheduler:
+        return get_host_scheduler(self.max_per_host, self.host_delay)
+
+    def report(self, url: str, status: int | None = None, retry_after: str | float | None = None,
+               elapsed: float | None = None) -> None:
+        """Feed the outcome of a request back to the host scheduler."""
+        if isinstance(retry_after, str):
+            retry_after = parse_retry_after(retry_after)
+        self.host_scheduler.report(url, status, retry_after, elapsed)
+
+    async def run_cpu_bound(self, func, *args):
+        """
+        Run the CPU-bound `func(*args)` in the shared process pool, so that
+        parsing scales with cores instead of contending for the GIL with the
+        other scrapes. See `run_cpu_bound`.
+        """
+        return await run_cpu_bound(func, *args, processes=self.parse_processes, executor=self.executor)
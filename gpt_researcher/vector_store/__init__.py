@@ -1,3 +1,4 @@
 from .vector_store import VectorStoreWrapper
+from .local_index import LocalVectorIndex, open_local_index
 
-__all__ = ['VectorStoreWrapper']
\ No newline at end of file
+__all__ = ['VectorStoreWrapper', 'LocalVectorIndex', 'open_local_index']
@@ -0,0 +1,165 @@
+"""
+Persistent vector index for local documents.
+
+The index is a `ChunkIndex` whose normalized float32 matrix lives in a file
+that is memory-mapped on open, next to a JSON sidecar holding the chunk texts,
+their metadata and the content hash of every indexed page. Opening an existing
+index is therefore a file open, and updating it with the current documents
+only splits and embeds pages whose content hash is new. Pages that are gone
+are dropped.
+
+Each update writes a new vectors file and then atomically replaces the
+sidecar that points to it, so readers in other processes always see a
+consistent index. An update only deletes the vector files written before
+the sidecar it replaces, so files still being written by concurrent updates
+are kept.
+"""
+import asyncio
+import glob
+import hashlib
+import json
+import os
+import uuid
+from typing import Dict, List
+
+import numpy as np
+
+from ..context.chunk_index import ChunkIndex
+
+INDEX_VERSION = 1
+
+
+def page_hash(page: Dict) -> str:
+    """Content hash identifying a page across runs."""
+    payload = json.dumps([page.get("url", ""), page.get("title", ""), page.get("raw_content", "")])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LocalVectorIndex(ChunkIndex):
+    """`ChunkIndex` persisted to a directory and updated incrementally."""
+
+    def __init__(self, directory: str, embeddings, embedding_model: str, **kwargs):
+        super().__init__(embeddings, **kwargs)
+        self.directory = directory
+        self.embedding_model = embedding_model
+        # Page hash -> (first chunk, end chunk) rows of the matrix
+        self.pages: Dict[str, List[int]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def sidecar_path(self) -> str:
+        return os.path.join(self.directory, "index.json")
+
+    def load(self) -> "LocalVectorIndex":
+        """Open the index on disk, if there is one built with the same embedding model."""
+        try:
+            with open(self.sidecar_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if meta.get("version") != INDEX_VERSION or meta.get("embedding_model") != self.embedding_model:
+            return self
+
+        count, dim = meta["count"], meta["dim"]
+        if count:
+            try:
+                self.matrix = np.memmap(
+                    os.path.join(self.directory, meta["vectors"]), dtype=np.float32, mode="r", shape=(count, dim)
+                )
+            except (OSError, ValueError):
+                # Replaced by a concurrent update, start from scratch
+                return self
+        self.texts = meta["texts"]
+        self.metadatas = meta["metadatas"]
+        self.chunk_metadata_ids = meta["chunk_metadata_ids"]
+        self.pages = meta["pages"]
+        return self
+
+    def _save(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        vectors = f"vectors-{uuid.uuid4().hex}.f32"
+        np.ascontiguousarray(self.matrix, dtype=np.float32).tofile(os.path.join(self.directory, vectors))
+        meta = {
+            "version": INDEX_VERSION,
+            "embedding_model": self.embedding_model,
+            "count": len(self.texts),
+            "dim": int(self.matrix.shape[1]) if len(self.texts) else 0,
+            "vectors": vectors,
+            "pages": self.pages,
+            "texts": self.texts,
+            "metadatas": self.metadatas,
+            "chunk_metadata_ids": self.chunk_metadata_ids,
+        }
+        tmp_path = f"{self.sidecar_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        try:
+            replaced_at = os.stat(self.sidecar_path).st_mtime
+        except OSError:
+            replaced_at = None
+        os.replace(tmp_path, self.sidecar_path)
+
+        # Files written before the replaced sidecar belong to it or to older ones. Newer files
+        # may belong to updates still in progress and are left to a later update. Files still
+        # mapped by readers stay alive until closed.
+        if replaced_at is not None:
+            for path in glob.glob(os.path.join(self.directory, "vectors-*.f32")):
+                try:
+                    if os.path.basename(path) != vectors and os.stat(path).st_mtime <= replaced_at:
+                        os.remove(path)
+                except OSError:
+                    pass
+        self.load()
+
+    def _remove_pages(self, hashes: List[str]) -> None:
+        keep_rows = np.ones(len(self.texts), dtype=bool)
+        for page in hashes:
+            start, end = self.pages.pop(page)
+            keep_rows[start:end] = False
+        rows = np.flatnonzero(keep_rows)
+
+        # Renumber metadata and page ranges after the removed rows
+        used = sorted({self.chunk_metadata_ids[row] for row in rows})
+        metadata_index = {old: new for new, old in enumerate(used)}
+        kept_before = np.concatenate([[0], np.cumsum(keep_rows)])
+        self.pages = {page: [int(kept_before[start]), int(kept_before[end])] for page, (start, end) in self.pages.items()}
+        self.matrix = np.asarray(self.matrix)[rows]
+        self.texts = [self.texts[row] for row in rows]
+        self.chunk_metadata_ids = [metadata_index[self.chunk_metadata_ids[row]] for row in rows]
+        self.metadatas = [self.metadatas[old] for old in used]
+        # Rows moved, the ANN index is rebuilt on the next search
+        self.ann = None
+
+    async def aupdate_pages(self, pages: List[Dict]) -> List[Dict]:
+        """
+        Make the index match `pages`: embed pages not indexed yet and drop
+        those no longer present, then persist it. Returns the pages that were embedded.
+        """
+        async with self._lock:
+            current = {page_hash(page): page for page in pages if page.get("raw_content")}
+            removed = [page for page in self.pages if page not in current]
+            added = [(key, page) for key, page in current.items() if key not in self.pages]
+            if not removed and not added:
+                return []
+
+            if removed:
+                await asyncio.to_thread(self._remove_pages, removed)
+
+            if added:
+                first_row, first_metadata = len(self.texts), len(self.metadatas)
+                await self.aadd_pages([page for _, page in added])
+                # Chunks of each page are contiguous, in the order the pages were added
+                rows_by_metadata: Dict[int, List[int]] = {}
+                for row in range(first_row, len(self.texts)):
+                    rows_by_metadata.setdefault(self.chunk_metadata_ids[row], []).append(row)
+                for i, (key, _) in enumerate(added):
+                    rows = rows_by_metadata.get(first_metadata + i)
+                    self.pages[key] = [rows[0], rows[-1] + 1] if rows else [first_row, first_row]
+
+            await asyncio.to_thread(self._save)
+            return [page for _, page in added]
+
+
+def open_local_index(directory: str, embeddings, embedding_model: str, index_type: str = "flat") -> LocalVectorIndex:
+    """Open the persistent index in `directory`, empty if missing or built with another model."""
+    return LocalVectorIndex(directory, embeddings, embedding_model, index_type=index_type).load()
@@ -1,18 +1,34 @@
 """
 Wrapper for langchain vector store
 """
+import asyncio
+import threading
 from typing import List, Dict
 
+import numpy as np
 from langchain.docstore.document import Document
 from langchain.vectorstores import VectorStore
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
+from ..context.ann import MIN_ANN_SIZE, create_vector_index
+from ..context.similarity import normalize
+
 class VectorStoreWrapper:
     """
     A Wrapper for LangchainVectorStore to handle GPT-Researcher Document Type
+
+    With an `index_type` other than "flat", unfiltered searches in a large
+    LangChain `InMemoryVectorStore` (which otherwise scores every vector) go
+    through an approximate nearest neighbor index built from the vectors it
+    already holds, in a worker thread. Other stores use their own indexes.
     """
-    def __init__(self, vector_store : VectorStore):
+    def __init__(self, vector_store : VectorStore, index_type: str = "flat"):
         self.vector_store = vector_store
+        self.index_type = index_type
+        self._ann = None
+        self._ann_lock = threading.Lock()
+        self._ann_ids: List[str] = []
+        self._ann_matrix = np.empty((0, 0), dtype=np.float32)
 
     def load(self, documents):
         """
@@ -37,7 +53,44 @@ class VectorStoreWrapper:
         )
         return text_splitter.split_documents(documents)
 
+    def _in_memory_store(self) -> Dict[str, Dict] | None:
+        """The id -> {"vector", "text", "metadata"} dict of an `InMemoryVectorStore`, if that is the store"""
+        store = getattr(self.vector_store, "store", None)
+        if isinstance(store, dict) and hasattr(self.vector_store, "embedding"):
+            return store
+        return None
+
+    def _sync_ann(self, store: Dict[str, Dict]) -> None:
+        known = set(self._ann_ids)
+        if len(store) < len(known) or any(doc_id not in store for doc_id in self._ann_ids):
+            # Documents were deleted, rebuild from scratch
+            self._ann, self._ann_ids, known = None, [], set()
+            self._ann_matrix = np.empty((0, 0), dtype=np.float32)
+        new_ids = [doc_id for doc_id in store if doc_id not in known]
+        if new_ids:
+            vectors = normalize([store[doc_id]["vector"] for doc_id in new_ids])
+            self._ann_matrix = vectors if not self._ann_ids else np.concatenate([self._ann_matrix, vectors])
+            self._ann_ids.extend(new_ids)
+        if self._ann is None:
+            self._ann = create_vector_index(self.index_type)
+        self._ann.update(self._ann_matrix)
+
+    def _ann_search(self, store: Dict[str, Dict], query_vector: np.ndarray, k: int) -> List[Document]:
+        with self._ann_lock:
+            self._sync_ann(store)
+            rows = self._ann.search(self._ann_matrix, query_vector, k)[0]
+            return [
+                Document(id=self._ann_ids[row], page_content=store[self._ann_ids[row]]["text"],
+                         metadata=store[self._ann_ids[row]]["metadata"])
+                for row in rows
+            ]
+
     async def asimilarity_search(self, query, k, filter):
         """Return query by vector store"""
+        store = self._in_memory_store()
+        if self.index_type != "flat" and filter is None and store is not None and len(store) >= MIN_ANN_SIZE:
+            query_vector = normalize(await self.vector_store.embedding.aembed_query(query))
+            # A snapshot, as documents may be added on the event loop while the index is synced
+            return await asyncio.to_thread(self._ann_search, dict(store), query_vector, k)
         results = await self.vector_store.asimilarity_search(query=query, k=k, filter=filter)
         return results
@@ -0,0 +1,94 @@
+"""
+Benchmark the single-pass lxml extractor (`extract_html`) against the
+BeautifulSoup pipeline (`clean_soup` + `get_text_from_soup` +
+`get_relevant_images` + `extract_title`).
+
+Usage:
+    python tests/benchmark-html-extraction.py [PAGES_DIR] [--repeat N]
+
+PAGES_DIR is a directory of saved pages (*.html, *.htm). Without it, a
+synthetic ~600KB page is used.
+"""
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from gpt_researcher.scraper.utils import (
+    clean_soup,
+    extract_html,
+    extract_title,
+    get_relevant_images,
+    get_text_from_soup,
+)
+
+
+def soup_pipeline(content: bytes, url: str) -> tuple[str, list, str]:
+    soup = BeautifulSoup(content, "lxml")
+    soup = clean_soup(soup)
+    text = get_text_from_soup(soup)
+    image_urls = get_relevant_images(soup, url)
+    title = extract_title(soup)
+    return text, image_urls, str(title) if title else ""
+
+
+def synthetic_page(sections: int = 1500) -> bytes:
+    body = []
+    for i in range(sections):
+        body.append(
+            f'<div class="content"><h2>Section {i}</h2>'
+            f'<p>Paragraph {i} with <a href="/link/{i}">a link</a> and <b>bold</b> text.</p>'
+            f'<img src="/img/{i}.png" width="{400 + i}" height="300">'
+            f'<nav><a href="/nav/{i}">nav</a></nav>'
+            f'<script>var x{i} = {i};</script></div>'
+        )
+    html = (
+        "<html><head><title>Synthetic page</title><style>p {color: red}</style></head>"
+        f"<body><header>Site header</header>{''.join(body)}<footer>Footer</footer></body></html>"
+    )
+    return html.encode("utf-8")
+
+
+def timed(func, *args, repeat: int) -> tuple[float, tuple]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages_dir", nargs="?", help="Directory of saved HTML pages")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page, the median is reported")
+    args = parser.parse_args()
+
+    if args.pages_dir:
+        pages = sorted(p for p in Path(args.pages_dir).iterdir() if p.suffix in (".html", ".htm"))
+        corpus = [(p.name, p.read_bytes()) for p in pages]
+    else:
+        corpus = [("synthetic", synthetic_page())]
+
+    url = "https://example.com/page"
+    total_soup = total_lxml = 0.0
+    print(f"{'page':<40} {'KB':>8} {'soup ms':>10} {'lxml ms':>10} {'speedup':>8}  same text/images/title")
+    for name, content in corpus:
+        soup_time, expected = timed(soup_pipeline, content, url, repeat=args.repeat)
+        lxml_time, actual = timed(extract_html, content, None, url, repeat=args.repeat)
+        total_soup += soup_time
+        total_lxml += lxml_time
+        same = "/".join("yes" if a == b else "no" for a, b in zip(actual, expected))
+        print(
+            f"{name[:40]:<40} {len(content) / 1024:>8.0f} {soup_time * 1000:>10.1f} "
+            f"{lxml_time * 1000:>10.1f} {soup_time / lxml_time:>7.1f}x  {same}"
+        )
+
+    print(f"\nTotal: soup {total_soup * 1000:.1f} ms, lxml {total_lxml * 1000:.1f} ms, "
+          f"speedup {total_soup / total_lxml:.1f}x over {len(corpus)} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark the approximate vector indexes (`ivf`, `hnsw`) against exact `flat`
+search: build time, per-query latency and recall@k.
+
+Usage:
+    python tests/benchmark-vector-index.py [--size N] [--dim D] [--queries Q] [--k K]
+
+Vectors are synthetic: normalized points around random topic centers, which
+resembles the clustered structure of chunk embeddings better than uniform noise.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from gpt_researcher.context.ann import FlatIndex, create_vector_index
+from gpt_researcher.context.similarity import normalize
+
+
+def clustered_vectors(rng, centers: np.ndarray, size: int, spread: float = 1.0) -> np.ndarray:
+    vectors = centers[rng.integers(0, len(centers), size)] + spread * rng.standard_normal((size, centers.shape[1]))
+    return normalize(vectors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=50000, help="Number of indexed vectors")
+    parser.add_argument("--dim", type=int, default=384, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors per query")
+    parser.add_argument("--spread", type=float, default=1.0, help="Noise around topic centers, higher is harder")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((200, args.dim))
+    matrix = clustered_vectors(rng, centers, args.size, args.spread)
+    queries = clustered_vectors(rng, centers, args.queries, args.spread)
+
+    exact = FlatIndex().search(matrix, queries, args.k)
+
+    print(f"{args.size} vectors of dimension {args.dim}, {args.queries} queries, k={args.k}\n")
+    print(f"{'index':<8} {'build s':>8} {'query ms':>9} {'recall':>7}")
+    for index_type in ("flat", "ivf", "hnsw"):
+        index = create_vector_index(index_type)
+        started = time.perf_counter()
+        index.update(matrix)
+        build = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = [index.search(matrix, query.reshape(1, -1), args.k)[0] for query in queries]
+        latency = (time.perf_counter() - started) / len(queries)
+
+        recall = np.mean([len(set(found.tolist()) & set(truth.tolist())) / args.k for found, truth in zip(results, exact)])
+        name = type(index).__name__
+        print(f"{index_type:<8} {build:>8.2f} {latency * 1000:>9.3f} {recall:>7.3f}  ({name})")
+
+
+if __name__ == "__main__":
+    main()
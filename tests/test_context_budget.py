@@ -0,0 +1,81 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.actions import report_generation
+from gpt_researcher.context.budget import fit_context_to_budget, get_context_window
+from gpt_researcher.utils import tokens
+from gpt_researcher.utils.enum import Tone
+from gpt_researcher.utils.tokens import count_tokens
+
+
+class WordEncoding:
+    """Stand-in for a tiktoken encoding with one token per word."""
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        return text.split()
+
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    # The tiktoken encodings are downloaded on first use
+    monkeypatch.setattr(tokens, "get_encoding", lambda model=None: WordEncoding())
+
+
+def source(n: int, words: int = 50) -> str:
+    return f"Source: https://example.com/{n}\nTitle: Page {n}\nContent: {'word ' * words}\n\n"
+
+
+def test_context_within_budget_is_unchanged():
+    context = ["".join(source(i) for i in range(3)), source(3)]
+    packed, report = fit_context_to_budget(context, "gpt-4o", budget=100000)
+    assert packed == context
+    assert report["dropped_blocks"] == 0
+
+
+def test_top_sources_of_every_sub_query_are_kept():
+    first = "".join(source(i) for i in range(4))
+    second = "".join(source(i) for i in range(10, 14))
+    budget = count_tokens(source(0), "gpt-4o") * 2 + count_tokens(source(10), "gpt-4o") * 2
+
+    packed, report = fit_context_to_budget([first, second], "gpt-4o", budget)
+
+    assert packed == [source(0) + source(1), source(10) + source(11)]
+    assert report["dropped_blocks"] == 4
+    assert report["used_tokens"] <= budget
+
+
+def test_context_window_uses_longest_prefix():
+    assert get_context_window("gpt-4o-mini") == 128000
+    assert get_context_window("gpt-4.1-nano") == 1047576
+    assert get_context_window("anthropic/claude-3-5-sonnet") == 200000
+    assert get_context_window("my-local-model", override=8192) == 8192
+
+
+@pytest.mark.asyncio
+async def test_report_context_is_fitted_off_the_event_loop(monkeypatch):
+    threads, sent = [], []
+
+    def fit(context, model, budget):
+        threads.append(threading.current_thread())
+        return fit_context_to_budget(context, model, budget)
+
+    async def complete(messages, **kwargs):
+        sent.extend(messages)
+        return "report"
+
+    monkeypatch.setattr(report_generation, "fit_context_to_budget", fit)
+    monkeypatch.setattr(report_generation, "create_chat_completion", complete)
+    cfg = SimpleNamespace(
+        smart_llm_model="gpt-4o", smart_llm_provider="openai", smart_token_limit=4000, context_window_tokens=0,
+        llm_kwargs={}, report_format="APA", total_words=1000, language="english",
+    )
+
+    report = await report_generation.generate_report(
+        "query", [source(0)], "agent", "research_report", Tone.Objective, "web", None, cfg
+    )
+
+    assert report == "report"
+    assert threads and threading.main_thread() not in threads
+    assert "https://example.com/0" in sent[-1]["content"]
@@ -0,0 +1,102 @@
+import asyncio
+import re
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.skills import deep_research
+from gpt_researcher.skills.deep_research import DeepResearchSkill
+
+
+class StubDeepResearch(DeepResearchSkill):
+    """
+    Deep research over a synthetic tree: the children of query "q1" are
+    "q1.0", "q1.1", ... and researching a query takes `delays[query]` seconds.
+    """
+
+    def __init__(self, concurrency: int, delays: dict | None = None):
+        cfg = SimpleNamespace(deep_research_breadth=3, deep_research_depth=2, deep_research_concurrency=concurrency)
+        super().__init__(SimpleNamespace(cfg=cfg, websocket=None, tone=None, headers={}, visited_urls=set()))
+        self.delays = delays or {}
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+    async def generate_search_queries(self, query, num_queries=3):
+        goal = re.search(r"Previous research goal: (\S+)", query)
+        prefix = f"{goal.group(1)}." if goal else "q"
+        return [{"query": f"{prefix}{i}", "researchGoal": f"{prefix}{i}"} for i in range(num_queries)]
+
+    async def _research_query(self, serp_query, semaphore, progress, on_progress=None):
+        query = serp_query["query"]
+        async with semaphore:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.events.append(("start", query))
+            await asyncio.sleep(self.delays.get(query, 0.01))
+            self.events.append(("end", query))
+            self.running -= 1
+        return {
+            "learnings": [query],
+            "visited_urls": [f"https://{query}.test"],
+            "followUpQuestions": [],
+            "researchGoal": serp_query["researchGoal"],
+            "citations": {},
+            "context": query,
+            "sources": [],
+        }
+
+
+@pytest.fixture(autouse=True)
+def no_context_trimming(monkeypatch):
+    # Trimming counts tokens with the tiktoken encodings, which are downloaded on first use
+    monkeypatch.setattr(deep_research, "trim_context_to_token_budget", lambda context, cfg: context)
+
+
+@pytest.mark.asyncio
+async def test_whole_tree_shares_one_concurrency_limit():
+    skill = StubDeepResearch(concurrency=2)
+
+    results = await skill.deep_research("root", breadth=3, depth=2)
+
+    # 3 queries, each with 2 follow-ups
+    assert len(results["context"]) == 9
+    assert skill.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_follow_ups_start_before_sibling_queries_finish():
+    skill = StubDeepResearch(concurrency=4, delays={"q0": 0.01, "q1": 0.1, "q2": 0.1})
+
+    await skill.deep_research("root", breadth=3, depth=2)
+
+    assert skill.events.index(("start", "q0.0")) < skill.events.index(("end", "q1"))
+    assert skill.events.index(("start", "q0.1")) < skill.events.index(("end", "q2"))
+
+
+@pytest.mark.asyncio
+async def test_results_are_combined_in_tree_order():
+    # Later branches finish first
+    skill = StubDeepResearch(concurrency=9, delays={"q0": 0.06, "q0.0": 0.03, "q1": 0.03, "q2": 0.0})
+
+    results = await skill.deep_research("root", breadth=3, depth=2)
+
+    assert results["context"] == ["q0", "q0.0", "q0.1", "q1", "q1.0", "q1.1", "q2", "q2.0", "q2.1"]
+    assert skill.context == results["context"]
+    assert sorted(results["visited_urls"]) == sorted(f"https://{query}.test" for query in results["context"])
+
+
+@pytest.mark.asyncio
+async def test_context_is_trimmed_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def trim(context, cfg):
+        threads.append(threading.current_thread())
+        return context
+
+    monkeypatch.setattr(deep_research, "trim_context_to_token_budget", trim)
+
+    await StubDeepResearch(concurrency=2).deep_research("root", breadth=2, depth=1)
+
+    assert threads and threading.main_thread() not in threads
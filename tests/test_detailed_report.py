@@ -0,0 +1,179 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.report_type.detailed_report import detailed_report
+from backend.report_type.detailed_report.detailed_report import DetailedReport
+from gpt_researcher.actions import extract_headers, extract_sections, table_of_contents
+
+SUBTOPICS = [{"task": "alpha"}, {"task": "beta"}, {"task": "gamma"}]
+
+
+class StubResearcher:
+    """
+    GPTResearcher stand-in. Research on a query takes `outcomes[query]`
+    seconds, or raises it when it is an exception; every step is recorded.
+    """
+
+    concurrency = 3
+    outcomes: dict = {}
+    events: list = []
+    seeded: dict = {}
+
+    def __init__(self, query, visited_urls=None, **kwargs):
+        self.query = query
+        self.visited_urls = visited_urls if visited_urls is not None else set()
+        self.context = []
+        self.cfg = SimpleNamespace(subtopic_concurrency=self.concurrency)
+        self.agent, self.role = "agent", "role"
+
+    async def conduct_research(self):
+        self.seeded[self.query] = sorted(self.context)
+        self.events.append(("research", self.query))
+        outcome = self.outcomes.get(self.query, 0)
+        try:
+            if isinstance(outcome, Exception):
+                await asyncio.sleep(0.01)
+                raise outcome
+            await asyncio.sleep(outcome)
+        except asyncio.CancelledError:
+            self.events.append(("cancelled", self.query))
+            raise
+        self.context = self.context + [f"{self.query} context"]
+        self.visited_urls.add(f"https://{self.query}.test")
+        self.events.append(("researched", self.query))
+
+    async def get_draft_section_titles(self, task):
+        return f"## {task} draft"
+
+    async def get_similar_written_contents_by_draft_section_titles(self, task, titles, written):
+        return []
+
+    async def write_report(self, existing_headers, relevant_contents):
+        self.events.append(("write", self.query))
+        return f"## {self.query}\n\nWritten after {len(existing_headers)} subtopics."
+
+    async def write_introduction(self):
+        self.events.append(("introduction", self.query))
+        try:
+            await asyncio.sleep(self.outcomes.get("introduction", 0))
+        except asyncio.CancelledError:
+            self.events.append(("cancelled", "introduction"))
+            raise
+        self.events.append(("introduced", self.query))
+        return "# Introduction"
+
+    async def get_subtopics(self):
+        outcome = self.outcomes.get("subtopics", [subtopic["task"] for subtopic in SUBTOPICS])
+        await asyncio.sleep(0.01)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return SimpleNamespace(subtopics=[SimpleNamespace(task=task) for task in outcome])
+
+    async def write_report_conclusion(self, report_body):
+        return "## Conclusion"
+
+    def add_references(self, report, visited_urls):
+        return report
+
+    extract_headers = staticmethod(extract_headers)
+    extract_sections = staticmethod(extract_sections)
+    table_of_contents = staticmethod(table_of_contents)
+
+
+@pytest.fixture
+def stub_researchers(monkeypatch):
+    StubResearcher.concurrency = 3
+    StubResearcher.outcomes = {}
+    StubResearcher.events = []
+    StubResearcher.seeded = {}
+    monkeypatch.setattr(detailed_report, "GPTResearcher", StubResearcher)
+    return StubResearcher
+
+
+def make_report() -> DetailedReport:
+    report = DetailedReport("query", "detailed_report", "web")
+    report.global_context = ["initial context"]
+    return report
+
+
+@pytest.mark.asyncio
+async def test_subtopics_are_researched_concurrently_and_assembled_in_order(stub_researchers):
+    stub_researchers.outcomes = {"alpha": 0.05, "beta": 0.01, "gamma": 0.02}
+
+    reports, body = await make_report()._generate_subtopic_reports(SUBTOPICS)
+
+    assert [report["topic"]["task"] for report in reports] == ["alpha", "beta", "gamma"]
+    assert body.index("## alpha") < body.index("## beta") < body.index("## gamma")
+    # All research started before the first, slowest one finished
+    assert stub_researchers.events[:3] == [("research", "alpha"), ("research", "beta"), ("research", "gamma")]
+    assert [event for event in stub_researchers.events if event[0] == "write"] == [
+        ("write", "alpha"), ("write", "beta"), ("write", "gamma")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parallel_reports_match_sequential_ones(stub_researchers):
+    stub_researchers.outcomes = {"alpha": 0.03, "beta": 0.0, "gamma": 0.01}
+    stub_researchers.concurrency = 1
+    sequential = make_report()
+    sequential_result = await sequential._generate_subtopic_reports(SUBTOPICS)
+
+    stub_researchers.concurrency = 3
+    parallel = make_report()
+    parallel_result = await parallel._generate_subtopic_reports(SUBTOPICS)
+
+    assert parallel_result == sequential_result
+    assert parallel.existing_headers == sequential.existing_headers
+    assert parallel.global_urls == sequential.global_urls
+
+
+@pytest.mark.asyncio
+async def test_parallel_subtopics_are_seeded_with_the_initial_context(stub_researchers):
+    stub_researchers.concurrency = 2
+    stub_researchers.outcomes = {"alpha": 0.0, "beta": 0.05, "gamma": 0.05, "delta": 0.0}
+
+    await make_report()._generate_subtopic_reports(SUBTOPICS + [{"task": "delta"}])
+
+    # delta only gets a slot once alpha has been written
+    assert stub_researchers.seeded == {task: ["initial context"] for task in ("alpha", "beta", "gamma", "delta")}
+
+
+@pytest.mark.asyncio
+async def test_failed_subtopic_cancels_the_others(stub_researchers):
+    stub_researchers.outcomes = {"alpha": RuntimeError("research failed"), "beta": 10, "gamma": 10}
+
+    with pytest.raises(RuntimeError, match="research failed"):
+        await make_report()._generate_subtopic_reports(SUBTOPICS)
+
+    # Cancelled tasks have finished by the time the error is raised
+    assert ("cancelled", "beta") in stub_researchers.events
+    assert ("cancelled", "gamma") in stub_researchers.events
+    assert not any(event[0] == "write" for event in stub_researchers.events)
+
+
+@pytest.mark.asyncio
+async def test_introduction_is_written_while_subtopics_are_researched(stub_researchers):
+    stub_researchers.outcomes = {"introduction": 0.05, "alpha": 0.01, "beta": 0.01, "gamma": 0.01}
+
+    report = await make_report().run()
+
+    events = stub_researchers.events
+    assert events.index(("research", "alpha")) < events.index(("introduced", "query"))
+    # Sections are only written after the introduction, which opens the report
+    assert events.index(("introduced", "query")) < events.index(("write", "alpha"))
+    assert report.startswith("# Introduction")
+    assert report.index("## alpha") < report.index("## gamma") < report.index("## Conclusion")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failing", ["subtopics", "beta"])
+async def test_introduction_is_cancelled_when_the_report_fails(stub_researchers, failing):
+    stub_researchers.outcomes = {"introduction": 10, failing: RuntimeError(f"{failing} failed")}
+
+    with pytest.raises(RuntimeError, match=f"{failing} failed"):
+        await make_report().run()
+
+    assert ("cancelled", "introduction") in stub_researchers.events
+    assert ("introduced", "query") not in stub_researchers.events
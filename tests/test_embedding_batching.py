@@ -0,0 +1,139 @@
+import asyncio
+import copy
+import time
+
+from langchain_core.embeddings import Embeddings
+from pydantic import BaseModel, PrivateAttr, SecretStr
+
+from gpt_researcher.memory.batching import BatchedEmbeddings, RateLimits, batch_embeddings
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class RecordingEmbeddings(Embeddings):
+    def __init__(self, max_inputs=100, rate_limited=0):
+        self.batches = []
+        self.max_inputs = max_inputs
+        self.rate_limited = rate_limited
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text))]
+
+    async def aembed_documents(self, texts):
+        if len(texts) > self.max_inputs:
+            raise ValueError("too many inputs in the request")
+        if self.rate_limited:
+            self.rate_limited -= 1
+            raise RateLimitError("429 Too Many Requests")
+        return self.embed_documents(texts)
+
+
+def test_concurrent_requests_are_coalesced_and_deduplicated():
+    base = RecordingEmbeddings()
+    embeddings = BatchedEmbeddings(base, batch_size=10)
+
+    async def run():
+        return await asyncio.gather(
+            embeddings.aembed_documents(["alpha", "beta"]),
+            embeddings.aembed_documents(["beta", "gamma"]),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert first == [[5.0], [4.0]]
+    assert second == [[4.0], [5.0]]
+    assert base.batches == [["alpha", "beta", "gamma"]]
+
+
+def test_batches_are_split_by_size_and_when_rejected():
+    base = RecordingEmbeddings(max_inputs=2)
+    embeddings = BatchedEmbeddings(base, batch_size=4)
+
+    vectors = asyncio.run(embeddings.aembed_documents([f"text {i}" for i in range(6)]))
+
+    assert vectors == [[6.0]] * 6
+    assert all(len(batch) <= 2 for batch in base.batches)
+    assert sum(len(batch) for batch in base.batches) == 6
+
+
+def test_rate_limited_requests_are_retried():
+    base = RecordingEmbeddings(rate_limited=2)
+    embeddings = BatchedEmbeddings(base)
+    embeddings._backoff = lambda attempt, error: 0
+
+    assert asyncio.run(embeddings.aembed_documents(["alpha"])) == [[5.0]]
+    assert base.batches == [["alpha"]]
+
+
+def test_clients_keep_their_own_credentials_but_share_the_request_budget():
+    first, second = RecordingEmbeddings(), RecordingEmbeddings()
+    first_batched = batch_embeddings(first, "openai", "shared-budget-model")
+    second_batched = batch_embeddings(second, "openai", "shared-budget-model")
+
+    asyncio.run(second_batched.aembed_documents(["beta"]))
+
+    assert first_batched.embeddings is first and second_batched.embeddings is second
+    assert first_batched.limits is second_batched.limits
+    assert (first.batches, second.batches) == ([], [["beta"]])
+    assert batch_embeddings(first, "openai", "other-model").limits is not first_batched.limits
+
+
+class ConfiguredEmbeddings(BaseModel, Embeddings):
+    """Pydantic embeddings client, like the LangChain ones, recording its requests."""
+
+    api_key: SecretStr
+    _requests: list = PrivateAttr(default_factory=list)
+
+    def embed_documents(self, texts):
+        self._requests.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text))]
+
+
+def test_identically_configured_clients_share_batches():
+    clients = [ConfiguredEmbeddings(api_key=key) for key in ("sk-a", "sk-a", "sk-b")]
+    wrappers = [batch_embeddings(client, "openai", "shared-queue-model") for client in clients]
+
+    async def run():
+        return await asyncio.gather(*(
+            wrapper.aembed_documents([text]) for wrapper, text in zip(wrappers, ["alpha", "beta", "gamma"])
+        ))
+
+    assert asyncio.run(run()) == [[[5.0]], [[4.0]], [[5.0]]]
+    # Researchers using the same credentials share a request, others keep their own
+    assert sorted(len(client._requests) for client in clients) == [0, 1, 1]
+    assert sorted(request for client in clients for request in client._requests) == [["alpha", "beta"], ["gamma"]]
+    assert clients[2]._requests == [["gamma"]]
+
+
+def test_rate_limit_backoff_holds_back_other_clients():
+    limits = RateLimits()
+    throttled = BatchedEmbeddings(RecordingEmbeddings(rate_limited=1), limits=limits)
+    throttled._backoff = lambda attempt, error: 0.2
+    other = BatchedEmbeddings(RecordingEmbeddings(), limits=limits)
+
+    async def run():
+        first = asyncio.create_task(throttled.aembed_documents(["alpha"]))
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        await other.aembed_documents(["beta"])
+        waited = time.monotonic() - started
+        await first
+        return waited
+
+    assert asyncio.run(run()) >= 0.1
+
+
+def test_missing_attributes_raise_attribute_error():
+    embeddings = BatchedEmbeddings(RecordingEmbeddings())
+
+    assert not hasattr(embeddings, "model")
+    assert copy.copy(embeddings).embeddings is embeddings.embeddings
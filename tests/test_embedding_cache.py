@@ -0,0 +1,61 @@
+import copy
+
+from langchain_core.embeddings import Embeddings
+
+from gpt_researcher.memory.cache import CachedEmbeddings, EmbeddingCache
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        self.embedded.append(text)
+        return [float(len(text)), 0.0]
+
+
+def test_repeated_chunks_are_embedded_once():
+    base = CountingEmbeddings()
+    embeddings = CachedEmbeddings(base, EmbeddingCache(max_size=100), namespace="test:model")
+
+    first = embeddings.embed_documents(["alpha", "beta", "alpha"])
+    second = embeddings.embed_documents(["beta", "gamma"])
+
+    assert first == [[5.0, 1.0], [4.0, 1.0], [5.0, 1.0]]
+    assert second == [[4.0, 1.0], [5.0, 1.0]]
+    assert base.embedded == ["alpha", "beta", "gamma"]
+
+
+def test_queries_and_documents_are_cached_separately():
+    base = CountingEmbeddings()
+    embeddings = CachedEmbeddings(base, EmbeddingCache(max_size=100), namespace="test:model")
+
+    assert embeddings.embed_documents(["alpha"]) == [[5.0, 1.0]]
+    assert embeddings.embed_query("alpha") == [5.0, 0.0]
+    assert embeddings.embed_query("alpha") == [5.0, 0.0]
+    assert base.embedded == ["alpha", "alpha"]
+
+
+def test_sqlite_store_is_shared_between_caches(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    CachedEmbeddings(CountingEmbeddings(), EmbeddingCache(path=path), "test:model").embed_documents(["alpha"])
+
+    base = CountingEmbeddings()
+    embeddings = CachedEmbeddings(base, EmbeddingCache(max_size=0, path=path), "test:model")
+
+    assert embeddings.embed_documents(["alpha"]) == [[5.0, 1.0]]
+    assert base.embedded == []
+
+
+def test_wrapper_can_be_copied():
+    base = CountingEmbeddings()
+    embeddings = CachedEmbeddings(base, EmbeddingCache(max_size=100), namespace="test:model")
+
+    copied = copy.copy(embeddings)
+
+    assert copied.embeddings is base and copied.cache is embeddings.cache
+    assert not hasattr(embeddings, "model")
@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import pytest
+
+from gpt_researcher.retrievers.fanout import merge_results, normalize_url, search_all
+
+
+def stub_retriever(name: str, hrefs: list[str], delay: float = 0, error: Exception | None = None):
+    """Retriever class answering with `hrefs` after `delay` seconds, or raising `error`."""
+
+    class StubRetriever:
+        searches = []
+        cancelled = []
+
+        def __init__(self, query, query_domains=None):
+            self.query = query
+
+        async def asearch(self, max_results=None):
+            self.searches.append(self.query)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(self.query)
+                raise
+            if error is not None:
+                raise error
+            return [{"href": href, "body": f"{name} {href}"} for href in hrefs[:max_results]]
+
+    StubRetriever.__name__ = name
+    return StubRetriever
+
+
+def hrefs(results):
+    return [result["href"] for result in results]
+
+
+@pytest.mark.parametrize("url, normalized", [
+    ("HTTPS://WWW.Example.com/Path/", "https://example.com/Path"),
+    ("https://example.com:443/a#section", "https://example.com/a"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("https://example.com/a?utm_source=x&b=2&a=1&fbclid=y", "https://example.com/a?a=1&b=2"),
+    ("https://example.com/a?q=", "https://example.com/a?q="),
+])
+def test_normalize_url(url, normalized):
+    assert normalize_url(url) == normalized
+
+
+def test_merge_results_interleaves_and_keeps_the_first_of_each_url():
+    first = [{"href": "https://a.test/1"}, {"href": "https://a.test/2"}, {"href": "https://a.test/3"}]
+    second = [{"href": "https://www.a.test/2/"}, {"body": "no link"}, {"body": "no link"}]
+
+    merged = merge_results([first, second, []])
+
+    # second[0] comes first in round-robin order, so it is kept over first[1]
+    assert merged == [first[0], second[0], second[1], first[2], second[2]]
+    assert merge_results([]) == []
+
+
+@pytest.mark.asyncio
+async def test_retrievers_are_queried_concurrently_and_merged_in_order():
+    retrievers = [
+        stub_retriever("Slow", ["https://slow.test/1", "https://shared.test"], delay=0.1),
+        stub_retriever("Fast", ["https://fast.test/1", "https://shared.test/?utm_medium=x"], delay=0.05),
+    ]
+
+    start = time.monotonic()
+    results = await search_all(retrievers, "query", max_results=5)
+
+    assert time.monotonic() - start < 0.14
+    assert hrefs(results) == ["https://slow.test/1", "https://fast.test/1", "https://shared.test"]
+
+
+@pytest.mark.asyncio
+async def test_slow_and_failing_retrievers_are_skipped():
+    retrievers = [
+        stub_retriever("Hanging", ["https://hanging.test"], delay=10),
+        stub_retriever("Broken", [], error=RuntimeError("quota exceeded")),
+        stub_retriever("Fast", ["https://fast.test"]),
+    ]
+
+    results = await asyncio.wait_for(search_all(retrievers, "query", timeout=0.05), timeout=1)
+
+    assert hrefs(results) == ["https://fast.test"]
+    assert retrievers[0].cancelled == ["query"]
+
+
+@pytest.mark.asyncio
+async def test_first_k_returns_without_waiting_for_slower_retrievers():
+    retrievers = [
+        stub_retriever("Fast", ["https://fast.test/1", "https://fast.test/2"]),
+        stub_retriever("Duplicate", ["https://fast.test/1"], delay=0.01),
+        stub_retriever("Medium", ["https://medium.test"], delay=0.03),
+        stub_retriever("Slow", ["https://slow.test"], delay=10),
+    ]
+
+    results = await asyncio.wait_for(search_all(retrievers, "query", first_k=3), timeout=1)
+
+    # The duplicate does not count towards first_k
+    assert hrefs(results) == ["https://fast.test/1", "https://medium.test", "https://fast.test/2"]
+    await asyncio.sleep(0)
+    assert retrievers[3].cancelled == ["query"]
+
+
+@pytest.mark.asyncio
+async def test_first_k_waits_for_all_retrievers_when_there_are_fewer_results():
+    retrievers = [
+        stub_retriever("Fast", ["https://fast.test"]),
+        stub_retriever("Slow", ["https://slow.test"], delay=0.03),
+    ]
+
+    results = await search_all(retrievers, "query", first_k=5)
+
+    assert hrefs(results) == ["https://fast.test", "https://slow.test"]
@@ -0,0 +1,41 @@
+from bs4 import BeautifulSoup
+
+from gpt_researcher.scraper.utils import (
+    clean_soup,
+    extract_html,
+    extract_title,
+    get_relevant_images,
+    get_text_from_soup,
+)
+
+URL = "https://example.com/docs/"
+
+PAGE = b"""<!DOCTYPE html><html><head><meta charset="utf-8"><title> Page  Title </title>
+<style>p { color: red }</style></head><body>
+<header>Site header</header><svg><title>icon</title></svg>
+Lead &amp; text<!-- comment --> after
+<div class="wide menu">Menu <img src="menu.png" class="hero"></div> tail   text
+<p>Para <span>inner</span>tail<br>after break</p>
+<img src="big.jpg" width="2000px" height="1200"><img src="tiny.jpg" width="10" height="10">
+<img src="/thumb.png" class="thumbnail"><ul><li>one<li>two</ul>
+<nav>Links</nav><script>var x = 1;</script>caf\xc3\xa9<footer>Footer</footer></body></html>"""
+
+
+def test_extract_html_matches_soup_pipeline():
+    soup = clean_soup(BeautifulSoup(PAGE, "lxml"))
+    expected = (get_text_from_soup(soup), get_relevant_images(soup, URL), str(extract_title(soup)))
+
+    assert extract_html(PAGE, None, URL) == expected
+
+
+def test_extract_html_drops_boilerplate():
+    text, images, title = extract_html(PAGE, "utf-8", URL)
+
+    assert title == " Page  Title "
+    assert "Menu" not in text and "Links" not in text and "var x" not in text
+    assert "tail text" in text and "café" in text
+    assert [image["url"] for image in images] == ["https://example.com/thumb.png", "https://example.com/docs/big.jpg"]
+
+
+def test_extract_html_empty_page():
+    assert extract_html(b"  ", None, URL) == ("", [], "")
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from gpt_researcher.utils.http import close_http_sessions, get_aiohttp_session, get_requests_session
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_session_is_reused_until_closed():
+    session = get_aiohttp_session()
+    assert get_aiohttp_session() is session
+
+    await close_http_sessions()
+
+    assert session.closed
+    replacement = get_aiohttp_session()
+    assert replacement is not session and not replacement.closed
+    await close_http_sessions()
+
+
+def test_each_event_loop_gets_its_own_session():
+    async def open_session():
+        session = get_aiohttp_session()
+        await close_http_sessions()
+        return session
+
+    first = asyncio.run(open_session())
+    second = asyncio.run(open_session())
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+@pytest.mark.asyncio
+async def test_requests_sessions_are_pooled_per_user_agent_and_closed():
+    session = get_requests_session("agent/1.0")
+    assert get_requests_session("agent/1.0") is session
+    assert get_requests_session("agent/2.0") is not session
+    assert session.headers["User-Agent"] == "agent/1.0"
+
+    await close_http_sessions()
+
+    assert get_requests_session("agent/1.0") is not session
+    await close_http_sessions()
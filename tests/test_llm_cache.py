@@ -0,0 +1,102 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.utils import llm
+from gpt_researcher.utils.llm import create_chat_completion
+from gpt_researcher.utils.llm_cache import LLMResponseCache, get_llm_cache
+
+MESSAGES = [{"role": "user", "content": "Pick an agent"}]
+
+
+class StubProvider:
+    """Answers every prompt with the number of requests made so far."""
+
+    def __init__(self):
+        self.requests = 0
+        self.last_usage = None
+
+    async def get_chat_response(self, messages, stream, websocket, **kwargs):
+        self.requests += 1
+        return f"response {self.requests}"
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    provider = StubProvider()
+    monkeypatch.setattr(llm, "get_llm", lambda llm_provider, **kwargs: provider)
+    # Cost estimates count tokens with the tiktoken encodings, which are downloaded on first use
+    async def estimate_cost(prompt, response, usage=None):
+        return 0.5
+
+    monkeypatch.setattr(llm, "aestimate_llm_cost", estimate_cost)
+    return provider
+
+
+async def complete(cache, **kwargs):
+    return await create_chat_completion(MESSAGES, model="gpt-4o-mini", llm_provider="openai", cache=cache, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_served_from_the_cache(provider):
+    cache = LLMResponseCache()
+    costs = []
+
+    def add_costs(cost, cache_hit=False):
+        costs.append((cost, cache_hit))
+
+    assert await complete(cache, cost_callback=add_costs) == "response 1"
+    assert await complete(cache, cost_callback=add_costs) == "response 1"
+    assert await complete(cache, temperature=0.0, cost_callback=add_costs) == "response 2"
+
+    assert provider.requests == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert costs == [(0.5, False), (0.5, True), (0.5, False)]
+
+
+@pytest.mark.asyncio
+async def test_cost_callbacks_without_cache_hit_are_not_called_on_hits(provider):
+    cache = LLMResponseCache()
+    costs = []
+
+    await complete(cache, cost_callback=costs.append)
+    await complete(cache, cost_callback=costs.append)
+
+    assert provider.requests == 1
+    assert costs == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_streamed_responses_bypass_the_cache(provider):
+    cache = LLMResponseCache()
+
+    await complete(cache, stream=True, websocket=object())
+    await complete(cache, stream=True, websocket=object())
+
+    assert provider.requests == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+def test_responses_expire_after_the_ttl(tmp_path, monkeypatch, persistent):
+    cache = LLMResponseCache(ttl=60, path=str(tmp_path / "llm.db") if persistent else None)
+    cache.set("key", "response")
+    assert cache.get("key") == "response"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+
+    assert cache.get("key") is None
+
+
+def test_cache_is_only_used_for_allowed_call_sites(tmp_path):
+    cfg = SimpleNamespace(llm_cache_ttl=60, llm_cache_calls=["sub_queries"], llm_cache_path=str(tmp_path / "llm.db"))
+
+    cache = get_llm_cache(cfg, "sub_queries")
+
+    assert isinstance(cache, LLMResponseCache) and cache.ttl == 60
+    assert get_llm_cache(cfg, "sub_queries") is cache
+    assert get_llm_cache(cfg, "report") is None
+    assert get_llm_cache(SimpleNamespace(**{**vars(cfg), "llm_cache_ttl": 0}), "sub_queries") is None
+    assert get_llm_cache(None, "sub_queries") is None
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from gpt_researcher.llm_provider.generic import base
+from gpt_researcher.llm_provider.generic.base import GenericLLMProvider
+
+
+class StubChatModel:
+    """Chat model without temperature or max_tokens model fields."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.temperature = kwargs.get("temperature")
+
+
+@pytest.fixture
+def created(monkeypatch):
+    created = []
+
+    def from_provider(cls, provider, chat_log=None, verbose=True, **kwargs):
+        created.append(kwargs)
+        return cls(StubChatModel(**kwargs), chat_log, verbose=verbose)
+
+    monkeypatch.setattr(GenericLLMProvider, "from_provider", classmethod(from_provider))
+    base._registry.clear()
+    yield created
+    base._registry.clear()
+
+
+@pytest.mark.asyncio
+async def test_clients_are_reused_within_an_event_loop(created):
+    first = GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini")
+    second = GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini")
+    other = GenericLLMProvider.get_or_create("openai", model="gpt-4o")
+
+    assert first.llm is second.llm
+    assert other.llm is not first.llm
+    assert len(created) == 2
+
+
+def test_clients_are_not_shared_across_event_loops(created):
+    async def get_llm():
+        return GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini").llm
+
+    first, second = asyncio.run(get_llm()), asyncio.run(get_llm())
+
+    assert first is not second
+    assert len(created) == 2
+
+
+def test_clients_created_outside_a_running_loop_are_not_cached(created):
+    first = GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini")
+
+    async def get_llm():
+        return GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini").llm
+
+    assert GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini").llm is not first.llm
+    assert asyncio.run(get_llm()) is not first.llm
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_clients_without_model_fields_are_cached_per_temperature(created):
+    cold = GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini", temperature=0.0)
+    warm = GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini", temperature=0.7)
+
+    assert warm.llm is not cold.llm and warm.llm.kwargs["temperature"] == 0.7
+    assert GenericLLMProvider.get_or_create("openai", model="gpt-4o-mini", temperature=0.7).llm is warm.llm
+    assert len(created) == 2
@@ -0,0 +1,99 @@
+import glob
+import os
+import time
+
+import numpy as np
+import pytest
+
+from gpt_researcher.vector_store.local_index import open_local_index
+
+
+class KeywordEmbeddings:
+    """One dimension per keyword, and a count of every text embedded."""
+
+    keywords = ("alpha", "beta", "gamma")
+
+    def __init__(self):
+        self.embedded = 0
+
+    def _embed(self, text: str) -> list[float]:
+        return [float(text.count(keyword)) + 0.01 for keyword in self.keywords]
+
+    async def aembed_documents(self, texts):
+        self.embedded += len(texts)
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text):
+        return self._embed(text)
+
+
+def page(name: str, chunks: int = 1) -> dict:
+    # Each ~900 character paragraph is one chunk
+    content = "\n\n".join(f"{name} {i} " + "x" * 900 for i in range(chunks))
+    return {"url": f"https://{name}.test", "title": name, "raw_content": content}
+
+
+async def top_source(index, query: str) -> str:
+    return (await index.asearch(query, k=1, threshold=None))[0].metadata["source"]
+
+
+@pytest.mark.asyncio
+async def test_pages_are_embedded_once_and_reopened_memory_mapped(tmp_path):
+    embeddings = KeywordEmbeddings()
+    index = open_local_index(str(tmp_path), embeddings, "model")
+
+    assert len(await index.aupdate_pages([page("alpha"), page("beta", chunks=2)])) == 2
+    assert await index.aupdate_pages([page("alpha"), page("beta", chunks=2)]) == []
+    assert embeddings.embedded == 3
+
+    reopened = open_local_index(str(tmp_path), KeywordEmbeddings(), "model")
+    assert isinstance(reopened.matrix, np.memmap)
+    assert len(reopened) == 3
+    assert await top_source(reopened, "beta") == "https://beta.test"
+    assert await reopened.aupdate_pages([page("alpha"), page("beta", chunks=2)]) == []
+
+
+@pytest.mark.asyncio
+async def test_removed_pages_are_dropped_and_ranges_renumbered(tmp_path):
+    index = open_local_index(str(tmp_path), KeywordEmbeddings(), "model")
+    await index.aupdate_pages([page("alpha", chunks=3), page("beta"), page("gamma", chunks=2)])
+
+    await index.aupdate_pages([page("beta"), page("gamma", chunks=2)])
+
+    assert sorted(index.pages.values()) == [[0, 1], [1, 3]]
+    assert [metadata["source"] for metadata in index.metadatas] == ["https://beta.test", "https://gamma.test"]
+    assert index.chunk_metadata_ids == [0, 1, 1]
+    assert await top_source(index, "gamma") == "https://gamma.test"
+
+    reopened = open_local_index(str(tmp_path), KeywordEmbeddings(), "model")
+    assert reopened.pages == index.pages
+    assert await top_source(reopened, "alpha") != "https://alpha.test"
+
+
+@pytest.mark.asyncio
+async def test_another_embedding_model_rebuilds_the_index(tmp_path):
+    await open_local_index(str(tmp_path), KeywordEmbeddings(), "model").aupdate_pages([page("alpha")])
+    embeddings = KeywordEmbeddings()
+
+    index = open_local_index(str(tmp_path), embeddings, "other-model")
+
+    assert len(index) == 0
+    assert len(await index.aupdate_pages([page("alpha")])) == 1
+    assert embeddings.embedded == 1
+    assert len(open_local_index(str(tmp_path), KeywordEmbeddings(), "model")) == 0
+
+
+@pytest.mark.asyncio
+async def test_only_vector_files_older_than_the_replaced_sidecar_are_deleted(tmp_path):
+    index = open_local_index(str(tmp_path), KeywordEmbeddings(), "model")
+    await index.aupdate_pages([page("alpha")])
+    # Written by a concurrent update that has not replaced the sidecar yet
+    in_progress = tmp_path / "vectors-in-progress.f32"
+    in_progress.write_bytes(b"")
+    future = time.time() + 60
+    os.utime(in_progress, (future, future))
+
+    await index.aupdate_pages([page("alpha"), page("beta")])
+
+    remaining = sorted(os.path.basename(path) for path in glob.glob(str(tmp_path / "vectors-*.f32")))
+    assert remaining == sorted([in_progress.name, index.matrix.filename.rsplit(os.sep, 1)[-1]])
@@ -0,0 +1,144 @@
+import os
+
+import pytest
+
+from gpt_researcher.scraper import Scraper
+from gpt_researcher.scraper.cache import PageCache
+from gpt_researcher.utils.workers import WorkerPool
+
+URL = "https://docs.example.com/page"
+
+
+def page(url: str = URL, text: str = "cached content") -> dict:
+    return {"url": url, "raw_content": f"{text} " * 20, "image_urls": [], "title": "Title"}
+
+
+def age(cache: PageCache, url: str, scraper_name: str, seconds: float) -> None:
+    key = cache.make_key(url, scraper_name)
+    entry = cache._get_entry(key)
+    entry["stored_at"] -= seconds
+    cache._put_entry(key, entry)
+
+
+class StubPageScraper:
+    """
+    Answers 304 to conditional requests when `modified` is False, else serves
+    new content with status `status_code`.
+    """
+
+    modified = False
+    status_code = 200
+    requests = []
+
+    def __init__(self, link, session=None):
+        self.link = link
+        self.request_headers = {}
+        self.response_headers = {}
+        self.status = None
+
+    async def scrape_async(self, worker_pool=None):
+        StubPageScraper.requests.append(dict(self.request_headers))
+        self.response_headers = {"ETag": '"v2"'}
+        if self.request_headers.get("If-None-Match") and not self.modified:
+            self.status = 304
+            return "", [], ""
+        self.status = self.status_code
+        if self.status >= 400:
+            # Retry right away rather than after the host scheduler's backoff
+            self.response_headers["Retry-After"] = "0"
+        return page(self.link, "fresh content")["raw_content"], [], "New title"
+
+
+@pytest.fixture
+def stub_scraper(monkeypatch):
+    StubPageScraper.modified = False
+    StubPageScraper.status_code = 200
+    StubPageScraper.requests = []
+    monkeypatch.setattr(Scraper, "get_scraper", lambda self, link: StubPageScraper)
+    return StubPageScraper
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_their_ttl():
+    cache = PageCache(ttl=60)
+    await cache.set(URL, "BS", page())
+
+    assert (await cache.lookup(URL, "BS"))[0]["raw_content"] == page()["raw_content"]
+    age(cache, URL, "BS", 120)
+    # No validators to revalidate with
+    assert await cache.lookup(URL, "BS") == (None, {})
+
+
+@pytest.mark.asyncio
+async def test_domain_ttls_override_the_default_for_subdomains():
+    cache = PageCache(ttl=60, domain_ttls={"example.com": 3600, "docs.example.com": 10})
+
+    assert cache.ttl_for(URL) == 10
+    assert cache.ttl_for("https://www.example.com/") == 3600
+    assert cache.ttl_for("https://notexample.com/") == 60
+
+    await cache.set(URL, "BS", page())
+    age(cache, URL, "BS", 30)
+    assert (await cache.lookup(URL, "BS"))[0] is None
+
+
+@pytest.mark.asyncio
+async def test_stale_pages_are_revalidated_by_the_scrape_request(stub_scraper):
+    cache = PageCache(ttl=60)
+    await cache.set(URL, stub_scraper.__name__, page(), {"ETag": '"v1"'})
+    age(cache, URL, stub_scraper.__name__, 120)
+    scraper = Scraper([URL], "test-agent", "bs", WorkerPool(2), page_cache=cache)
+
+    result = await scraper.extract_data_from_url(URL, session=None)
+
+    assert result["raw_content"] == page()["raw_content"]
+    assert stub_scraper.requests == [{"If-None-Match": '"v1"'}]
+    assert (cache.revalidated, cache.hits) == (1, 0)
+    # Fresh again after the 304
+    assert (await cache.lookup(URL, stub_scraper.__name__))[0] is not None
+
+
+@pytest.mark.asyncio
+async def test_changed_pages_are_parsed_from_the_revalidation_response(stub_scraper):
+    stub_scraper.modified = True
+    cache = PageCache(ttl=60)
+    await cache.set(URL, stub_scraper.__name__, page(), {"ETag": '"v1"'})
+    age(cache, URL, stub_scraper.__name__, 120)
+    scraper = Scraper([URL], "test-agent", "bs", WorkerPool(2), page_cache=cache)
+
+    result = await scraper.extract_data_from_url(URL, session=None)
+
+    assert result["title"] == "New title"
+    assert len(stub_scraper.requests) == 1
+    cached, _ = await cache.lookup(URL, stub_scraper.__name__)
+    assert cached["title"] == "New title"
+    age(cache, URL, stub_scraper.__name__, 120)
+    assert (await cache.lookup(URL, stub_scraper.__name__))[1] == {"If-None-Match": '"v2"'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [404, 429, 503])
+async def test_error_pages_are_not_cached(stub_scraper, status_code):
+    stub_scraper.status_code = status_code
+    cache = PageCache(ttl=60)
+    scraper = Scraper([URL], "test-agent", "bs", WorkerPool(2), page_cache=cache)
+
+    await scraper.extract_data_from_url(URL, session=None)
+    await scraper.extract_data_from_url(URL, session=None)
+
+    assert len(stub_scraper.requests) == 2
+    assert await cache.lookup(URL, stub_scraper.__name__) == (None, {})
+
+
+@pytest.mark.asyncio
+async def test_on_disk_cache_evicts_least_recently_used_pages(tmp_path):
+    cache = PageCache(ttl=60, max_size=0, path=str(tmp_path / "pages.db"), max_bytes=20_000)
+    urls = [f"https://example.com/{i}" for i in range(50)]
+    for url in urls:
+        # Incompressible content, ~1.3KB per entry
+        await cache.set(url, "BS", {"raw_content": os.urandom(500).hex(), "title": ""})
+
+    assert cache.store.get(cache.make_key(urls[0], "BS")) is None
+    assert (await cache.lookup(urls[-1], "BS"))[0] is not None
+    reopened = PageCache(ttl=60, path=str(tmp_path / "pages.db"))
+    assert (await reopened.lookup(urls[-1], "BS"))[0] is not None
@@ -0,0 +1,69 @@
+import pymupdf
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gpt_researcher.scraper.pymupdf.pymupdf import PyMuPDFScraper, extract_pdf
+from gpt_researcher.utils.http import close_http_sessions
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    doc = pymupdf.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    doc.set_metadata({"title": "Report"})
+    return doc.tobytes()
+
+
+PDF = make_pdf(["a" * 40, "b" * 40, "c" * 40])
+
+
+def test_extract_pdf_stops_at_the_character_cap():
+    text, images, title = extract_pdf(PDF, max_chars=60)
+
+    assert text == "a" * 40 + "\n\n" + "b" * 18
+    assert title == "Report"
+    assert extract_pdf(PDF, max_chars=0)[0] == "\n\n".join(c * 40 for c in "abc")
+
+
+@pytest_asyncio.fixture
+async def pdf_server():
+    async def sized(request):
+        return web.Response(body=PDF, content_type="application/pdf")
+
+    async def streamed(request):
+        # No Content-Length, so the cap is enforced while reading
+        response = web.StreamResponse(headers={"Content-Type": "application/pdf"})
+        await response.prepare(request)
+        for start in range(0, len(PDF), 1024):
+            await response.write(PDF[start:start + 1024])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/sized.pdf", sized)
+    app.router.add_get("/streamed.pdf", streamed)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await close_http_sessions()
+    await server.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/sized.pdf", "/streamed.pdf"])
+async def test_pdfs_over_the_byte_cap_are_skipped(pdf_server, path):
+    url = str(pdf_server.make_url(path))
+
+    assert (await PyMuPDFScraper(url, max_bytes=len(PDF) - 1).scrape_async())[0] == ""
+    assert (await PyMuPDFScraper(url, max_bytes=len(PDF), max_chars=40).scrape_async())[0] == "a" * 40
+
+
+def test_download_timeout_grows_with_the_byte_cap():
+    small = PyMuPDFScraper("https://example.com/a.pdf", max_bytes=1024 * 1024)._timeout()
+    large = PyMuPDFScraper("https://example.com/a.pdf", max_bytes=20 * 1024 * 1024)._timeout()
+
+    assert (small.sock_connect, small.sock_read) == (5, 5)
+    assert small.total < large.total
+    assert PyMuPDFScraper("https://example.com/a.pdf", max_bytes=0)._timeout().total is None
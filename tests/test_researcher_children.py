@@ -0,0 +1,62 @@
+import pytest
+
+from gpt_researcher import GPTResearcher
+
+MCP_CONFIGS = [{"name": "search", "command": "python", "args": ["server.py"]}]
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    # Embedding clients are created but never called
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+def test_children_share_configuration_memory_and_workers():
+    parent = GPTResearcher("parent query", agent="agent", role="role", headers={"x": "1"})
+
+    child = parent.create_child("child query", visited_urls={"https://a.test"})
+
+    assert vars(child.cfg) == vars(parent.cfg)
+    assert child.memory is parent.memory
+    assert child.scraper_manager.worker_pool is parent.scraper_manager.worker_pool
+    assert child.retrievers is parent.retrievers
+    assert child.prompt_family is parent.prompt_family
+    assert (child.agent, child.role, child.headers) == ("agent", "role", {"x": "1"})
+    assert child.query == "child query" and child.visited_urls == {"https://a.test"}
+
+
+def test_children_with_other_headers_get_their_own_retrievers():
+    parent = GPTResearcher("parent query")
+
+    child = parent.create_child("child query", headers={"retrievers": "duckduckgo"})
+
+    assert child.retrievers is not parent.retrievers
+
+
+def test_config_path_cannot_be_combined_with_parent():
+    parent = GPTResearcher("parent query")
+
+    with pytest.raises(ValueError, match="config_path"):
+        parent.create_child("child query", config_path="other.json")
+
+
+def test_children_only_use_mcp_when_asked():
+    parent = GPTResearcher("parent query", mcp_configs=MCP_CONFIGS, mcp_strategy="deep")
+
+    child = parent.create_child("child query")
+    assert (child.mcp_configs, child.mcp_strategy) == (None, "disabled")
+
+    child = parent.create_child("child query", inherit_mcp=True)
+    assert (child.mcp_configs, child.mcp_strategy) == (MCP_CONFIGS, "deep")
+
+
+def test_children_with_their_own_mcp_servers_leave_the_parent_configuration_alone(monkeypatch):
+    monkeypatch.delenv("RETRIEVER", raising=False)
+    parent = GPTResearcher("parent query")
+    retrievers = parent.cfg.retrievers
+
+    child = parent.create_child("child query", mcp_configs=MCP_CONFIGS)
+
+    assert "mcp" in child.cfg.retrievers
+    assert parent.cfg.retrievers == retrievers
+    assert parent.create_child("other child").retrievers is parent.retrievers
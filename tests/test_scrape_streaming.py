@@ -0,0 +1,253 @@
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import pytest
+
+from gpt_researcher.scraper import Scraper
+from gpt_researcher.skills import browser, context_manager
+from gpt_researcher.skills.browser import BrowserManager
+from gpt_researcher.skills.context_manager import ContextManager
+from gpt_researcher.skills.researcher import ResearchConductor
+
+
+def page(url: str, text: str = "relevant content") -> dict:
+    return {"url": url, "raw_content": f"{text} " * 40, "image_urls": [], "title": url}
+
+
+class StubScraper(Scraper):
+    """Scraper whose pages take `delays[url]` seconds, or fail when the delay is None."""
+
+    def __init__(self, delays: dict, **kwargs):
+        super().__init__(list(delays), "test-agent", "bs", worker_pool=None, **kwargs)
+        self.delays = delays
+        self.cancelled = []
+
+    async def extract_data_from_url(self, link, session, priority: int = 0):
+        try:
+            if self.delays[link] is None:
+                return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+            await asyncio.sleep(self.delays[link])
+        except asyncio.CancelledError:
+            self.cancelled.append(link)
+            raise
+        return page(link)
+
+
+class KeywordEmbeddings:
+    """One dimension per keyword, and a record of every batch embedded."""
+
+    keywords = ("relevant", "other")
+
+    def __init__(self):
+        self.batches = []
+
+    def _embed(self, text: str) -> list[float]:
+        return [float(text.count(keyword)) + 0.01 for keyword in self.keywords]
+
+    async def aembed_documents(self, texts):
+        self.batches.append(len(texts))
+        await asyncio.sleep(0.02)
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text):
+        return self._embed(text)
+
+
+def stub_researcher(embeddings=None, **cfg):
+    return SimpleNamespace(
+        verbose=False,
+        websocket=None,
+        kwargs={},
+        cfg=SimpleNamespace(vector_index="flat", **cfg),
+        memory=SimpleNamespace(get_embeddings=lambda: embeddings),
+        prompt_family=SimpleNamespace(pretty_print_docs=lambda docs: "\n".join(d.metadata["source"] for d in docs)),
+        add_costs=lambda cost, cache_hit=False: None,
+        sources=[],
+        add_research_sources=lambda sources: None,
+        get_research_images=lambda: [],
+        add_research_images=lambda images: None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_cost_estimates(monkeypatch):
+    # Cost estimates need the tiktoken encodings, which are downloaded on first use
+    async def estimate(model, docs):
+        return 0.0
+
+    monkeypatch.setattr(context_manager, "aestimate_embedding_cost", estimate)
+
+
+async def paced(pages_with_delays):
+    for delay, item in pages_with_delays:
+        await asyncio.sleep(delay)
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_in_completion_order():
+    scraper = StubScraper({"https://slow.test": 0.05, "https://fast.test": 0.0, "https://empty.test": None})
+
+    urls = [content["url"] async for content in scraper.stream()]
+
+    assert urls == ["https://fast.test", "https://slow.test"]
+
+
+@pytest.mark.asyncio
+async def test_stream_cancels_pending_scrapes_when_closed():
+    scraper = StubScraper({"https://fast.test": 0.0, "https://slow.test": 10})
+
+    async with aclosing(scraper.stream()) as pages:
+        async for content in pages:
+            assert content["url"] == "https://fast.test"
+            break
+    await asyncio.sleep(0)
+
+    assert scraper.cancelled == ["https://slow.test"]
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_at_the_deadline():
+    scraper = StubScraper({"https://slow.test": 10, "https://fast.test": 0.0, "https://medium.test": 0.02}, deadline=0.1)
+
+    urls = [content["url"] async for content in scraper.stream()]
+    await asyncio.sleep(0)
+
+    assert urls == ["https://fast.test", "https://medium.test"]
+    assert scraper.cancelled == ["https://slow.test"]
+
+
+@pytest.mark.asyncio
+async def test_run_returns_pages_scraped_before_the_deadline_in_rank_order():
+    delays = {"https://a.test": 0.05, "https://b.test": 0.0, "https://c.test": 10, "https://d.test": None}
+    scraper = StubScraper(delays, deadline=0.2)
+
+    start = asyncio.get_running_loop().time()
+    contents = await scraper.run()
+    await asyncio.sleep(0)
+
+    assert asyncio.get_running_loop().time() - start < 1
+    assert [content["url"] for content in contents] == ["https://a.test", "https://b.test"]
+    assert scraper.cancelled == ["https://c.test"]
+
+
+@pytest.mark.asyncio
+async def test_run_stops_once_enough_pages_are_scraped():
+    delays = {"https://a.test": 10, "https://b.test": 0.02, "https://c.test": 0.05, "https://d.test": 0.0}
+    scraper = StubScraper(delays, quorum_pages=2)
+
+    contents = await asyncio.wait_for(scraper.run(), timeout=1)
+    await asyncio.sleep(0)
+
+    assert [content["url"] for content in contents] == ["https://b.test", "https://d.test"]
+    assert sorted(scraper.cancelled) == ["https://a.test", "https://c.test"]
+
+
+@pytest.mark.asyncio
+async def test_failed_pages_count_towards_the_quorum_ratio():
+    delays = {"https://a.test": 10, "https://b.test": 0.01, "https://c.test": None, "https://d.test": 10}
+    scraper = StubScraper(delays, quorum_ratio=0.5)
+
+    contents = await asyncio.wait_for(scraper.run(), timeout=1)
+    await asyncio.sleep(0)
+
+    assert [content["url"] for content in contents] == ["https://b.test"]
+    assert sorted(scraper.cancelled) == ["https://a.test", "https://d.test"]
+
+
+@pytest.mark.asyncio
+async def test_run_without_a_deadline_or_quorum_waits_for_all_pages():
+    delays = {"https://a.test": 0.03, "https://b.test": 0.0, "https://c.test": None}
+
+    contents = await StubScraper(delays).run()
+
+    assert [content["url"] for content in contents] == ["https://a.test", "https://b.test"]
+
+
+@pytest.mark.asyncio
+async def test_browse_urls_stream_records_sources_when_stopped_early(monkeypatch):
+    async def stream_urls(urls, cfg, worker_pool):
+        for url in urls:
+            yield page(url)
+
+    monkeypatch.setattr(browser, "stream_urls", stream_urls)
+    researcher = stub_researcher(
+        max_scraper_workers=1, scraper_max_per_host=1, scraper_host_delay=0, scraper_parse_processes=-1
+    )
+    recorded = []
+    researcher.add_research_sources = recorded.extend
+    manager = BrowserManager(researcher)
+
+    async with aclosing(manager.browse_urls_stream(["https://a.test", "https://b.test", "https://c.test"])) as pages:
+        async for content in pages:
+            if content["url"] == "https://b.test":
+                break
+
+    assert [source["url"] for source in recorded] == ["https://a.test", "https://b.test"]
+
+
+@pytest.mark.asyncio
+async def test_pages_scraped_during_an_embedding_are_embedded_together():
+    embeddings = KeywordEmbeddings()
+    manager = ContextManager(stub_researcher(embeddings))
+    urls = [f"https://{name}.test" for name in "abcde"]
+    # b, c and d arrive while a is being embedded, e well after
+    pages = paced(zip([0, 0.005, 0.001, 0.001, 0.1], [page(url) for url in urls]))
+
+    context, scraped = await manager.get_similar_content_by_query_streaming("relevant", pages)
+
+    assert [p["url"] for p in scraped] == urls
+    assert embeddings.batches == [1, 3, 1]
+    assert "https://e.test" in context
+
+
+@pytest.mark.asyncio
+async def test_streaming_stops_once_enough_relevant_chunks_are_found():
+    embeddings = KeywordEmbeddings()
+    manager = ContextManager(stub_researcher(embeddings))
+    closed = []
+
+    async def pages():
+        try:
+            yield page("https://a.test")
+            await asyncio.sleep(0.1)
+            yield page("https://b.test", "other")
+            await asyncio.sleep(10)
+            yield page("https://c.test")
+        finally:
+            closed.append(True)
+
+    context, scraped = await manager.get_similar_content_by_query_streaming("relevant", pages(), target_chunks=1)
+
+    assert [p["url"] for p in scraped] == ["https://a.test"]
+    assert context == "https://a.test"
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_scrape_and_compress_streaming_uses_the_searched_urls():
+    embeddings = KeywordEmbeddings()
+    researcher = stub_researcher(embeddings, streaming_target_chunks=0)
+    researcher.vector_store = None
+    researcher.context_manager = ContextManager(researcher)
+    browsed = []
+
+    async def browse_urls_stream(urls):
+        browsed.extend(urls)
+        for url in urls:
+            yield page(url)
+
+    researcher.scraper_manager = SimpleNamespace(browse_urls_stream=browse_urls_stream)
+    conductor = ResearchConductor(researcher)
+
+    async def search(sub_query, query_domains):
+        return ["https://a.test", "https://b.test"]
+
+    conductor._search_relevant_source_urls = search
+
+    context, scraped = await conductor._scrape_and_compress_streaming("relevant")
+
+    assert browsed == ["https://a.test", "https://b.test"]
+    assert [p["url"] for p in scraped] == browsed
+    assert "https://a.test" in context
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+
+from gpt_researcher.retrievers.cache import SearchCache, cached_search
+
+
+class CountingRetriever:
+    calls = 0
+    lock = threading.Lock()
+
+    def __init__(self, query, query_domains=None):
+        self.query = query
+
+    def search(self, max_results=5):
+        with CountingRetriever.lock:
+            CountingRetriever.calls += 1
+        threading.Event().wait(0.05)
+        return [{"href": f"https://example.com/{i}", "body": self.query} for i in range(max_results)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_are_coalesced():
+    CountingRetriever.calls = 0
+    cache = SearchCache(ttl=60)
+
+    results = await asyncio.gather(*[
+        cached_search(CountingRetriever, "AI  Agents", max_results=3, cache=cache),
+        cached_search(CountingRetriever, "ai agents", max_results=3, cache=cache),
+    ])
+
+    assert CountingRetriever.calls == 1
+    assert results[0] == results[1]
+    assert len(results[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_results_are_keyed_by_domains_and_max_results(tmp_path):
+    CountingRetriever.calls = 0
+    cache = SearchCache(ttl=60, path=str(tmp_path / "search.db"))
+
+    await cached_search(CountingRetriever, "query", max_results=3, cache=cache)
+    await cached_search(CountingRetriever, "query", max_results=3, cache=cache)
+    await cached_search(CountingRetriever, "query", max_results=5, cache=cache)
+    await cached_search(CountingRetriever, "query", ["example.com"], max_results=3, cache=cache)
+    assert CountingRetriever.calls == 3
+
+    # A second process pointing at the same file reuses the stored results
+    other = SearchCache(ttl=60, path=str(tmp_path / "search.db"))
+    await cached_search(CountingRetriever, "query", max_results=3, cache=other)
+    assert CountingRetriever.calls == 3
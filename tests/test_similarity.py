@@ -0,0 +1,25 @@
+import numpy as np
+
+from gpt_researcher.context.similarity import cosine_similarity, normalize, top_k_indices
+
+
+def test_normalize_produces_unit_rows():
+    matrix = normalize([[3.0, 4.0], [0.0, 0.0]])
+    assert matrix.dtype == np.float32
+    assert np.allclose(matrix[0], [0.6, 0.8])
+    assert np.allclose(matrix[1], [0.0, 0.0])
+
+
+def test_top_k_indices_orders_by_score_and_applies_threshold():
+    scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3], dtype=np.float32)
+    assert top_k_indices(scores, k=3, threshold=None).tolist() == [1, 3, 2]
+    assert top_k_indices(scores, k=10, threshold=0.4).tolist() == [1, 3, 2]
+    assert top_k_indices(scores, k=2, threshold=0.8).tolist() == [1]
+
+
+def test_cosine_similarity_matches_dot_product_of_normalized_vectors():
+    docs = normalize([[1.0, 0.0], [1.0, 1.0]])
+    query = normalize([[1.0, 0.0]])
+    scores = cosine_similarity(query, docs)
+    assert scores.shape == (1, 2)
+    assert np.allclose(scores[0], [1.0, np.sqrt(0.5)])
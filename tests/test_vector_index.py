@@ -0,0 +1,107 @@
+import threading
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from gpt_researcher.context import chunk_index
+from gpt_researcher.context.ann import FlatIndex, IVFIndex, create_vector_index
+from gpt_researcher.context.chunk_index import ChunkIndex
+from gpt_researcher.context.similarity import normalize
+from gpt_researcher.vector_store import VectorStoreWrapper, vector_store
+
+
+def clustered(rng, centers, size):
+    return normalize(centers[rng.integers(0, len(centers), size)] + rng.standard_normal((size, centers.shape[1])))
+
+
+def test_ivf_recall_against_flat():
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((50, 32)) * 2
+    matrix, queries = clustered(rng, centers, 5000), clustered(rng, centers, 50)
+
+    index = IVFIndex()
+    index.update(matrix)
+    found = index.search(matrix, queries, 10)
+    exact = FlatIndex().search(matrix, queries, 10)
+
+    recall = np.mean([len(set(a.tolist()) & set(b.tolist())) / 10 for a, b in zip(found, exact)])
+    assert recall >= 0.9
+
+
+def test_ivf_finds_rows_added_after_training():
+    rng = np.random.default_rng(1)
+    centers = rng.standard_normal((20, 16)) * 2
+    matrix = clustered(rng, centers, 2000)
+    index = IVFIndex()
+    index.update(matrix)
+
+    extra = clustered(rng, centers, 10)
+    matrix = np.concatenate([matrix, extra])
+    # Rows not synced yet are scanned exhaustively, synced ones are in their cluster
+    assert index.search(matrix, extra[:1], 1)[0].tolist() == [2000]
+    index.update(matrix)
+    assert index.search(matrix, extra[:1], 1)[0].tolist() == [2000]
+
+
+def test_unknown_index_type_is_flat():
+    assert isinstance(create_vector_index("annoy"), FlatIndex)
+
+
+class TableEmbeddings(Embeddings):
+    """Embeds "doc <i>" as row i of a fixed clustered matrix."""
+
+    def __init__(self, size: int):
+        rng = np.random.default_rng(2)
+        self.vectors = clustered(rng, rng.standard_normal((30, 16)) * 2, size)
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        return self.vectors[int(text.split()[1])].tolist()
+
+
+@pytest.mark.asyncio
+async def test_chunk_index_searches_its_ann_index_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr(chunk_index, "MIN_ANN_SIZE", 100)
+    index = ChunkIndex(TableEmbeddings(2000), index_type="ivf")
+    await index.aadd_pages([{"raw_content": f"doc {i}", "url": f"https://{i}.test"} for i in range(2000)])
+    threads = []
+    search_by_vectors = ChunkIndex.search_by_vectors
+
+    def record_thread(self, *args):
+        threads.append(threading.current_thread())
+        return search_by_vectors(self, *args)
+
+    monkeypatch.setattr(ChunkIndex, "search_by_vectors", record_thread)
+
+    results = await index.asearch_many(["doc 17", "doc 1234"], k=3, threshold=None)
+
+    assert [docs[0].metadata["source"] for docs in results] == ["https://17.test", "https://1234.test"]
+    assert isinstance(index.ann, IVFIndex) and len(index.ann) == 2000
+    assert threads and threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_vector_store_wrapper_uses_the_ann_index_for_in_memory_stores(monkeypatch):
+    monkeypatch.setattr(vector_store, "MIN_ANN_SIZE", 100)
+    store = InMemoryVectorStore(TableEmbeddings(2000))
+    await store.aadd_texts([f"doc {i}" for i in range(2000)], metadatas=[{"source": str(i)} for i in range(2000)])
+    wrapper = VectorStoreWrapper(store, index_type="ivf")
+
+    docs = await wrapper.asimilarity_search("doc 42", k=2, filter=None)
+
+    assert docs[0].page_content == "doc 42" and docs[0].metadata == {"source": "42"}
+    assert len(wrapper._ann) == 2000
+    # Documents added later are indexed on the next search
+    await store.aadd_texts(["doc 1999"], metadatas=[{"source": "again"}])
+    assert len(await wrapper.asimilarity_search("doc 1999", k=2, filter=None)) == 2
+    assert len(wrapper._ann_ids) == 2001
+
+
+def test_flat_index_counts_its_rows():
+    index = FlatIndex()
+    index.update(np.zeros((5, 3), dtype=np.float32))
+    assert len(index) == 5
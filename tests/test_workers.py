@@ -0,0 +1,131 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from gpt_researcher.utils.workers import HostScheduler, _PrioritySemaphore, get_host_key, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("-5") == 0.0
+    assert 55 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_subdomains_share_a_host_key():
+    assert get_host_key("https://docs.python.org/3/") == "python.org"
+    assert get_host_key("https://www.bbc.co.uk/news") == "bbc.co.uk"
+
+
+def test_rate_limiting_backs_off_and_success_recovers():
+    scheduler = HostScheduler(max_per_host=4)
+    url = "https://example.com/page"
+
+    scheduler.report(url, status=429, retry_after=30)
+    state = scheduler.hosts["example.com"]
+    assert (state.limit, state.delay) == (2, 1.0)
+    assert state.next_allowed - time.monotonic() == pytest.approx(30, abs=1)
+
+    scheduler.report(url, status=503)
+    assert (state.limit, state.delay) == (1, 2.0)
+
+    scheduler.report(url, status=200, elapsed=0.1)
+    assert (state.limit, state.delay) == (2, 1.0)
+
+
+def test_retry_after_is_ignored_without_a_rate_limit_status():
+    scheduler = HostScheduler(max_per_host=4)
+
+    scheduler.report("https://example.com/moved", status=301, retry_after=120)
+    scheduler.report("https://example.com/page", status=200, retry_after=120)
+
+    state = scheduler.hosts["example.com"]
+    assert (state.limit, state.delay, state.next_allowed) == (4, 0.0, 0.0)
+
+
+def test_slow_responses_increase_the_delay():
+    scheduler = HostScheduler(max_per_host=4)
+
+    scheduler.report("https://example.com/page", status=200, elapsed=30)
+
+    assert scheduler.hosts["example.com"].delay == 0.5
+
+
+@pytest.mark.asyncio
+async def test_slots_limit_concurrency_per_host():
+    scheduler = HostScheduler(max_per_host=2)
+    running = {"example.com": 0, "other.org": 0}
+    peak = dict(running)
+
+    async def fetch(url):
+        host = get_host_key(url)
+        async with scheduler.slot(url):
+            running[host] += 1
+            peak[host] = max(peak[host], running[host])
+            await asyncio.sleep(0.01)
+            running[host] -= 1
+
+    urls = [f"https://{sub}.example.com/" for sub in ("a", "b", "c", "d")] + ["https://other.org/"] * 3
+    await asyncio.gather(*[fetch(url) for url in urls])
+
+    assert peak == {"example.com": 2, "other.org": 2}
+
+
+async def start_waiters(semaphore, priorities):
+    order = []
+
+    async def wait(name, priority):
+        await semaphore.acquire(priority)
+        order.append(name)
+
+    tasks = {name: asyncio.create_task(wait(name, priority)) for name, priority in priorities}
+    await asyncio.sleep(0)
+    return order, tasks
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_wakes_lowest_priority_first_then_fifo():
+    semaphore = _PrioritySemaphore(1)
+    await semaphore.acquire()
+    order, tasks = await start_waiters(semaphore, [("late", 5), ("first", 0), ("second", 0)])
+
+    for _ in tasks:
+        semaphore.release()
+        await asyncio.sleep(0)
+
+    assert order == ["first", "second", "late"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_are_skipped():
+    semaphore = _PrioritySemaphore(1)
+    await semaphore.acquire()
+    order, tasks = await start_waiters(semaphore, [("cancelled", 0), ("next", 1)])
+
+    tasks["cancelled"].cancel()
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.sleep(0)
+
+    assert order == ["next"]
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_after_being_woken_hands_its_slot_on():
+    semaphore = _PrioritySemaphore(1)
+    await semaphore.acquire()
+    order, tasks = await start_waiters(semaphore, [("woken", 0), ("next", 1)])
+
+    # Wake the first waiter, and cancel it before it gets to run
+    semaphore.release()
+    tasks["woken"].cancel()
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    assert order == ["next"]
+    assert semaphore._value == 0
+    semaphore.release()
+    assert semaphore._value == 1